@@ -1,14 +1,23 @@
+import json
+import os
+
 from core.algorithm import Algorithm
+from core.logger import logger
 
 from algorithms.algorithms_implementations.random_walk import RandomWalkAlgorithm
 from algorithms.algorithms_implementations.random_walk_biased import RandomWalkBiasedAlgorithm
 from algorithms.algorithms_implementations.rrt import RRTAlgorithm
 from algorithms.algorithms_implementations.rrt_biased import RRTBiasedAlgorithm
+from algorithms.algorithms_implementations.rrt_dynamic_domain import DynamicDomainRRTAlgorithm
 from algorithms.algorithms_implementations.rrt_connect import RRTConnectAlgorithm
 from algorithms.algorithms_implementations.rrt_star import RRTStarAlgorithm
 from algorithms.algorithms_implementations.rrt_star_biased import RRTStarBiasedAlgorithm
 from algorithms.algorithms_implementations.prm import PRMAlgorithm
 from algorithms.algorithms_implementations.prm_hybrid import HybridPRMAlgorithm
+from algorithms.algorithms_implementations.prm_bridge import BridgePRMAlgorithm
+
+# Per-map defaults found by test_runner.tuning, {algorithm name: {map name: {parameter: value}}}
+TUNED_PARAMETERS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tuned_parameters.json")
 
 algorithms = [
     {
@@ -19,6 +28,10 @@ algorithms = [
         "name": "PRM-Hybrid",
         "algorithm": HybridPRMAlgorithm
     },
+    {
+        "name": "PRM-Bridge",
+        "algorithm": BridgePRMAlgorithm
+    },
     {
         "name": "RRT-Connect",
         "algorithm": RRTConnectAlgorithm
@@ -31,6 +44,10 @@ algorithms = [
         "name": "RRT - Biased",
         "algorithm": RRTBiasedAlgorithm
     },
+    {
+        "name": "RRT - Dynamic Domain",
+        "algorithm": DynamicDomainRRTAlgorithm
+    },
     {
         "name": "RRT*",
         "algorithm": RRTStarAlgorithm
@@ -50,15 +67,61 @@ algorithms = [
 ]
 
 class AlgorithmManager:
-    def __init__(self):
+    def __init__(self, tuned_parameters_file=TUNED_PARAMETERS_FILE):
         self.algorithms = algorithms
+        self.tuned_parameters_file = tuned_parameters_file
+        self._tuned_parameters = None # Read on first use
 
     def get_algorithm_names(self):
         return [algorithm["name"] for algorithm in self.algorithms]
 
-    def get_algorithm(self, name, map_instance, benchmark_manager) -> Algorithm:
+    def get_algorithm(self, name, map_instance, benchmark_manager, use_tuned_parameters=True) -> Algorithm:
+        """
+        New algorithm of the given name on map_instance, None if there is no such algorithm.
+
+        With use_tuned_parameters the tuned defaults of the algorithm on the
+        map (found by map_instance.name, see get_tuned_parameters) are applied.
+        """
         for algorithm in self.algorithms:
             if algorithm["name"] == name:
-                return algorithm["algorithm"](map = map_instance,
-                                              benchmark_manager = benchmark_manager)  # Instantiate directly
+                instance = algorithm["algorithm"](map = map_instance,
+                                                  benchmark_manager = benchmark_manager)  # Instantiate directly
+                if use_tuned_parameters:
+                    self.apply_parameters(instance, self.get_tuned_parameters(name, map_instance.name))
+                return instance
         return None
+
+    def apply_parameters(self, algorithm, parameters):
+        """
+        Set parameters on an algorithm, skipping the ones it does not have.
+
+        Parameters are named as in TestRunner: step_size, num_samples_excluding_grid,
+        radius_as_step_size_multiplication (neighbour_radius = step_size * it) and goal_bias.
+        """
+        if "step_size" in parameters:
+            algorithm.step_size = parameters["step_size"]
+        if "num_samples_excluding_grid" in parameters and hasattr(algorithm, "num_samples"):
+            algorithm.num_samples = parameters["num_samples_excluding_grid"]
+        if "radius_as_step_size_multiplication" in parameters and hasattr(algorithm, "neighbour_radius"):
+            algorithm.neighbour_radius = algorithm.step_size * parameters["radius_as_step_size_multiplication"]
+        if "goal_bias" in parameters and hasattr(algorithm, "goal_bias"):
+            algorithm.goal_bias = parameters["goal_bias"]
+
+    def get_tuned_parameters(self, name, map_name):
+        """Tuned {parameter: value} of an algorithm on a map, empty if it was never tuned."""
+        if self._tuned_parameters is None:
+            self._tuned_parameters = {}
+            if os.path.exists(self.tuned_parameters_file):
+                try:
+                    with open(self.tuned_parameters_file) as file:
+                        self._tuned_parameters = json.load(file)
+                except ValueError as e:
+                    logger.error(f"Ignoring unreadable tuned parameters {self.tuned_parameters_file}: {e}")
+        return dict(self._tuned_parameters.get(name, {}).get(map_name, {}))
+
+    def save_tuned_parameters(self, name, map_name, parameters):
+        """Store parameters as the defaults of the algorithm on the map."""
+        self.get_tuned_parameters(name, map_name) # Load the current file
+        self._tuned_parameters.setdefault(name, {})[map_name] = dict(parameters)
+        with open(self.tuned_parameters_file, "w") as file:
+            json.dump(self._tuned_parameters, file, indent=2, sort_keys=True)
@@ -1,16 +1,36 @@
-import random
 import heapq
+import math
+import time
+from concurrent.futures import ProcessPoolExecutor
 
 import typing as t
 
-from core.algorithm import Algorithm
+import numpy as np
+
+from core.algorithm import Algorithm, RunOutcome, SOLVED, TIMEOUT, EXHAUSTED
 
 from core.map import Map
 from core.node import GraphNode
+from core.roadmap import CSRRoadmap
+from core.spatial_index import GridIndex
+from core.union_find import DisjointSet
 from benchmarks.benchmark_manager import BenchmarkManager
 
 from core.logger import logger
 
+# How roadmap nodes pick their neighbours:
+# radius      - every node within neighbour_radius (classic PRM)
+# k_nearest   - PRM*, k = e * (1 + 1/d) * log(n) nearest nodes
+# radius_star - PRM*, radius shrinking with the number of nodes
+CONNECTION_STRATEGIES = ("radius", "k_nearest", "radius_star")
+
+# Attributes a query depends on besides the roadmap, set on the batch_query workers
+QUERY_PARAMETERS = ("neighbour_radius", "use_csr", "connection_strategy")
+
+# Batch samplers give up after num_samples * MAX_DRAWS_PER_SAMPLE candidates (points, pairs or bridges),
+# so a map where (almost) nothing is ever accepted ends with fewer samples instead of an endless loop
+MAX_DRAWS_PER_SAMPLE = 1000
+
 class PRMAlgorithm(Algorithm):
     """Probabilistic Road Maps (PRM) algorithm implementation using A* search.
 
@@ -22,15 +42,36 @@ class PRMAlgorithm(Algorithm):
                  map: Map,
                  benchmark_manager: BenchmarkManager = None,
                  num_samples_excluding_grid: int = 500,
-                 radius_as_step_size_multiplication: float = 5):
+                 radius_as_step_size_multiplication: float = 5,
+                 use_csr: bool = False,
+                 incremental: bool = False,
+                 batch_size: int = 50,
+                 max_samples: int = 5000,
+                 connection_strategy: str = "radius"):
         super().__init__(map=map, benchmark_manager=benchmark_manager, architecture="graph")
 
+        if connection_strategy not in CONNECTION_STRATEGIES:
+            raise ValueError(f"Unknown connection strategy '{connection_strategy}', use one of {CONNECTION_STRATEGIES}")
+        if use_csr and incremental:
+            raise ValueError("Incremental mode grows GraphNode edges, it cannot be combined with use_csr")
+
         self.architecture = "graph"
         self.samples = []  # Collision-free roadmap nodes (GraphNode)
         self.neighbour_radius = self.step_size * radius_as_step_size_multiplication # distance for which nodes are considered neighbors
         self.num_samples = num_samples_excluding_grid  # Total number of random samples (can be adjusted)
         self.parent_map = {}  # Used to reconstruct the path
         self.nodes_in_the_grid = 0
+        self.connection_strategy = connection_strategy
+        self.use_csr = use_csr # Store the roadmap as CSR arrays instead of GraphNode edges
+        self.roadmap = None # CSRRoadmap, only used when use_csr is set
+
+        # Incremental mode - grow the roadmap in batches until start and goal are connected
+        self.incremental = incremental
+        self.batch_size = batch_size
+        self.max_samples = max_samples
+        self.sample_limit_reached = False # Warned about max_samples already
+        self.components = DisjointSet()
+        self.node_index = None # GridIndex over self.nodes, new nodes are connected through it
 
         # Add start and goal
         if map.start:
@@ -44,19 +85,29 @@ class PRMAlgorithm(Algorithm):
         - Build roadmap
         - Add start/goal
         - Run A* to find a path
+
+        In incremental mode every step adds one batch of samples instead.
         """
+        if self.incremental:
+            self.densify()
+            self.steps += 1
+            return
+
         if self.steps == 0:
             logger.info(f"Generating grid and additional {self.num_samples} samples")
-            self.generate_default_grid()
-            self.generate_points_on_the_map()
+            with self.phase("sampling"):
+                self.generate_default_grid()
+                self.generate_points_on_the_map()
 
         elif self.steps == 1:
             logger.info("Connecting neighbors")
-            for node in self.samples:
-                self.connect_neighbors(node)
-            self.connect_neighbors(self.start_node)
-            self.connect_neighbors(self.goal_node)
-            self.nodes = self.samples + [self.start_node, self.goal_node]
+            with self.phase("connection"):
+                if self.use_csr:
+                    self.build_csr_roadmap()
+                else:
+                    self.nodes = self.samples + [self.start_node, self.goal_node]
+                    for i, j, cost in self.roadmap_edges([node.get_position() for node in self.nodes]):
+                        self.nodes[i].add_edge(self.nodes[j], cost)
 
         elif self.steps == 2:
             # Benchmark should not take into account the time to generate the roadmap
@@ -64,24 +115,115 @@ class PRMAlgorithm(Algorithm):
                 self.start_benchmark()
             
             logger.info("Running A*")
-            self.a_star()
+            with self.phase("search"):
+                self.a_star()
 
             logger.info("Checking if complete")
             if self.is_complete():
-                self.reconstruct_path()
+                with self.phase("reconstruction"):
+                    self.reconstruct_path()
                 self.finalize_benchmark()
             
         self.steps += 1
 
     def generate_points_on_the_map(self):
         """Generate random valid samples on the map."""
+        self.samples.extend(self.sample_free_points(self.num_samples))
+
+    def sample_free_points(self, count: int) -> t.List[GraphNode]:
+        """Draw up to count collision-free samples, giving up after count * 5 attempts."""
+        points = []
         attempts = 0
-        while len(self.samples) - self.nodes_in_the_grid < self.num_samples and attempts < self.num_samples * 5:
-            x = random.uniform(0, self.map.width)
-            y = random.uniform(0, self.map.height)
+        while len(points) < count and attempts < count * 5:
+            x, y = self.sample_point()
             if not self.is_collision(x, y):
-                self.samples.append(GraphNode(x, y))
+                points.append(GraphNode(x, y))
             attempts += 1
+        return points
+
+    def sample_uniform_batch(self, count: int, batch_size: int, max_draws: int) -> t.Tuple[t.List[float], t.List[float], int]:
+        """Sampling of count collision-free points (see sampling_mode), returns (xs, ys, number of points drawn).
+
+        Stops after max_draws points even if fewer than count were accepted.
+        """
+        xs, ys = [], []
+        drawn = 0
+        while len(xs) < count and drawn < max_draws:
+            size = min(batch_size, max_draws - drawn)
+            x, y = self.sample_points(size)
+            accepted = np.flatnonzero(~self.are_in_collision(x, y))[:count - len(xs)]
+            drawn += int(accepted[-1]) + 1 if len(xs) + len(accepted) == count else size
+            xs.extend(x[accepted].tolist())
+            ys.extend(y[accepted].tolist())
+        return xs, ys, drawn
+
+    def densify(self):
+        """Add one batch of samples and connect only the new nodes.
+
+        Connected components are tracked with a union-find structure, A* runs
+        only once start and goal ended up in the same component.
+        """
+        if self.steps == 0:
+            # Roadmap growth is the search here, so it is part of the benchmark
+            self.start_benchmark()
+            self.components = DisjointSet()
+            self.sample_limit_reached = False
+            self.nodes = [self.start_node, self.goal_node]
+            for node in self.nodes:
+                self.components.add(node)
+            self.build_node_index([self.start_node])
+            self.connect_incrementally(self.goal_node)
+
+        if not self.components.connected(self.start_node, self.goal_node):
+            budget = self.max_samples - len(self.samples)
+            if budget <= 0:
+                if not self.sample_limit_reached:
+                    logger.warning(f"Sample limit {self.max_samples} reached, start and goal are not connected")
+                    self.sample_limit_reached = True
+                return
+
+            with self.phase("sampling"):
+                new_nodes = self.sample_free_points(min(self.batch_size, budget))
+            with self.phase("connection"):
+                for node in new_nodes:
+                    self.components.add(node)
+                    self.connect_incrementally(node)
+                    self.samples.append(node)
+                    self.nodes.append(node)
+
+            logger.info(f"Roadmap has {len(self.samples)} samples and {self.components.component_count()} components")
+
+        if self.components.connected(self.start_node, self.goal_node):
+            with self.phase("search"):
+                self.a_star()
+            if self.is_complete():
+                with self.phase("reconstruction"):
+                    self.reconstruct_path()
+                self.finalize_benchmark()
+
+    def build_node_index(self, nodes: t.List[GraphNode]):
+        """New node_index holding nodes, cells sized for the connection radius (or k) at max_samples nodes."""
+        if self.connection_strategy == "k_nearest":
+            cell_size = math.sqrt(self.map.width * self.map.height * self.connection_k(self.max_samples) / max(self.max_samples, 1))
+        else:
+            cell_size = self.connection_radius(self.max_samples)
+        self.node_index = GridIndex(max(cell_size, 1e-6))
+        for node in nodes:
+            self.node_index.insert(node, node.x, node.y)
+
+    def connect_incrementally(self, node: GraphNode):
+        """Connect a new node to the nodes in node_index, merge the components it joins and add it to the index."""
+        num_nodes = len(self.node_index)
+        if self.connection_strategy == "k_nearest":
+            candidates = self.node_index.k_nearest(node.x, node.y, self.connection_k(num_nodes))
+        else:
+            candidates = self.node_index.query_radius(node.x, node.y, self.connection_radius(num_nodes))
+        for cost, other in candidates:
+            if not self.is_edge_collision(node.x, node.y, other.x, other.y):
+                node.add_edge(other, cost)
+        for neighbour in node.edges:
+            self.components.union(node, neighbour)
+        self.node_index.insert(node, node.x, node.y)
             
     def generate_default_grid(self):
         """Generate a rectangular grid with spacing equal to neighbour_radius."""
@@ -98,28 +240,31 @@ class PRMAlgorithm(Algorithm):
         self.nodes_in_the_grid = len(self.samples)
 
     def connect_neighbors(self, node: GraphNode):
-        """Connects the given node to nearby nodes within neighbour_radius."""
-        all_nodes = self.samples + [self.start_node, self.goal_node]
-        for other in all_nodes:
-            if other is node:
-                # Skip self
-                continue
-            if self.distance(node.get_position(), other.get_position()) <= self.neighbour_radius:
-                if not self.is_edge_collision(node.x, node.y, other.x, other.y):
-                    cost = self.distance(node.get_position(), other.get_position())
-                    node.add_edge(other, cost)
+        """Connects the given node to nearby roadmap nodes (within neighbour_radius by default)."""
+        self.attach_to_roadmap(node, self.samples + [self.start_node, self.goal_node])
 
     def a_star(self):
         """A* algorithm to find the shortest path from start to goal."""
+        self.parent_map = self.search(self.start_node, self.goal_node)
+
+    def search(self, start_node: GraphNode, goal_node: GraphNode) -> t.Dict[GraphNode, GraphNode]:
+        """A* search between two nodes attached to the roadmap.
+
+        Returns:
+            dict: Parent map {node: parent}, goal_node is in it if a path was found.
+        """
+        if self.roadmap is not None:
+            return self.search_roadmap(start_node, goal_node)
+
         open_set = []
-        heapq.heappush(open_set, (0, id(self.start_node), self.start_node))
+        heapq.heappush(open_set, (0, id(start_node), start_node))
 
         g_cost = {}
         f_cost = {}
-        self.parent_map = {}
+        parent_map = {}
 
-        g_cost[self.start_node] = 0
-        f_cost[self.start_node] = self.distance(self.start_node.get_position(), self.goal_node.get_position())
+        g_cost[start_node] = 0
+        f_cost[start_node] = self.distance(start_node.get_position(), goal_node.get_position())
 
         visited = set()
 
@@ -130,8 +275,8 @@ class PRMAlgorithm(Algorithm):
                 continue
             visited.add(current)
 
-            if current == self.goal_node:
-                return
+            if current == goal_node:
+                return parent_map
 
             for neighbour, cost in current.edges.items():
                 if neighbour not in g_cost:
@@ -142,15 +287,144 @@ class PRMAlgorithm(Algorithm):
                 tentative_g = g_cost[current] + cost
                 if tentative_g < g_cost[neighbour]:
                     g_cost[neighbour] = tentative_g
-                    f = tentative_g + self.distance(neighbour.get_position(), self.goal_node.get_position())
+                    f = tentative_g + self.distance(neighbour.get_position(), goal_node.get_position())
                     f_cost[neighbour] = f
-                    self.parent_map[neighbour] = current
+                    parent_map[neighbour] = current
                     heapq.heappush(open_set, (f, id(neighbour), neighbour))
 
+        return parent_map
+
+    def build_csr_roadmap(self):
+        """Connect samples straight into a CSRRoadmap.
+
+        No GraphNode edges are created, every pair is checked only once and
+        the sample GraphNodes are dropped afterwards - nodes are materialised
+        again only for the final path.
+        """
+        positions = [node.get_position() for node in self.samples]
+        self.roadmap = CSRRoadmap.from_edges(positions, self.roadmap_edges(positions))
+        self.samples = []
+        self.nodes = [self.start_node, self.goal_node]
+
+    def roadmap_edges(self, positions: t.List[t.Tuple[float, float]]) -> t.List[t.Tuple[int, int, float]]:
+        """Collision-free edges (i, j, cost) between positions, following connection_strategy.
+
+        Neighbours are looked up in a GridIndex and every pair is checked for
+        collision only once.
+        """
+        num_nodes = len(positions)
+        if num_nodes == 0:
+            return []
+
+        if self.connection_strategy == "k_nearest":
+            k = self.connection_k(num_nodes)
+            # Cells sized so that a cell holds roughly k nodes
+            cell_size = math.sqrt(self.map.width * self.map.height * k / num_nodes)
+        else:
+            radius = self.connection_radius(num_nodes)
+            cell_size = radius
+        index = GridIndex(max(cell_size, 1e-6))
+        for i, (x, y) in enumerate(positions):
+            index.insert(i, x, y)
+
+        edges = []
+        checked = set()
+        for i, (x, y) in enumerate(positions):
+            if self.connection_strategy == "k_nearest":
+                candidates = index.k_nearest(x, y, k + 1) # +1 as the node finds itself
+            else:
+                candidates = index.query_radius(x, y, radius)
+            for cost, j in candidates:
+                if j == i:
+                    continue
+                pair = (i, j) if i < j else (j, i)
+                if pair in checked:
+                    continue
+                checked.add(pair)
+                if not self.is_edge_collision(x, y, positions[j][0], positions[j][1]):
+                    edges.append((pair[0], pair[1], cost))
+        return edges
+
+    def connection_k(self, num_nodes: int) -> int:
+        """PRM* number of neighbours k = e * (1 + 1/d) * log(n), d = 2 for the plane."""
+        return max(1, math.ceil(math.e * (1 + 1 / 2) * math.log(max(num_nodes, 2))))
+
+    def connection_radius(self, num_nodes: int) -> float:
+        """Connection radius, fixed neighbour_radius unless connection_strategy is radius_star.
+
+        PRM* radius is gamma * (log(n) / n)^(1/d) with
+        gamma = 2 * (1 + 1/d)^(1/d) * (free_area / unit_ball_volume)^(1/d), d = 2.
+        """
+        if self.connection_strategy != "radius_star":
+            return self.neighbour_radius
+        num_nodes = max(num_nodes, 2)
+        gamma = 2 * math.sqrt(1 + 1 / 2) * math.sqrt(self.map.free_area() / math.pi)
+        return gamma * math.sqrt(math.log(num_nodes) / num_nodes)
+
+    def roadmap_links(self, position: t.Tuple[float, float]) -> t.List[t.Tuple[int, float]]:
+        """Visible CSR roadmap nodes the position connects to, as (index, cost)."""
+        x, y = position
+        distances = np.hypot(self.roadmap.xs - x, self.roadmap.ys - y)
+        if self.connection_strategy == "k_nearest":
+            k = min(self.connection_k(self.roadmap.num_nodes), self.roadmap.num_nodes)
+            candidates = np.argsort(distances)[:k].tolist()
+        else:
+            candidates = np.flatnonzero(distances <= self.connection_radius(self.roadmap.num_nodes)).tolist()
+
+        links = []
+        for j in candidates:
+            if not self.is_edge_collision(x, y, float(self.roadmap.xs[j]), float(self.roadmap.ys[j])):
+                links.append((j, float(distances[j])))
+        return links
+
+    def search_roadmap(self, start_node: GraphNode, goal_node: GraphNode) -> t.Dict[GraphNode, GraphNode]:
+        """Array based A* over the CSR roadmap, only the path is turned into GraphNodes."""
+        start = start_node.get_position()
+        goal = goal_node.get_position()
+        start_links = self.roadmap_links(start)
+        goal_links = self.roadmap_links(goal)
+
+        direct_cost = self.distance(start, goal)
+        if direct_cost <= self.connection_radius(self.roadmap.num_nodes) and not self.is_edge_collision(start[0], start[1], goal[0], goal[1]):
+            start_links.append((self.roadmap.num_nodes + 1, direct_cost))
+
+        indices = self.roadmap.a_star(start, goal, start_links, goal_links)
+        if not indices:
+            return {}
+
+        path = [start_node] + [GraphNode(*self.roadmap.position(i)) for i in indices[1:-1]] + [goal_node]
+        return {path[i]: path[i - 1] for i in range(1, len(path))}
+
     def is_complete(self):
         """Check if goal node was reached and has a valid parent in parent_map."""
         return self.goal_node in self.parent_map
 
+    def run_until(self, max_iters: int | None = None, max_time: float | None = None, max_nodes: int | None = None) -> RunOutcome:
+        """
+        Step until the path is found or a budget runs out, see Algorithm.run_until.
+
+        The roadmap either connects start and goal after the A* step, or (in
+        incremental mode) once max_samples are used - after that further
+        steps cannot change anything, so the run ends as EXHAUSTED.
+        """
+        clock = time.perf_counter
+        start = clock()
+        deadline = start + max_time if max_time is not None else math.inf
+        max_iters = max_iters if max_iters is not None else math.inf
+        max_nodes = max_nodes if max_nodes is not None else math.inf
+
+        iterations = 0
+        while True:
+            if self.is_complete():
+                return RunOutcome(SOLVED, iterations, clock() - start, len(self.nodes))
+            stuck = self.steps > 0 and len(self.samples) >= self.max_samples if self.incremental else self.steps > 2
+            if stuck or iterations >= max_iters or len(self.nodes) >= max_nodes:
+                return RunOutcome(EXHAUSTED, iterations, clock() - start, len(self.nodes))
+            if clock() >= deadline:
+                return RunOutcome(TIMEOUT, iterations, clock() - start, len(self.nodes))
+            self.step()
+            iterations += 1
+
     def reconstruct_path(self):
         """Reconstructs the shortest path using parent_map from goal to start."""
         self.shortest_path = []
@@ -180,6 +454,9 @@ class PRMAlgorithm(Algorithm):
         We want to end up with clean map and samples. Step should be 0.
         """
         self.samples = []
+        self.roadmap = None
+        self.components = DisjointSet()
+        self.node_index = None
         self.nodes_in_the_grid = 0
         self.parent_map = {}
         self.shortest_path = []
@@ -189,9 +466,30 @@ class PRMAlgorithm(Algorithm):
     def reinintialise_start_and_goal(self, start, goal):
         """Clear only the computed shortest path; preserve roadmap structure."""
         logger.info("Clearing the best path.")
+        # Old start and goal must not stay in the roadmap, otherwise every
+        # query leaves its edges behind and the graph keeps growing.
+        self.detach_from_roadmap(self.start_node)
+        self.detach_from_roadmap(self.goal_node)
+
         self.start_node = GraphNode(start.x, start.y)
         self.goal_node = GraphNode(goal.x, goal.y)
 
+        if self.incremental and self.samples:
+            # Keep growing the same roadmap, only the components must be recomputed
+            self.shortest_path = []
+            self.parent_map = {}
+            self.nodes = self.samples + [self.start_node, self.goal_node]
+            self.components = DisjointSet()
+            for node in self.nodes:
+                self.components.add(node)
+            for node in self.samples:
+                for neighbour in node.edges:
+                    self.components.union(node, neighbour)
+            self.build_node_index(self.samples)
+            self.connect_incrementally(self.start_node)
+            self.connect_incrementally(self.goal_node)
+            return
+
         if self.nodes_in_the_grid == 0:
             # No roadmap is there, just clear everything and start from scratch
             self.clear_nodes()
@@ -199,7 +497,135 @@ class PRMAlgorithm(Algorithm):
             self.shortest_path = []
             self.parent_map = {}
             self.steps = 2 # Move back to the A* step
+            self.nodes = self.samples + [self.start_node, self.goal_node]
             
         # connect start and goal to the roadmap
         self.connect_neighbors(self.start_node)
         self.connect_neighbors(self.goal_node)
+
+    def detach_from_roadmap(self, node: GraphNode | None):
+        """Remove all edges of the node, roadmap neighbours forget about it."""
+        if node is None:
+            return
+        for neighbour in list(node.edges):
+            node.remove_edge(neighbour)
+
+    def query(self, start: t.Tuple[float, float], goal: t.Tuple[float, float]) -> t.Tuple[t.List[t.Tuple[float, float]], float]:
+        """Answer a single start/goal query against the existing roadmap.
+
+        Start and goal are attached to the roadmap only for the time of the
+        search, the roadmap is left exactly as it was before the call.
+
+        Returns:
+            tuple: (path as a list of (x, y), path cost). Empty path and inf if not found.
+        """
+        start_node = GraphNode(*start)
+        goal_node = GraphNode(*goal)
+        try:
+            self.attach_to_roadmap(start_node, self.samples)
+            self.attach_to_roadmap(goal_node, self.samples + [start_node])
+            parent_map = self.search(start_node, goal_node)
+        finally:
+            self.detach_from_roadmap(start_node)
+            self.detach_from_roadmap(goal_node)
+
+        if goal_node not in parent_map:
+            return [], float("inf")
+
+        path = []
+        node = goal_node
+        while node in parent_map:
+            path.append(node.get_position())
+            node = parent_map[node]
+        path.append(start_node.get_position())
+        path.reverse()
+
+        cost = sum(self.distance(path[i - 1], path[i]) for i in range(1, len(path)))
+        return path, cost
+
+    def batch_query(self, pairs: t.List[t.Tuple[t.Tuple[float, float], t.Tuple[float, float]]], workers: int = 1) -> t.List[t.Tuple[t.List[t.Tuple[float, float]], float]]:
+        """Answer many start/goal queries against a single roadmap.
+
+        The roadmap must already be built (steps 0 and 1). With workers > 1
+        the roadmap is shipped once to every worker process and the queries
+        are spread between them.
+
+        Args:
+            pairs: List of ((start_x, start_y), (goal_x, goal_y)).
+            workers: Number of worker processes, 1 runs everything in this process.
+
+        Returns:
+            list: (path, cost) for every pair, in the same order as pairs.
+        """
+        if workers <= 1 or len(pairs) < 2:
+            return [self.query(start, goal) for start, goal in pairs]
+
+        positions, edges = self.export_roadmap()
+        chunksize = max(1, len(pairs) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=_init_query_worker,
+                                 initargs=(type(self), self.map, {name: getattr(self, name) for name in QUERY_PARAMETERS},
+                                           positions, edges)) as executor:
+            return list(executor.map(_run_query_in_worker, pairs, chunksize=chunksize))
+
+    def export_roadmap(self) -> t.Tuple[t.List[t.Tuple[float, float]], t.List[t.Tuple[int, int, float]]]:
+        """Flat copy of the roadmap (samples only), cheap to send to other processes.
+
+        Returns:
+            tuple: (positions, edges) where edges are (i, j, cost) indices into positions.
+        """
+        if self.roadmap is not None:
+            return self.roadmap.positions(), list(self.roadmap.edges())
+
+        index = {node: i for i, node in enumerate(self.samples)}
+        positions = [node.get_position() for node in self.samples]
+        edges = []
+        for i, node in enumerate(self.samples):
+            for neighbour, cost in node.edges.items():
+                j = index.get(neighbour)
+                if j is not None and i < j:
+                    edges.append((i, j, cost))
+        return positions, edges
+
+    def load_roadmap(self, positions: t.List[t.Tuple[float, float]], edges: t.List[t.Tuple[int, int, float]]):
+        """Rebuild the roadmap from the output of export_roadmap."""
+        self.nodes_in_the_grid = len(positions)
+        if self.use_csr:
+            self.roadmap = CSRRoadmap.from_edges(positions, edges)
+            self.samples = []
+            self.nodes = []
+            return
+
+        self.samples = [GraphNode(x, y) for x, y in positions]
+        for i, j, cost in edges:
+            self.samples[i].add_edge(self.samples[j], cost)
+        self.nodes = list(self.samples)
+
+    def attach_to_roadmap(self, node: GraphNode, candidates: t.List[GraphNode]):
+        """Connect the node to visible candidates, following connection_strategy."""
+        # Skip self
+        scored = [(self.distance(node.get_position(), other.get_position()), other) for other in candidates if other is not node]
+        if self.connection_strategy == "k_nearest":
+            scored = heapq.nsmallest(self.connection_k(len(candidates)), scored, key=lambda item: item[0])
+        else:
+            radius = self.connection_radius(len(candidates))
+            scored = [(cost, other) for cost, other in scored if cost <= radius]
+
+        for cost, other in scored:
+            if not self.is_edge_collision(node.x, node.y, other.x, other.y):
+                node.add_edge(other, cost)
+
+
+# Roadmap owned by a batch_query worker process, set once by the initializer.
+_worker_prm = None
+
+def _init_query_worker(algorithm_class, map, parameters, positions, edges):
+    global _worker_prm
+    _worker_prm = algorithm_class(map=map)
+    for name, value in parameters.items():
+        setattr(_worker_prm, name, value)
+    _worker_prm.load_roadmap(positions, edges)
+
+def _run_query_in_worker(pair):
+    start, goal = pair
+    return _worker_prm.query(start, goal)
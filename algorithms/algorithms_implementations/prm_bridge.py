@@ -0,0 +1,89 @@
+import typing as t
+
+import numpy as np
+
+from algorithms.algorithms_implementations.prm import PRMAlgorithm, MAX_DRAWS_PER_SAMPLE
+from core.map import Map
+from core.node import GraphNode
+from benchmarks.benchmark_manager import BenchmarkManager
+
+from core.logger import logger
+
+BRIDGE_RATIO = 0.5 # Part of the samples coming from the bridge test, the rest is uniform
+BRIDGE_SPREAD = 3 # Std deviation of the bridge length
+
+class BridgePRMAlgorithm(PRMAlgorithm):
+    """Probabilistic Road Maps (PRM) with bridge-test sampling for narrow passages.
+
+    Bridge test: pick c1 uniformly and c2 at a normally distributed offset
+    from c1. If both end points collide and the midpoint is free, the
+    midpoint is kept. Such midpoints sit mostly in gaps between obstacles,
+    which is where uniform sampling almost never lands.
+
+    Roadmap construction, connection strategies and search are shared with PRMAlgorithm.
+    """
+
+    def __init__(self,
+                 map: Map,
+                 benchmark_manager: BenchmarkManager = None,
+                 bridge_ratio: float = BRIDGE_RATIO,
+                 bridge_spread: float = BRIDGE_SPREAD,
+                 **kwargs):
+        super().__init__(map=map, benchmark_manager=benchmark_manager, **kwargs)
+        self.bridge_ratio = bridge_ratio
+        self.bridge_spread = bridge_spread
+        self.sampling_stats = {}
+
+    def generate_points_on_the_map(self):
+        """Generate bridge-test samples followed by uniform samples, in NumPy batches."""
+        batch_size = 1024
+        # Bridge acceptance is low by design, but never loop forever on maps without gaps
+        max_draws = max(self.num_samples, 1) * MAX_DRAWS_PER_SAMPLE
+        num_bridge_samples = min(int(self.num_samples * self.bridge_ratio), self.num_samples)
+
+        bridge_xs, bridge_ys, bridge_drawn = self.sample_bridges(num_bridge_samples, batch_size, max_draws)
+        uniform_xs, uniform_ys, uniform_drawn = self.sample_uniform_batch(self.num_samples - len(bridge_xs), batch_size, max_draws)
+
+        for x, y in zip(bridge_xs + uniform_xs, bridge_ys + uniform_ys):
+            self.samples.append(GraphNode(x, y))
+
+        self.sampling_stats = {
+            "bridge_accepted": len(bridge_xs),
+            "bridge_rejected": bridge_drawn - len(bridge_xs),
+            "uniform_accepted": len(uniform_xs),
+            "uniform_rejected": uniform_drawn - len(uniform_xs),
+        }
+        logger.info(f"Bridge sampling accepted {len(bridge_xs)} of {bridge_drawn} bridges, "
+                    f"uniform {len(uniform_xs)} of {uniform_drawn}")
+
+    def sample_bridges(self, count: int, batch_size: int, max_draws: int) -> t.Tuple[t.List[float], t.List[float], int]:
+        """Bridge-test sampling of count points, returns (xs, ys, number of bridges drawn)."""
+        xs, ys = [], []
+        drawn = 0
+        while len(xs) < count and drawn < max_draws:
+            size = min(batch_size, max_draws - drawn)
+            c1_x = self.rng.uniform_array(0, self.map.width, size)
+            c1_y = self.rng.uniform_array(0, self.map.height, size)
+            c2_x = c1_x + self.rng.normal_array(0, self.bridge_spread, size)
+            c2_y = c1_y + self.rng.normal_array(0, self.bridge_spread, size)
+            mid_x = (c1_x + c2_x) / 2
+            mid_y = (c1_y + c2_y) / 2
+
+            # Both end points in an obstacle, midpoint free
+            bridge = self.are_in_obstacle(c1_x, c1_y) & self.are_in_obstacle(c2_x, c2_y)
+            bridge &= ~self.are_in_collision(mid_x, mid_y)
+
+            accepted = np.flatnonzero(bridge)[:count - len(xs)]
+            drawn += int(accepted[-1]) + 1 if len(xs) + len(accepted) == count else size
+            xs.extend(mid_x[accepted].tolist())
+            ys.extend(mid_y[accepted].tolist())
+        return xs, ys, drawn
+
+    def are_in_obstacle(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Like are_in_collision, but points outside the map are not in an obstacle.
+
+        Otherwise every free point next to the map border would pass the
+        bridge test, with the end point beyond the border as one of its walls.
+        """
+        inside_map = (xs >= 0) & (xs <= self.map.width) & (ys >= 0) & (ys <= self.map.height)
+        return inside_map & self.are_in_collision(xs, ys)
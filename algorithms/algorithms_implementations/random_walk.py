@@ -1,4 +1,3 @@
-import random
 import math
 from core.algorithm import Algorithm
 from core.node import TreeNode
@@ -22,7 +21,8 @@ class RandomWalkAlgorithm(Algorithm):
             if self.map.goal and self.get_nearest_node((self.map.goal.x, self.map.goal.y)) not in self.nodes:
                 goal_node = TreeNode(self.map.goal.x, self.map.goal.y)
                 self.nodes.append(goal_node)
-                self.reconstruct_path()
+                with self.phase("reconstruction"):
+                    self.reconstruct_path()
                 self.finalize_benchmark()
             return
 
@@ -30,8 +30,8 @@ class RandomWalkAlgorithm(Algorithm):
             return
 
         last_node = self.nodes[-1]
-        new_x = last_node.x + random.uniform(-self.step_size, self.step_size)
-        new_y = last_node.y + random.uniform(-self.step_size, self.step_size)
+        new_x = last_node.x + self.rng.uniform(-self.step_size, self.step_size)
+        new_y = last_node.y + self.rng.uniform(-self.step_size, self.step_size)
 
         new_x = max(0, min(self.map.width, new_x))
         new_y = max(0, min(self.map.height, new_y))
@@ -44,5 +44,6 @@ class RandomWalkAlgorithm(Algorithm):
 
             if self.is_complete():
                 goal_node = TreeNode(self.map.goal.x, self.map.goal.y)
-                self.reconstruct_path()
+                with self.phase("reconstruction"):
+                    self.reconstruct_path()
                 self.finalize_benchmark()
@@ -1,4 +1,3 @@
-import random
 import math
 from core.algorithm import Algorithm
 from core.node import TreeNode
@@ -9,6 +8,7 @@ class RandomWalkBiasedAlgorithm(Algorithm):
     def __init__(self, map, benchmark_manager=None):
         super().__init__(map = map,
                          benchmark_manager = benchmark_manager)        
+        self.goal_bias = BIAS # Probability of stepping straight towards the goal
         if map.start:
             start_node = TreeNode(map.start.x, map.start.y)
             goal_node = TreeNode(map.goal.x, map.goal.y)
@@ -23,15 +23,15 @@ class RandomWalkBiasedAlgorithm(Algorithm):
         last_node = self.nodes[-1]
 
         # Introduce bias, from time to time, move towards the goal
-        if random.random() < BIAS and self.map.goal:
+        if self.rng.random() < self.goal_bias and self.map.goal:
             vector = (self.map.goal.x - last_node.x, self.map.goal.y - last_node.y)
             dir_x = vector[0] / math.sqrt(vector[0]**2 + vector[1]**2)
             dir_y = vector[1] / math.sqrt(vector[0]**2 + vector[1]**2)
             new_x = last_node.x + dir_x * self.step_size
             new_y = last_node.y + dir_y * self.step_size
         else:
-            new_x = last_node.x + random.uniform(-self.step_size, self.step_size)
-            new_y = last_node.y + random.uniform(-self.step_size, self.step_size)
+            new_x = last_node.x + self.rng.uniform(-self.step_size, self.step_size)
+            new_y = last_node.y + self.rng.uniform(-self.step_size, self.step_size)
 
         new_x = max(0, min(self.map.width, new_x))
         new_y = max(0, min(self.map.height, new_y))
@@ -43,5 +43,6 @@ class RandomWalkBiasedAlgorithm(Algorithm):
             self.steps += 1
 
             if self.is_complete():
-                self.reconstruct_path()
+                with self.phase("reconstruction"):
+                    self.reconstruct_path()
                 self.finalize_benchmark()
@@ -1,4 +1,3 @@
-import random
 import math
 from core.algorithm import Algorithm
 from core.node import TreeNode
@@ -36,11 +35,12 @@ class RRTAlgorithm(Algorithm):
                 self.steps += 1
 
                 if self.is_complete():
-                    self.reconstruct_path()
+                    with self.phase("reconstruction"):
+                        self.reconstruct_path()
                     self.finalize_benchmark()
 
     def get_random_sample(self):
-        return (random.uniform(0, self.map.width), random.uniform(0, self.map.height))
+        return self.sample_point()
 
     def extend_toward(self, from_node, to_position):
         dist = self.distance(from_node.get_position(), to_position)
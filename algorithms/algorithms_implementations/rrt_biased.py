@@ -1,4 +1,3 @@
-import random
 import math
 from core.algorithm import Algorithm
 from core.node import TreeNode
@@ -9,6 +8,7 @@ class RRTBiasedAlgorithm(Algorithm):
     def __init__(self, map, benchmark_manager=None):
         super().__init__(map = map,
                          benchmark_manager = benchmark_manager)
+        self.goal_bias = BIAS # Probability of sampling the goal
         if map.start:
             # Directly reference TreeNode attributes
             start_node = TreeNode(map.start.x, map.start.y)
@@ -37,14 +37,15 @@ class RRTBiasedAlgorithm(Algorithm):
                 self.steps += 1
 
                 if self.is_complete():
-                    self.reconstruct_path()
+                    with self.phase("reconstruction"):
+                        self.reconstruct_path()
                     self.finalize_benchmark()
 
     def get_random_sample(self):
-        if self.map.goal and random.random() < BIAS:
+        if self.map.goal and self.rng.random() < self.goal_bias:
             return (self.map.goal.x, self.map.goal.y)
         else:
-            return (random.uniform(0, self.map.width), random.uniform(0, self.map.height))
+            return self.sample_point()
 
     def extend_toward(self, from_node, to_position):
         dist = self.distance(from_node.get_position(), to_position)
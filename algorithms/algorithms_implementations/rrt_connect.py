@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import random
 import math
 import typing as t
 from core.algorithm import Algorithm
@@ -83,7 +82,8 @@ class RRTConnectAlgorithm(Algorithm):
                     if can_connect:
                         self.redirect_goal_tree_and_connect(new_node_active, node_to_which_i_can_connect)
                         # self.reverse_tree_path(self.tree_start, self.tree_goal, new_node_active, self.get_nearest_node_in_tree(new_node_active.get_position(), passive_tree))
-                        self.reconstruct_path()
+                        with self.phase("reconstruction"):
+                            self.reconstruct_path()
                         self.finalize_benchmark()
             else:
                 # Swap active and passive trees for the next iteration
@@ -93,7 +93,7 @@ class RRTConnectAlgorithm(Algorithm):
 
     def get_random_sample(self):
         """Generate a random sample within the map boundaries."""
-        return (random.uniform(0, self.map.width), random.uniform(0, self.map.height))
+        return self.sample_point()
 
     def extend_toward(self, from_node, to_position):
         """Extend from a node toward a target position, respecting the step size."""
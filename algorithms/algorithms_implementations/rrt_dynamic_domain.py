@@ -0,0 +1,106 @@
+import math
+from core.node import TreeNode
+from algorithms.algorithms_implementations.rrt import RRTAlgorithm
+
+DOMAIN_RADIUS = 10 # Sampling radius (in step sizes) given to a node after its first failed extension
+DOMAIN_ALPHA = 0.1 # Relative growth / shrink of the sampling radius after success / failure
+MIN_STEP = 1 # Step length bounds, in step sizes
+MAX_STEP = 3
+
+class DynamicDomainRRTAlgorithm(RRTAlgorithm):
+    """Dynamic-domain RRT with clearance based step length.
+
+    Every node keeps a sampling radius. It is unbounded until an extension
+    from the node collides, then it is set to DOMAIN_RADIUS step sizes and
+    shrinks by DOMAIN_ALPHA on every further failure (grows on success).
+    Samples farther from their nearest node than its radius are dropped
+    before any collision check, so nodes facing a wall stop pulling the
+    tree into it.
+
+    The step length follows the clearance of the node being extended
+    (between MIN_STEP and MAX_STEP step sizes). A step shorter than the
+    clearance cannot collide, so it is accepted without collision checks.
+    """
+
+    def __init__(self,
+                 map,
+                 benchmark_manager=None,
+                 domain_radius: float = DOMAIN_RADIUS,
+                 domain_alpha: float = DOMAIN_ALPHA,
+                 min_step: float = MIN_STEP,
+                 max_step: float = MAX_STEP):
+        super().__init__(map=map, benchmark_manager=benchmark_manager)
+        self.domain_radius = domain_radius
+        self.domain_alpha = domain_alpha
+        self.min_step = min_step
+        self.max_step = max_step
+        self.node_radius = {} # {node: sampling radius}, nodes without an entry are unbounded
+        self.node_clearance = {} # {node: clearance}, computed once per node
+        self.sampling_stats = {"samples": 0, "domain_rejected": 0, "collision_checks": 0, "accepted": 0}
+
+    def step(self):
+        if self.start_time is None and self.benchmark_manager is not None:
+            self.start_benchmark()
+
+        sample = self.get_random_sample()
+        self.sampling_stats["samples"] += 1
+
+        nearest_node = self.get_nearest_node(sample)
+        if self.distance(nearest_node.get_position(), sample) > self.node_radius.get(nearest_node, math.inf):
+            self.sampling_stats["domain_rejected"] += 1
+            return
+
+        new_node = self.extend_toward(nearest_node, sample)
+        if self.is_extension_free(nearest_node, new_node):
+            self.update_radius(nearest_node, success=True)
+            nearest_node.add_child(new_node)
+            self.nodes.append(new_node)
+            self.steps += 1
+            self.sampling_stats["accepted"] += 1
+
+            if self.is_complete():
+                with self.phase("reconstruction"):
+                    self.reconstruct_path()
+                self.finalize_benchmark()
+        else:
+            self.update_radius(nearest_node, success=False)
+
+    def extend_toward(self, from_node, to_position):
+        step = min(max(self.node_clearance_of(from_node), self.min_step * self.step_size), self.max_step * self.step_size)
+        dist = self.distance(from_node.get_position(), to_position)
+        if dist < step:
+            return TreeNode(to_position[0], to_position[1], from_node)
+        theta = math.atan2(to_position[1] - from_node.y, to_position[0] - from_node.x)
+        return TreeNode(from_node.x + step * math.cos(theta), from_node.y + step * math.sin(theta), from_node)
+
+    def is_extension_free(self, from_node, new_node) -> bool:
+        """Collision check of the new edge, skipped when it lies inside the clearance of from_node."""
+        if self.distance(from_node.get_position(), new_node.get_position()) < self.node_clearance_of(from_node):
+            return True
+        self.sampling_stats["collision_checks"] += 1
+        if self.is_collision(new_node.x, new_node.y):
+            return False
+        self.sampling_stats["collision_checks"] += 1
+        return not self.is_edge_collision(from_node.x, from_node.y, new_node.x, new_node.y)
+
+    def node_clearance_of(self, node) -> float:
+        if node not in self.node_clearance:
+            self.node_clearance[node] = self.clearance(node.x, node.y)
+        return self.node_clearance[node]
+
+    def update_radius(self, node, success: bool):
+        radius = self.node_radius.get(node)
+        if success:
+            if radius is not None:
+                self.node_radius[node] = radius * (1 + self.domain_alpha)
+        elif radius is None:
+            self.node_radius[node] = self.domain_radius * self.step_size
+        else:
+            # Never below one step, the node must stay extendable
+            self.node_radius[node] = max(radius * (1 - self.domain_alpha), self.step_size)
+
+    def clear_nodes(self):
+        super().clear_nodes()
+        self.node_radius = {}
+        self.node_clearance = {}
+        self.sampling_stats = {"samples": 0, "domain_rejected": 0, "collision_checks": 0, "accepted": 0}
@@ -1,4 +1,3 @@
-import random
 import math
 
 import typing as t
@@ -11,6 +10,7 @@ from benchmarks.benchmark_manager import BenchmarkManager
 class RRTStarAlgorithm(Algorithm):
     def __init__(self, map: Map, benchmark_manager: BenchmarkManager = None):
         super().__init__(map = map,benchmark_manager = benchmark_manager)
+        self.goal_bias = 0.2 # Probability of sampling the goal
         if map.start:
             # Directly reference Node attributes
             start_node = TreeNode(map.start.x, map.start.y)
@@ -43,14 +43,15 @@ class RRTStarAlgorithm(Algorithm):
                     self.rewire_tree(new_node)
 
                 if self.is_complete():
-                    self.reconstruct_path()
+                    with self.phase("reconstruction"):
+                        self.reconstruct_path()
                     self.finalize_benchmark()
 
     def get_random_sample(self):
-        if self.map.goal and random.random() < 0.2:
+        if self.map.goal and self.rng.random() < self.goal_bias:
             return (self.map.goal.x, self.map.goal.y)
         else:
-            return (random.uniform(0, self.map.width), random.uniform(0, self.map.height))
+            return self.sample_point()
 
     def extend_toward(self, from_node: TreeNode, to_position: t.Tuple):
         dist = self.distance(from_node.get_position(), to_position)
@@ -1,20 +1,75 @@
+import math
+from collections import deque
+
 from core.logger import logger
 
-class BenchmarkManager:
+# Metrics of BenchmarkResult aggregated per algorithm-map pair
+STATS_METRICS = ("execution_time", "total_time", "path_length", "steps")
+
+class RunningStats:
+    """Mean and variance of a stream of values (Welford's algorithm), O(1) memory."""
+
+    __slots__ = ("count", "mean", "_m2", "min", "max")
+
     def __init__(self):
-        self.results = []
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0 # Sum of squared differences from the mean
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    @property
+    def variance(self) -> float:
+        """Sample variance, NaN for fewer than two values (like pandas var)."""
+        return self._m2 / (self.count - 1) if self.count > 1 else math.nan
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+    def __str__(self):
+        return f"mean={self.mean:.4f}, std={self.std:.4f}, n={self.count}"
+
+class BenchmarkManager:
+    def __init__(self, max_results=None):
+        # Only the last max_results are kept (None keeps all), the statistics cover every result
+        self.results = deque(maxlen=max_results)
+        self.stats = {} # {(algorithm_name, map_name): {metric: RunningStats}}
 
     def add_result(self, result):
         self.results.append(result)
+        pair_stats = self.stats.setdefault((result.algorithm_name, result.map_name),
+                                           {metric: RunningStats() for metric in STATS_METRICS})
+        for metric in STATS_METRICS:
+            value = getattr(result, metric)
+            if value is not None and math.isfinite(value):
+                pair_stats[metric].add(value)
+
+    def get_stats(self, algorithm_name, map_name=None):
+        """{metric: RunningStats} of an algorithm-map pair, None if it has no results."""
+        return self.stats.get((algorithm_name, map_name))
 
     def print_results(self):
         for result in self.results:
             logger.info(result)
 
+    def print_stats(self):
+        for (algorithm_name, map_name), pair_stats in self.stats.items():
+            logger.info(f"{algorithm_name} on {map_name}: " + ", ".join(f"{metric} {stats}" for metric, stats in pair_stats.items()))
+
     def get_last_result(self):
         if not self.results:
             return None
         return self.results[-1]
 
     def clear_results(self):
-        self.results = []
\ No newline at end of file
+        self.results.clear()
+        self.stats = {}
@@ -1,4 +1,16 @@
+import numpy as np
+
 class BenchmarkResult:
+    """Outcome of a single run.
+
+    Only plain values are kept - start, goal and path are stored as
+    coordinates, not as the planner nodes, which would keep the whole
+    tree or roadmap alive through parent / children / edges.
+    """
+
+    __slots__ = ("algorithm_name", "map_name", "steps", "execution_time", "start_point", "goal_point", "step_size",
+                 "path_length", "path", "total_time", "cpu_time", "phase_times", "peak_memory")
+
     def __init__(self,
                  algorithm_name,
                  steps,
@@ -7,18 +19,36 @@ class BenchmarkResult:
                  goal_point,
                  step_size,
                  path_length,
-                 shortest_path):
+                 shortest_path,
+                 total_time=None,
+                 cpu_time=None,
+                 phase_times=None,
+                 peak_memory=None,
+                 map_name=None):
         self.algorithm_name = algorithm_name
+        self.map_name = map_name
         self.steps = steps
         self.execution_time = execution_time
-        self.start_point = start_point
-        self.goal_point = goal_point
+        self.start_point = self.as_point(start_point) # (x, y)
+        self.goal_point = self.as_point(goal_point) # (x, y)
         self.step_size = step_size
         self.path_length = path_length
-        self.path = shortest_path # List of points
+        self.path = np.array([self.as_point(node) for node in shortest_path], dtype=np.float64).reshape(-1, 2) # (points, 2) array
+        self.total_time = total_time if total_time is not None else execution_time # End to end, including e.g. PRM roadmap construction
+        self.cpu_time = cpu_time # process_time of the whole run
+        self.phase_times = phase_times or {} # {phase: seconds}, see core.algorithm.PHASES
+        self.peak_memory = peak_memory # Peak traced bytes, None when tracemalloc was not running
 
+    @staticmethod
+    def as_point(point):
+        """(x, y) of a node, or of anything indexable like a tuple."""
+        if point is None:
+            return None
+        if hasattr(point, "x"):
+            return (float(point.x), float(point.y))
+        return (float(point[0]), float(point[1]))
 
     def __str__(self):
         # List of nodes:
-        # nodes = [f"({n.x:.2f}, {n.y:.2f})" for n in self.path]
+        # nodes = [f"({x:.2f}, {y:.2f})" for x, y in self.path]
         return f"{self.algorithm_name}: Length={self.path_length:.2f}, Steps={self.steps}, Time={self.execution_time:.4f}s"#, Nodes={nodes}"
@@ -0,0 +1,187 @@
+import itertools
+import json
+import platform
+import statistics
+import timeit
+import typing as t
+
+import numpy as np
+
+from core.logger import logger
+from core.map import Map
+from core.node import TreeNode, GraphNode
+from core.spatial_index import GridIndex
+from algorithms.algorithms_implementations.rrt_star import RRTStarAlgorithm
+from algorithms.algorithms_implementations.prm import PRMAlgorithm
+from maps.maps_manager import MapsManager
+
+DEFAULT_NODE_COUNTS = (100, 1000, 5000)
+DEFAULT_OBSTACLE_COUNTS = (10, 100, 1000) # Synthetic maps, on top of the bundled ones
+SYNTHETIC_MAP_SIZE = 1000.0
+QUERY_COUNT = 256 # Different queries cycled through, so a single cached answer cannot skew a timing
+NEIGHBOURS = 10 # Expected roadmap neighbours per node, connection radius is scaled to keep it
+
+# Microbenchmark name -> setup(map, node_count, rng) returning the operation to time.
+# Every call of the operation is one call of the primitive.
+MICROBENCHMARKS = {}
+# Microbenchmarks whose cost depends on the number of nodes, the others run once per map
+NODE_SCALED = ("get_nearest_node", "get_near_nodes", "connect_neighbors", "a_star")
+
+def microbenchmark(name: str):
+    def register(setup):
+        MICROBENCHMARKS[name] = setup
+        return setup
+    return register
+
+def synthetic_map(obstacle_count: int, size: float = SYNTHETIC_MAP_SIZE, seed: int = 0) -> Map:
+    """size x size map with obstacle_count random rectangles, start and goal in opposite corners."""
+    rng = np.random.default_rng(seed)
+    map = Map(size, size, name=f"Synthetic {obstacle_count} obstacles")
+    corner = size * 0.05
+    for _ in range(obstacle_count):
+        w, h = rng.uniform(size * 0.005, size * 0.03, 2)
+        x, y = rng.uniform(corner, size - corner - w), rng.uniform(corner, size - corner - h)
+        map.add_obstacle(float(x), float(y), float(w), float(h))
+    map.set_start(corner / 2, corner / 2)
+    map.set_goal(size - corner / 2, size - corner / 2)
+    return map
+
+def bundled_map(name: str) -> Map:
+    map_config = MapsManager().get_map(name)
+    if map_config is None:
+        raise ValueError(f"Unknown map '{name}'")
+    map = Map(map_config.width, map_config.height, name=name)
+    for obs in map_config.obstacles:
+        map.add_obstacle(*obs)
+    map.set_start(*map_config.default_start)
+    map.set_goal(*map_config.default_goal)
+    return map
+
+def free_points(algorithm, count: int, rng: np.random.Generator) -> t.List[t.Tuple[float, float]]:
+    """count collision-free points of the algorithm map."""
+    points = []
+    while len(points) < count:
+        xs = rng.uniform(0, algorithm.map.width, count)
+        ys = rng.uniform(0, algorithm.map.height, count)
+        free = ~algorithm.are_in_collision(xs, ys)
+        points.extend(zip(xs[free].tolist(), ys[free].tolist()))
+    return points[:count]
+
+def connection_radius(map: Map, node_count: int) -> float:
+    """Radius giving about NEIGHBOURS neighbours per node."""
+    return float(np.sqrt(map.width * map.height * NEIGHBOURS / (np.pi * node_count)))
+
+@microbenchmark("is_collision")
+def setup_is_collision(map, node_count, rng):
+    algorithm = RRTStarAlgorithm(map)
+    # Mix of free and blocked points, as drawn by the planners
+    queries = itertools.cycle(zip(rng.uniform(0, map.width, QUERY_COUNT).tolist(), rng.uniform(0, map.height, QUERY_COUNT).tolist()))
+    return lambda: algorithm.is_collision(*next(queries))
+
+@microbenchmark("is_edge_collision")
+def setup_is_edge_collision(map, node_count, rng):
+    algorithm = RRTStarAlgorithm(map)
+    algorithm.step_size = min(map.width, map.height) * 0.05
+    # Edges of step_size from free points, like a tree extension
+    angles = rng.uniform(0, 2 * np.pi, QUERY_COUNT)
+    queries = itertools.cycle([(x, y, x + algorithm.step_size * np.cos(angle), y + algorithm.step_size * np.sin(angle))
+                               for (x, y), angle in zip(free_points(algorithm, QUERY_COUNT, rng), angles.tolist())])
+    return lambda: algorithm.is_edge_collision(*next(queries))
+
+@microbenchmark("get_nearest_node")
+def setup_get_nearest_node(map, node_count, rng):
+    algorithm = RRTStarAlgorithm(map)
+    algorithm.nodes = [TreeNode(x, y) for x, y in free_points(algorithm, node_count, rng)]
+    queries = itertools.cycle(zip(rng.uniform(0, map.width, QUERY_COUNT).tolist(), rng.uniform(0, map.height, QUERY_COUNT).tolist()))
+    return lambda: algorithm.get_nearest_node(next(queries))
+
+@microbenchmark("get_near_nodes")
+def setup_get_near_nodes(map, node_count, rng):
+    algorithm = RRTStarAlgorithm(map)
+    algorithm.nodes = [TreeNode(x, y) for x, y in free_points(algorithm, node_count, rng)]
+    radius = connection_radius(map, node_count)
+    queries = itertools.cycle(algorithm.nodes[:QUERY_COUNT])
+    return lambda: algorithm.get_near_nodes(next(queries), radius)
+
+@microbenchmark("connect_neighbors")
+def setup_connect_neighbors(map, node_count, rng):
+    algorithm = PRMAlgorithm(map)
+    algorithm.samples = [GraphNode(x, y) for x, y in free_points(algorithm, node_count, rng)]
+    algorithm.neighbour_radius = connection_radius(map, node_count)
+    # Connecting a node again only overwrites its edges, so the work stays the same every call
+    queries = itertools.cycle([GraphNode(x, y) for x, y in free_points(algorithm, QUERY_COUNT, rng)])
+    return lambda: algorithm.connect_neighbors(next(queries))
+
+@microbenchmark("a_star")
+def setup_a_star(map, node_count, rng):
+    algorithm = PRMAlgorithm(map)
+    positions = free_points(algorithm, node_count, rng)
+    nodes = [GraphNode(x, y) for x, y in positions] + [algorithm.start_node, algorithm.goal_node]
+    # k-nearest graph without collision checks - A* only sees the graph, and building it stays cheap on large maps
+    index = GridIndex(connection_radius(map, len(nodes)))
+    for i, node in enumerate(nodes):
+        index.insert(i, node.x, node.y)
+    for i, node in enumerate(nodes):
+        for cost, j in index.k_nearest(node.x, node.y, NEIGHBOURS + 1):
+            if j != i:
+                node.add_edge(nodes[j], cost)
+    return algorithm.a_star
+
+def time_operation(operation: t.Callable[[], t.Any], repeat: int = 5, min_time: float = 0.2) -> t.Dict[str, float]:
+    """
+    Seconds per call of operation as {"median", "min", "number", "repeat"}.
+
+    The number of calls per repeat is doubled until a repeat takes at least
+    min_time (the calibration also warms the caches), then repeat timings
+    of that many calls are taken.
+    """
+    timer = timeit.Timer(operation)
+    number = 1
+    while timer.timeit(number) < min_time:
+        number *= 2
+    per_call = [elapsed / number for elapsed in timer.repeat(repeat, number)]
+    return {"median": statistics.median(per_call), "min": min(per_call), "number": number, "repeat": repeat}
+
+def run_microbenchmarks(benchmarks: t.Optional[t.Sequence[str]] = None,
+                        maps: t.Optional[t.Sequence[str]] = None,
+                        node_counts: t.Sequence[int] = DEFAULT_NODE_COUNTS,
+                        obstacle_counts: t.Sequence[int] = DEFAULT_OBSTACLE_COUNTS,
+                        repeat: int = 5,
+                        min_time: float = 0.2,
+                        seed: int = 0) -> t.Dict[str, t.Any]:
+    """
+    Time every microbenchmark on every map (and node count for NODE_SCALED ones).
+
+    benchmarks and maps default to all of MICROBENCHMARKS and all bundled maps.
+
+    Returns:
+        dict: JSON-ready {"environment": {...}, "results": [{"benchmark", "map", "obstacles", "nodes", "median", "min", "number", "repeat"}]},
+              times in seconds per call, nodes is None for benchmarks that do not depend on it.
+    """
+    benchmarks = list(benchmarks) if benchmarks is not None else list(MICROBENCHMARKS)
+    for name in benchmarks:
+        if name not in MICROBENCHMARKS:
+            raise ValueError(f"Unknown microbenchmark '{name}', use one of {list(MICROBENCHMARKS)}")
+    map_instances = [bundled_map(name) for name in (maps if maps is not None else MapsManager().get_map_names())]
+    map_instances += [synthetic_map(count, seed=seed) for count in obstacle_counts]
+
+    results = []
+    for map in map_instances:
+        for name in benchmarks:
+            for node_count in (node_counts if name in NODE_SCALED else (None,)):
+                # Same problem for every run of the suite
+                rng = np.random.default_rng(seed)
+                operation = MICROBENCHMARKS[name](map, node_count, rng)
+                timing = time_operation(operation, repeat, min_time)
+                logger.info(f"{name} on {map.name}" + (f", {node_count} nodes" if node_count else "") + f": {timing['median'] * 1e6:.2f} us")
+                results.append({"benchmark": name, "map": map.name, "obstacles": len(map.get_obstacles()), "nodes": node_count, **timing})
+
+    return {
+        "environment": {"python": platform.python_version(), "numpy": np.__version__, "machine": platform.machine(), "seed": seed},
+        "results": results,
+    }
+
+def save_results(results: t.Dict[str, t.Any], output_file: str):
+    with open(output_file, "w") as file:
+        json.dump(results, file, indent=2)
+    logger.info(f"Microbenchmark results saved to {output_file}")
@@ -1,14 +1,46 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 import math
 import time
+import tracemalloc
+
+import numpy as np
+
 from core.map import Map
 from core.node import TreeNode, GraphNode
+from core.sampling import FreeSpaceSampler, LowDiscrepancySequence, LOW_DISCREPANCY_MODES, SAMPLING_MODES
+from core.random_stream import RandomStream
 from benchmarks.benchmark_manager import BenchmarkManager
 from benchmarks.benchmark_result import BenchmarkResult
 from core.logger import logger
 
+# Outcomes of Algorithm.run_until
+SOLVED = "solved"
+TIMEOUT = "timeout"
+EXHAUSTED = "exhausted" # Iteration / node budget used up, or the planner cannot make progress anymore
+
+# Phases reported in BenchmarkResult.phase_times. Planners time them with Algorithm.phase,
+# untimed work of a run is counted as search (growing a tree is the search).
+PHASES = ("sampling", "connection", "search", "reconstruction")
+
+class RunOutcome:
+    """Result of Algorithm.run_until."""
+
+    def __init__(self, status: str, iterations: int, elapsed: float, nodes: int):
+        self.status = status
+        self.iterations = iterations # Calls to step() made by this run
+        self.elapsed = elapsed # Wall time of the run in seconds
+        self.nodes = nodes
+
+    @property
+    def solved(self) -> bool:
+        return self.status == SOLVED
+
+    def __str__(self):
+        return f"{self.status} after {self.iterations} iterations, {self.nodes} nodes, {self.elapsed:.4f}s"
+
 class Algorithm(ABC):
     def __init__(self,
                  map: Map,
@@ -20,11 +52,19 @@ class Algorithm(ABC):
         self.steps = 0
         self.step_size = step_size
         self.start_time = None
+        self.run_start = None # perf_counter / process_time at the first work of the run,
+        self.run_cpu_start = None # unlike start_time this is never delayed
+        self.phase_times = {}
         self.benchmark_manager = benchmark_manager
         self.architecture = architecture
         self.shortest_path = [] # store shortest path starting from start node to goal node
         self.start_node = None
         self.goal_node = None
+        self.sampling_mode = "uniform" # One of core.sampling.SAMPLING_MODES
+        self._free_space_sampler = None
+        self.sequence_shift = True # Randomly shift Halton/Sobol sequences, False gives the plain sequence
+        self._sequence = None
+        self.rng = RandomStream() # Unseeded until set_seed is called
 
     @abstractmethod
     def step(self):
@@ -68,6 +108,45 @@ class Algorithm(ABC):
 
         return False
 
+    def run_until(self, max_iters: int | None = None, max_time: float | None = None, max_nodes: int | None = None) -> RunOutcome:
+        """
+        Step the algorithm until it is complete or a budget runs out.
+
+        The completion check runs only when the node count changed, which
+        is the only way a tree planner can reach the goal. Planners that
+        complete differently (or can get stuck) should override this.
+
+        Args:
+            max_iters (int): Maximum number of step() calls, None for no limit.
+            max_time (float): Maximum wall time in seconds, None for no limit.
+            max_nodes (int): Stop once the algorithm holds this many nodes, None for no limit.
+
+        Returns:
+            RunOutcome: SOLVED, TIMEOUT or EXHAUSTED with the iteration count and elapsed time.
+        """
+        step = self.step
+        is_complete = self.is_complete
+        clock = time.perf_counter
+        start = clock()
+        deadline = start + max_time if max_time is not None else math.inf
+        max_iters = max_iters if max_iters is not None else math.inf
+        max_nodes = max_nodes if max_nodes is not None else math.inf
+
+        iterations = 0
+        checked_nodes = -1
+        while True:
+            node_count = len(self.nodes)
+            if node_count != checked_nodes:
+                if is_complete():
+                    return RunOutcome(SOLVED, iterations, clock() - start, len(self.nodes))
+                checked_nodes = node_count
+            if iterations >= max_iters or node_count >= max_nodes:
+                return RunOutcome(EXHAUSTED, iterations, clock() - start, node_count)
+            if clock() >= deadline:
+                return RunOutcome(TIMEOUT, iterations, clock() - start, node_count)
+            step()
+            iterations += 1
+
     def clear_nodes(self):
         # Usually we would like to keep a start node.
         self.nodes = []
@@ -82,6 +161,11 @@ class Algorithm(ABC):
 
             self.nodes.append(self.start_node)
 
+    def set_seed(self, seed: int | None):
+        """Restart the algorithm random stream, the same seed gives the same run."""
+        self.rng = RandomStream(seed)
+        self._sequence = None # The sequence shift comes from the stream
+
     def get_nodes(self):
         return self.nodes
 
@@ -100,6 +184,45 @@ class Algorithm(ABC):
 
         return False
 
+    def are_in_collision(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """
+        Vectorised is_collision for many points at once.
+
+        Returns:
+            np.ndarray: Boolean array, True where the point is outside the map or inside an obstacle.
+        """
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        collision = (xs < 0) | (xs > self.map.width) | (ys < 0) | (ys > self.map.height)
+
+        obstacles = self.map.get_obstacle_array()
+        if len(obstacles):
+            ox, oy, w, h = obstacles[:, 0], obstacles[:, 1], obstacles[:, 2], obstacles[:, 3]
+            px = xs[..., None]
+            py = ys[..., None]
+            inside = (ox <= px) & (px <= ox + w) & (oy <= py) & (py <= oy + h)
+            collision |= inside.any(axis=-1)
+        return collision
+
+    def clearance(self, x: float, y: float) -> float:
+        """
+        Distance from (x, y) to the closest obstacle or map border, 0 when in collision.
+
+        Every point closer to (x, y) than the clearance is free, so is every
+        edge starting at (x, y) that is shorter than it.
+        """
+        border = min(x, self.map.width - x, y, self.map.height - y)
+        if border <= 0:
+            return 0.0
+
+        obstacles = self.map.get_obstacle_array()
+        if not len(obstacles):
+            return float(border)
+        ox, oy, w, h = obstacles[:, 0], obstacles[:, 1], obstacles[:, 2], obstacles[:, 3]
+        dx = np.maximum(np.maximum(ox - x, x - (ox + w)), 0)
+        dy = np.maximum(np.maximum(oy - y, y - (oy + h)), 0)
+        return float(min(border, np.hypot(dx, dy).min()))
+
     def is_edge_collision(self, x1, y1, x2, y2):
         """
         Check if the line segment (x1, y1) to (x2, y2) intersects with any obstacle.
@@ -126,6 +249,51 @@ class Algorithm(ABC):
         return (ccw(x1, y1, x3, y3, x4, y4) != ccw(x2, y2, x3, y3, x4, y4)) and \
                (ccw(x1, y1, x2, y2, x3, y3) != ccw(x1, y1, x2, y2, x4, y4))
 
+    def sample_point(self) -> tuple:
+        """
+        Random point on the map according to sampling_mode.
+
+        In "free_space" mode the point is never inside an obstacle, so
+        planners do not waste draws on samples they would reject anyway.
+        """
+        if self.sampling_mode == "free_space":
+            return self.free_space_sampler().sample(self.rng)
+        if self.sampling_mode == "uniform":
+            return (self.rng.uniform(0, self.map.width), self.rng.uniform(0, self.map.height))
+        if self.sampling_mode in LOW_DISCREPANCY_MODES:
+            u, v = self.low_discrepancy_sequence().next_point()
+            return (u * self.map.width, v * self.map.height)
+        raise ValueError(f"Unknown sampling mode '{self.sampling_mode}', use one of {SAMPLING_MODES}")
+
+    def sample_points(self, count: int) -> tuple:
+        """
+        Batch version of sample_point.
+
+        Returns:
+            tuple: (xs, ys) numpy arrays of length count.
+        """
+        if self.sampling_mode == "free_space":
+            return self.free_space_sampler().sample_batch(count, self.rng)
+        if self.sampling_mode == "uniform":
+            return (self.rng.uniform_array(0, self.map.width, count), self.rng.uniform_array(0, self.map.height, count))
+        if self.sampling_mode in LOW_DISCREPANCY_MODES:
+            us, vs = self.low_discrepancy_sequence().next_points(count)
+            return (us * self.map.width, vs * self.map.height)
+        raise ValueError(f"Unknown sampling mode '{self.sampling_mode}', use one of {SAMPLING_MODES}")
+
+    def free_space_sampler(self) -> FreeSpaceSampler:
+        """Sampler over Map.free_cells, rebuilt only when the map obstacles change."""
+        cells = self.map.free_cells()
+        if self._free_space_sampler is None or self._free_space_sampler.cells is not cells:
+            self._free_space_sampler = FreeSpaceSampler(cells)
+        return self._free_space_sampler
+
+    def low_discrepancy_sequence(self) -> LowDiscrepancySequence:
+        """Halton or Sobol sequence for the current sampling_mode, continued across calls."""
+        if self._sequence is None or self._sequence.kind != self.sampling_mode:
+            self._sequence = LowDiscrepancySequence(self.sampling_mode, self.rng, self.sequence_shift)
+        return self._sequence
+
     def get_nearest_node(self, sample) -> TreeNode|GraphNode|None:
         if not self.nodes:
             return None
@@ -203,10 +371,27 @@ class Algorithm(ABC):
         return cost
 
     def start_benchmark(self):
+        self.start_run()
         if self.start_time is None and self.benchmark_manager is not None:
-            self.start_time = time.time()
+            self.start_time = time.perf_counter()
             # logger.info(f"Benchmark started for {self.__class__.__name__}")
 
+    def start_run(self):
+        """Mark the start of the end-to-end run, only the first call counts."""
+        if self.run_start is None:
+            self.run_start = time.perf_counter()
+            self.run_cpu_start = time.process_time()
+
+    @contextmanager
+    def phase(self, name: str):
+        """Add the wall time of the with block to phase_times[name], see PHASES."""
+        self.start_run()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phase_times[name] = self.phase_times.get(name, 0.0) + time.perf_counter() - start
+
     def finalize_benchmark(self):
         if self.benchmark_manager is None:
             logger.warning(f"No benchmark specified!")
@@ -216,7 +401,13 @@ class Algorithm(ABC):
             logger.warning(f"Time is not running!")
             return
 
-        execution_time = time.time() - self.start_time
+        now = time.perf_counter()
+        execution_time = now - self.start_time
+        self.start_run()
+        total_time = max(now - self.run_start, execution_time)
+        phase_times = {phase: self.phase_times.get(phase, 0.0) for phase in PHASES}
+        if "search" not in self.phase_times:
+            phase_times["search"] = max(total_time - sum(phase_times.values()), 0.0)
 
         result = BenchmarkResult(
             algorithm_name=self.__class__.__name__,
@@ -226,8 +417,17 @@ class Algorithm(ABC):
             goal_point=self.map.goal,
             step_size=self.step_size,
             path_length=self.calculate_shortest_path_cost(),
-            shortest_path=self.shortest_path
+            shortest_path=self.shortest_path,
+            total_time=total_time,
+            cpu_time=time.process_time() - self.run_cpu_start,
+            phase_times=phase_times,
+            # Only known when the caller traces allocations (tracemalloc.start())
+            peak_memory=tracemalloc.get_traced_memory()[1] if tracemalloc.is_tracing() else None,
+            map_name=self.map.name
         )
+        # A further query (e.g. PRM with new start and goal) is measured on its own
+        self.run_start = None
+        self.phase_times = {}
 
         self.benchmark_manager.add_result(result)
         #self.benchmark_manager.print_results()
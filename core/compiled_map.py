@@ -0,0 +1,71 @@
+import os
+import typing as t
+
+import numpy as np
+
+from core.map import Map
+
+class CompiledMap:
+    """Geometry of a map computed once and shared with worker processes.
+
+    publish() stores the obstacle array and free cells as .npy files. load()
+    memory-maps them read-only into a new Map, so a worker starts without
+    recomputing anything and all workers share the same pages of the OS page
+    cache instead of holding a copy each.
+
+    The object itself only holds paths and a few numbers, so it is cheap to
+    pickle into every job.
+    """
+
+    ARRAYS = ("obstacles", "free_cells")
+
+    def __init__(self,
+                 directory: str,
+                 width: float,
+                 height: float,
+                 start: t.Optional[t.Tuple[float, float]] = None,
+                 goal: t.Optional[t.Tuple[float, float]] = None,
+                 name: t.Optional[str] = None):
+        self.directory = directory
+        self.name = name
+        self.width = width
+        self.height = height
+        self.start = start
+        self.goal = goal
+
+    @classmethod
+    def publish(cls, map: Map, directory: str) -> "CompiledMap":
+        """Compute everything derived from the obstacles of map and write it to directory."""
+        os.makedirs(directory, exist_ok=True)
+        arrays = {
+            "obstacles": map.get_obstacle_array(),
+            "free_cells": np.array(map.free_cells(), dtype=np.float64).reshape(-1, 4),
+        }
+        for name, array in arrays.items():
+            np.save(os.path.join(directory, f"{name}.npy"), array)
+
+        start = (map.start.x, map.start.y) if map.start else None
+        goal = (map.goal.x, map.goal.y) if map.goal else None
+        return cls(directory, map.width, map.height, start, goal, map.name)
+
+    def array(self, name: str) -> np.ndarray:
+        """Read-only memory-mapped view of one of ARRAYS."""
+        if name not in self.ARRAYS:
+            raise ValueError(f"Unknown array '{name}', use one of {self.ARRAYS}")
+        return np.load(os.path.join(self.directory, f"{name}.npy"), mmap_mode="r")
+
+    def load(self) -> Map:
+        """New Map backed by the shared arrays, with start and goal set."""
+        map = Map(self.width, self.height, name=self.name)
+        # Views of the shared pages, not copies - add_obstacle turns obstacles back into a list
+        obstacles = self.array("obstacles")
+        map.obstacles = obstacles
+        # Seed the caches, clear_cache() (e.g. add_obstacle) drops them as usual
+        map._obstacle_array = obstacles
+        map._free_cells = self.array("free_cells")
+
+        if self.start is not None:
+            map.set_start(*self.start)
+        if self.goal is not None:
+            map.set_goal(*self.goal)
+        return map
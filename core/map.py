@@ -1,13 +1,19 @@
+import typing as t
+
+import numpy as np
+
 from core.node import TreeNode, GraphNode
 
 class Map:
-    def __init__(self, width, height, start=None, goal=None, architecture="tree"):
+    def __init__(self, width, height, start=None, goal=None, architecture="tree", name=None):
+        self.name = name # Name in MapsManager, if the map comes from there
         self.width = float(width)
         self.height = float(height)
         self.start = start
         self.goal = goal
         self.obstacles = []
         self.architecture = architecture
+        self.clear_cache()
 
     def set_start(self, x, y):
         if self.architecture == "tree":
@@ -26,12 +32,66 @@ class Map:
             raise ValueError("Unknown architecture")
 
     def add_obstacle(self, x, y, width, height):
+        if not isinstance(self.obstacles, list):
+            # Read-only array shared by a CompiledMap, this map gets its own copy
+            self.obstacles = [tuple(obstacle) for obstacle in self.obstacles.tolist()]
         self.obstacles.append((float(x), float(y), float(width), float(height)))
+        self.clear_cache()
 
     def reset(self):
         self.start = None
         self.goal = None
         self.obstacles = []
+        self.clear_cache()
+
+    def clear_cache(self):
+        """Drop everything derived from obstacles, must be called whenever they change."""
+        self._free_area = None
+        self._obstacle_array = None
+        self._obstacle_list = None
+        self._free_cells = None
 
     def get_obstacles(self):
-        return self.obstacles
+        """Obstacles as (x, y, width, height) tuples - for scalar loops with an early exit."""
+        if isinstance(self.obstacles, list):
+            return self.obstacles
+        # Shared array of a CompiledMap, iterating its rows yields numpy scalars which are far slower to compare
+        if self._obstacle_list is None:
+            self._obstacle_list = [tuple(obstacle) for obstacle in self.obstacles.tolist()]
+        return self._obstacle_list
+
+    def get_obstacle_array(self) -> np.ndarray:
+        """Obstacles as a (n, 4) float array of x, y, width, height - for vectorised checks."""
+        if self._obstacle_array is None:
+            self._obstacle_array = np.array(self.obstacles, dtype=np.float64).reshape(len(self.obstacles), 4)
+        return self._obstacle_array
+
+    def free_area(self) -> float:
+        """Area of the map not covered by obstacles (overlapping obstacles are counted once)."""
+        if self._free_area is None:
+            self._free_area = float(sum((x1 - x0) * (y1 - y0) for x0, y0, x1, y1 in self.free_cells()))
+        return self._free_area
+
+    def free_cells(self) -> t.Sequence[t.Tuple[float, float, float, float]]:
+        """Decompose the free space into axis aligned cells (x0, y0, x1, y1).
+
+        Obstacle edges split the map into a non-uniform grid of cells, each cell
+        is either fully inside some obstacle or fully free (up to its border).
+        A map loaded from a CompiledMap returns them as a shared (cells, 4) array.
+        """
+        if self._free_cells is not None:
+            return self._free_cells
+
+        xs = np.array(sorted({0.0, self.width} | {min(max(v, 0.0), self.width) for ox, _, w, _ in self.obstacles for v in (ox, ox + w)}))
+        ys = np.array(sorted({0.0, self.height} | {min(max(v, 0.0), self.height) for _, oy, _, h in self.obstacles for v in (oy, oy + h)}))
+
+        # Cell centres against all obstacles at once, shape (cells_x, cells_y, obstacles)
+        cx = ((xs[:-1] + xs[1:]) / 2)[:, None, None]
+        cy = ((ys[:-1] + ys[1:]) / 2)[None, :, None]
+        obstacles = self.get_obstacle_array()
+        ox, oy, w, h = obstacles[:, 0], obstacles[:, 1], obstacles[:, 2], obstacles[:, 3]
+        blocked = ((ox <= cx) & (cx <= ox + w) & (oy <= cy) & (cy <= oy + h)).any(axis=-1)
+
+        self._free_cells = [(float(xs[i]), float(ys[j]), float(xs[i + 1]), float(ys[j + 1]))
+                            for i, j in zip(*np.nonzero(~blocked))]
+        return self._free_cells
@@ -0,0 +1,71 @@
+import typing as t
+import zlib
+
+import numpy as np
+
+DEFAULT_BLOCK_SIZE = 4096
+
+class RandomStream:
+    """Per-algorithm random numbers backed by numpy.random.Generator.
+
+    Scalar draws are served from blocks pre-drawn in one NumPy call, so the
+    per-sample cost is a list lookup. Two streams created with the same seed
+    produce the same sequence, which makes runs reproducible.
+    """
+
+    def __init__(self, seed: t.Optional[int] = None, block_size: int = DEFAULT_BLOCK_SIZE):
+        self.seed = seed
+        self.block_size = block_size
+        self.generator = np.random.default_rng(seed)
+        self._uniform_block = []
+        self._uniform_index = 0
+        self._normal_block = []
+        self._normal_index = 0
+
+    def random(self) -> float:
+        """Uniform float in [0, 1)."""
+        if self._uniform_index >= len(self._uniform_block):
+            self._uniform_block = self.generator.random(self.block_size).tolist()
+            self._uniform_index = 0
+        value = self._uniform_block[self._uniform_index]
+        self._uniform_index += 1
+        return value
+
+    def uniform(self, low: float, high: float) -> float:
+        return low + (high - low) * self.random()
+
+    def normal(self, mean: float = 0.0, std_dev: float = 1.0) -> float:
+        if self._normal_index >= len(self._normal_block):
+            self._normal_block = self.generator.standard_normal(self.block_size).tolist()
+            self._normal_index = 0
+        value = self._normal_block[self._normal_index]
+        self._normal_index += 1
+        return mean + std_dev * value
+
+    def random_array(self, count: int) -> np.ndarray:
+        return self.generator.random(count)
+
+    def uniform_array(self, low: float, high: float, count: int) -> np.ndarray:
+        return self.generator.uniform(low, high, count)
+
+    def normal_array(self, mean: float, std_dev: float, count: int) -> np.ndarray:
+        return self.generator.normal(mean, std_dev, count)
+
+    def integers_array(self, high: int, count: int) -> np.ndarray:
+        """Integers in [0, high)."""
+        return self.generator.integers(0, high, count)
+
+def derive_seed(base_seed: int, *keys: t.Union[int, str]) -> int:
+    """Deterministic 32-bit seed for a job, e.g. derive_seed(base, algorithm, map, run).
+
+    Strings are hashed with crc32 so the result is the same in every process
+    (built-in hash() of str is randomised per interpreter).
+    """
+    entropy = [int(base_seed)]
+    for key in keys:
+        entropy.append(zlib.crc32(key.encode()) if isinstance(key, str) else int(key))
+    return int(np.random.SeedSequence(entropy).generate_state(1)[0])
+
+def new_base_seed() -> int:
+    """Fresh random base seed, for campaigns where none was given."""
+    return int(np.random.SeedSequence().generate_state(1)[0])
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import heapq
+import typing as t
+
+import numpy as np
+
+Position = t.Tuple[float, float]
+Edge = t.Tuple[int, int, float]
+Link = t.Tuple[int, float]
+
+class CSRRoadmap:
+    """Undirected roadmap stored in compressed sparse row (CSR) format.
+
+    Nodes are plain integer indices, their coordinates live in xs/ys arrays.
+    Neighbours of node i are indices[indptr[i]:indptr[i + 1]] with matching
+    weights, so there is no per-node Python object and no per-edge dict entry.
+
+    Start and goal of a query are not stored in the roadmap. They are passed
+    to a_star as two virtual nodes (indices num_nodes and num_nodes + 1)
+    together with their links, so the shared adjacency is never modified.
+    """
+
+    def __init__(self, xs: np.ndarray, ys: np.ndarray, indptr: np.ndarray, indices: np.ndarray, weights: np.ndarray):
+        self.xs = xs
+        self.ys = ys
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+
+    @classmethod
+    def from_edges(cls, positions: t.Sequence[Position], edges: t.Sequence[Edge]) -> CSRRoadmap:
+        """Build the roadmap from node positions and undirected (i, j, cost) edges."""
+        num_nodes = len(positions)
+        coords = np.asarray(positions, dtype=np.float64).reshape(num_nodes, 2)
+        edge_array = np.asarray(edges, dtype=np.float64).reshape(len(edges), 3)
+
+        first = edge_array[:, 0].astype(np.int32)
+        second = edge_array[:, 1].astype(np.int32)
+        rows = np.concatenate((first, second))
+        cols = np.concatenate((second, first))
+        weights = np.concatenate((edge_array[:, 2], edge_array[:, 2]))
+
+        order = np.argsort(rows, kind="stable")
+        indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=num_nodes), out=indptr[1:])
+
+        return cls(xs=np.ascontiguousarray(coords[:, 0]),
+                   ys=np.ascontiguousarray(coords[:, 1]),
+                   indptr=indptr,
+                   indices=cols[order],
+                   weights=weights[order])
+
+    @classmethod
+    def from_graph_nodes(cls, nodes: t.Sequence) -> CSRRoadmap:
+        """Convert a GraphNode roadmap, edges to nodes outside the list are dropped."""
+        index = {node: i for i, node in enumerate(nodes)}
+        edges = []
+        for i, node in enumerate(nodes):
+            for neighbour, cost in node.edges.items():
+                j = index.get(neighbour)
+                if j is not None and i < j:
+                    edges.append((i, j, cost))
+        return cls.from_edges([node.get_position() for node in nodes], edges)
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.xs)
+
+    @property
+    def num_edges(self) -> int:
+        """Number of undirected edges."""
+        return len(self.indices) // 2
+
+    @property
+    def nbytes(self) -> int:
+        return self.xs.nbytes + self.ys.nbytes + self.indptr.nbytes + self.indices.nbytes + self.weights.nbytes
+
+    def position(self, i: int) -> Position:
+        return (float(self.xs[i]), float(self.ys[i]))
+
+    def positions(self) -> t.List[Position]:
+        return list(zip(self.xs.tolist(), self.ys.tolist()))
+
+    def neighbours(self, i: int) -> t.Tuple[np.ndarray, np.ndarray]:
+        """Neighbour indices and edge costs of node i."""
+        begin, end = self.indptr[i], self.indptr[i + 1]
+        return self.indices[begin:end], self.weights[begin:end]
+
+    def degree(self, i: int) -> int:
+        return int(self.indptr[i + 1] - self.indptr[i])
+
+    def edges(self) -> t.Iterator[Edge]:
+        """Iterate over undirected edges as (i, j, cost) with i < j."""
+        for i in range(self.num_nodes):
+            neighbours, weights = self.neighbours(i)
+            for j, cost in zip(neighbours.tolist(), weights.tolist()):
+                if i < j:
+                    yield (i, j, cost)
+
+    def a_star(self,
+               start: Position,
+               goal: Position,
+               start_links: t.Sequence[Link],
+               goal_links: t.Sequence[Link]) -> t.List[int]:
+        """A* search from start to goal over the roadmap.
+
+        g-costs, parents and the closed set are flat arrays indexed by node,
+        heap entries are (f, index) so no tie-breaking by id() is needed.
+
+        Args:
+            start: Position of the virtual start node (index num_nodes).
+            goal: Position of the virtual goal node (index num_nodes + 1).
+            start_links: (index, cost) edges of the start node. The index may be the goal index.
+            goal_links: (index, cost) edges of the goal node into the roadmap.
+
+        Returns:
+            list: Node indices from start to goal, empty if goal is unreachable.
+        """
+        num_nodes = self.num_nodes
+        start_index = num_nodes
+        goal_index = num_nodes + 1
+        total = num_nodes + 2
+
+        # Temporary edges of the virtual nodes, both directions.
+        extra: t.Dict[int, t.List[Link]] = {start_index: [], goal_index: []}
+        for virtual, links in ((start_index, start_links), (goal_index, goal_links)):
+            for other, cost in links:
+                if other == virtual:
+                    continue
+                extra[virtual].append((other, cost))
+                extra.setdefault(other, []).append((virtual, cost))
+        # Start-goal link may be given from both sides, keep one copy of each direction.
+        for virtual in (start_index, goal_index):
+            extra[virtual] = list(dict(extra[virtual]).items())
+
+        xs = np.append(self.xs, (start[0], goal[0]))
+        ys = np.append(self.ys, (start[1], goal[1]))
+        goal_x, goal_y = goal
+
+        g_cost = np.full(total, np.inf)
+        parent = np.full(total, -1, dtype=np.int64)
+        closed = np.zeros(total, dtype=bool)
+
+        g_cost[start_index] = 0.0
+        open_set = [(float(np.hypot(start[0] - goal_x, start[1] - goal_y)), start_index)]
+
+        while open_set:
+            _, current = heapq.heappop(open_set)
+            if closed[current]:
+                continue
+            closed[current] = True
+
+            if current == goal_index:
+                break
+
+            if current < num_nodes:
+                neighbours, weights = self.neighbours(current)
+                links = extra.get(current)
+                if links:
+                    neighbours = np.concatenate((neighbours, [other for other, _ in links]))
+                    weights = np.concatenate((weights, [cost for _, cost in links]))
+            else:
+                links = extra[current]
+                neighbours = np.array([other for other, _ in links], dtype=np.int64)
+                weights = np.array([cost for _, cost in links], dtype=np.float64)
+
+            tentative = g_cost[current] + weights
+            better = tentative < g_cost[neighbours]
+            if not better.any():
+                continue
+
+            neighbours = neighbours[better]
+            tentative = tentative[better]
+            g_cost[neighbours] = tentative
+            parent[neighbours] = current
+
+            f_cost = tentative + np.hypot(xs[neighbours] - goal_x, ys[neighbours] - goal_y)
+            for f, neighbour in zip(f_cost.tolist(), neighbours.tolist()):
+                heapq.heappush(open_set, (f, neighbour))
+
+        if not closed[goal_index]:
+            return []
+
+        path = [goal_index]
+        while path[-1] != start_index:
+            path.append(int(parent[path[-1]]))
+        path.reverse()
+        return path
@@ -0,0 +1,173 @@
+import typing as t
+
+import numpy as np
+
+from core.random_stream import RandomStream
+
+# uniform    - uniform over the whole map, planners reject samples in obstacles
+# free_space - uniform over free space only, every sample is collision-free
+# halton     - Halton sequence (bases 2 and 3) over the whole map
+# sobol      - Sobol sequence over the whole map
+SAMPLING_MODES = ("uniform", "free_space", "halton", "sobol")
+LOW_DISCREPANCY_MODES = ("halton", "sobol")
+
+SOBOL_BITS = 32
+
+Cell = t.Tuple[float, float, float, float]
+
+class FreeSpaceSampler:
+    """Draws points uniformly from the free space of a map without rejection.
+
+    Free space is given as axis aligned cells (see Map.free_cells). A cell is
+    picked with probability proportional to its area using Walker's alias
+    table, then a point is drawn uniformly inside it - O(1) per sample.
+    """
+
+    def __init__(self, cells: t.Sequence[Cell]):
+        if len(cells) == 0:
+            raise ValueError("Map has no free space to sample from")
+        self.cells = cells # List of tuples or a (cells, 4) array (see CompiledMap)
+
+        # Tables as arrays for batch sampling
+        bounds = np.asarray(cells, dtype=np.float64).reshape(-1, 4)
+        self._x0 = bounds[:, 0]
+        self._y0 = bounds[:, 1]
+        self._widths = bounds[:, 2] - bounds[:, 0]
+        self._heights = bounds[:, 3] - bounds[:, 1]
+
+        # Same tables as lists for single samples
+        self.x0 = self._x0.tolist()
+        self.y0 = self._y0.tolist()
+        self.widths = self._widths.tolist()
+        self.heights = self._heights.tolist()
+        self.probability, self.alias = self.build_alias_table([w * h for w, h in zip(self.widths, self.heights)])
+        self._probability = np.array(self.probability)
+        self._alias = np.array(self.alias, dtype=np.int64)
+
+    @staticmethod
+    def build_alias_table(weights: t.List[float]) -> t.Tuple[t.List[float], t.List[int]]:
+        """Vose's alias method, returns (probability, alias) lists."""
+        count = len(weights)
+        total = sum(weights)
+        scaled = [w * count / total for w in weights]
+        probability = [1.0] * count
+        alias = list(range(count))
+
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            probability[less] = scaled[less]
+            alias[less] = more
+            scaled[more] = scaled[more] + scaled[less] - 1.0
+            if scaled[more] < 1.0:
+                small.append(more)
+            else:
+                large.append(more)
+        # Leftovers are 1.0 up to rounding errors
+        return probability, alias
+
+    def sample(self, rng: RandomStream) -> t.Tuple[float, float]:
+        i = int(rng.random() * len(self.cells))
+        if rng.random() >= self.probability[i]:
+            i = self.alias[i]
+        return (self.x0[i] + rng.random() * self.widths[i],
+                self.y0[i] + rng.random() * self.heights[i])
+
+    def sample_batch(self, count: int, rng: RandomStream) -> t.Tuple[np.ndarray, np.ndarray]:
+        """Draw count points at once, returns (xs, ys) arrays."""
+        columns = rng.integers_array(len(self.cells), count)
+        cells = np.where(rng.random_array(count) < self._probability[columns], columns, self._alias[columns])
+        xs = self._x0[cells] + rng.random_array(count) * self._widths[cells]
+        ys = self._y0[cells] + rng.random_array(count) * self._heights[cells]
+        return xs, ys
+
+class LowDiscrepancySequence:
+    """Quasi-random points in the unit square from a Halton or Sobol sequence.
+
+    Consecutive points fill the square far more evenly than independent
+    uniform draws, so fewer samples are needed to cover free space. With
+    shift the whole sequence is moved by a random offset modulo 1
+    (Cranley-Patterson rotation), which keeps the even coverage but makes
+    different seeds give different point sets.
+    """
+
+    def __init__(self, kind: str, rng: t.Optional[RandomStream] = None, shift: bool = True, block_size: int = 256):
+        if kind not in LOW_DISCREPANCY_MODES:
+            raise ValueError(f"Unknown sequence '{kind}', use one of {LOW_DISCREPANCY_MODES}")
+        self.kind = kind
+        self.block_size = block_size
+        # Halton skips index 0, which is the corner (0, 0) in every base
+        self.index = 1 if kind == "halton" else 0
+        self.shift = (0.0, 0.0)
+        if shift:
+            rng = rng if rng is not None else RandomStream()
+            self.shift = (rng.random(), rng.random())
+        self._block = []
+        self._block_index = 0
+
+    def next_point(self) -> t.Tuple[float, float]:
+        """Next point of the sequence as (u, v) in [0, 1)."""
+        if self._block_index >= len(self._block):
+            us, vs = self._generate(self.block_size)
+            self._block = list(zip(us.tolist(), vs.tolist()))
+            self._block_index = 0
+        point = self._block[self._block_index]
+        self._block_index += 1
+        return point
+
+    def next_points(self, count: int) -> t.Tuple[np.ndarray, np.ndarray]:
+        """Next count points of the sequence, returns (us, vs) arrays.
+
+        Points next_point already generated come first, so mixing both calls
+        still walks the sequence in order.
+        """
+        buffered = self._block[self._block_index:self._block_index + count]
+        self._block_index += len(buffered)
+        us, vs = self._generate(count - len(buffered))
+        if buffered:
+            buffered_us, buffered_vs = np.array(buffered).T
+            us, vs = np.concatenate((buffered_us, us)), np.concatenate((buffered_vs, vs))
+        return us, vs
+
+    def _generate(self, count: int) -> t.Tuple[np.ndarray, np.ndarray]:
+        """The count points after the last generated one."""
+        indices = np.arange(self.index, self.index + count, dtype=np.uint64)
+        self.index += count
+        if self.kind == "halton":
+            us, vs = self.radical_inverse(indices, 2), self.radical_inverse(indices, 3)
+        else:
+            us, vs = self.sobol(indices)
+        return (us + self.shift[0]) % 1.0, (vs + self.shift[1]) % 1.0
+
+    @staticmethod
+    def radical_inverse(indices: np.ndarray, base: int) -> np.ndarray:
+        """Digits of each index in base mirrored around the decimal point (van der Corput)."""
+        indices = indices.astype(np.uint64)
+        result = np.zeros(len(indices))
+        scale = 1.0 / base
+        while indices.any():
+            result += (indices % base) * scale
+            indices = indices // base
+            scale /= base
+        return result
+
+    @staticmethod
+    def sobol(indices: np.ndarray) -> t.Tuple[np.ndarray, np.ndarray]:
+        """First two Sobol dimensions for each index.
+
+        Dimension one is van der Corput in base 2, dimension two uses the
+        primitive polynomial x + 1 (direction numbers v_k = v_(k-1) ^ (v_(k-1) >> 1)).
+        Point n is the XOR of the direction numbers picked by the bits of gray(n).
+        """
+        gray = indices ^ (indices >> np.uint64(1))
+        first = np.zeros(len(indices), dtype=np.uint64)
+        second = np.zeros(len(indices), dtype=np.uint64)
+        direction = 1 << (SOBOL_BITS - 1)
+        for bit in range(SOBOL_BITS):
+            selected = ((gray >> np.uint64(bit)) & np.uint64(1)).astype(bool)
+            first[selected] ^= np.uint64(1 << (SOBOL_BITS - 1 - bit))
+            second[selected] ^= np.uint64(direction)
+            direction ^= direction >> 1
+        return first / float(1 << SOBOL_BITS), second / float(1 << SOBOL_BITS)
@@ -0,0 +1,100 @@
+import heapq
+import math
+import typing as t
+from collections import defaultdict
+
+class GridIndex:
+    """Uniform grid (spatial hash) over 2D points.
+
+    Points are bucketed into square cells of cell_size, so radius and
+    k-nearest queries only look at cells around the query point instead of
+    scanning every point.
+    """
+
+    def __init__(self, cell_size: float):
+        if cell_size <= 0:
+            raise ValueError("Cell size must be positive")
+        self.cell_size = float(cell_size)
+        self.cells = defaultdict(list)  # {(cx, cy): [(x, y, item)]}
+        self.count = 0
+        self.min_cell = None
+        self.max_cell = None
+
+    def __len__(self):
+        return self.count
+
+    def cell_of(self, x: float, y: float) -> t.Tuple[int, int]:
+        return (int(math.floor(x / self.cell_size)), int(math.floor(y / self.cell_size)))
+
+    def insert(self, item: t.Any, x: float, y: float):
+        cell = self.cell_of(x, y)
+        self.cells[cell].append((x, y, item))
+        self.count += 1
+        if self.min_cell is None:
+            self.min_cell = cell
+            self.max_cell = cell
+        else:
+            self.min_cell = (min(self.min_cell[0], cell[0]), min(self.min_cell[1], cell[1]))
+            self.max_cell = (max(self.max_cell[0], cell[0]), max(self.max_cell[1], cell[1]))
+
+    def query_radius(self, x: float, y: float, radius: float) -> t.List[t.Tuple[float, t.Any]]:
+        """All items within radius (inclusive) as (distance, item), unsorted."""
+        if self.count == 0:
+            return []
+        min_cx, min_cy = self.cell_of(x - radius, y - radius)
+        max_cx, max_cy = self.cell_of(x + radius, y + radius)
+        min_cx, min_cy = max(min_cx, self.min_cell[0]), max(min_cy, self.min_cell[1])
+        max_cx, max_cy = min(max_cx, self.max_cell[0]), min(max_cy, self.max_cell[1])
+
+        found = []
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                for px, py, item in self.cells.get((cx, cy), ()):
+                    dist = math.hypot(px - x, py - y)
+                    if dist <= radius:
+                        found.append((dist, item))
+        return found
+
+    def k_nearest(self, x: float, y: float, k: int) -> t.List[t.Tuple[float, t.Any]]:
+        """The k items closest to (x, y) as (distance, item), closest first.
+
+        Cells are visited in rings of growing Chebyshev distance around the
+        query cell. Everything beyond ring r is at least r * cell_size away,
+        so the search stops once the k-th best distance is below that.
+        """
+        if self.count == 0 or k <= 0:
+            return []
+
+        cx, cy = self.cell_of(x, y)
+        max_ring = max(abs(cx - self.min_cell[0]), abs(cx - self.max_cell[0]),
+                       abs(cy - self.min_cell[1]), abs(cy - self.max_cell[1]))
+
+        best = []  # max-heap of size k: (-distance, sequence, item)
+        sequence = 0
+        ring = 0
+        while ring <= max_ring:
+            for cell in self._ring_cells(cx, cy, ring):
+                for px, py, item in self.cells.get(cell, ()):
+                    dist = math.hypot(px - x, py - y)
+                    if len(best) < k:
+                        heapq.heappush(best, (-dist, sequence, item))
+                    elif dist < -best[0][0]:
+                        heapq.heapreplace(best, (-dist, sequence, item))
+                    sequence += 1
+
+            if len(best) == k and -best[0][0] <= ring * self.cell_size:
+                break
+            ring += 1
+
+        return [(-neg_dist, item) for neg_dist, _, item in sorted(best, reverse=True)]
+
+    def _ring_cells(self, cx: int, cy: int, ring: int) -> t.Iterator[t.Tuple[int, int]]:
+        if ring == 0:
+            yield (cx, cy)
+            return
+        for dx in range(-ring, ring + 1):
+            yield (cx + dx, cy - ring)
+            yield (cx + dx, cy + ring)
+        for dy in range(-ring + 1, ring):
+            yield (cx - ring, cy + dy)
+            yield (cx + ring, cy + dy)
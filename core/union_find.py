@@ -0,0 +1,51 @@
+import typing as t
+
+class DisjointSet:
+    """Union-find over hashable items with path compression and union by size.
+
+    Used to track connected components of a roadmap while it is being built,
+    so start-goal connectivity can be checked without running a search.
+    """
+
+    def __init__(self):
+        self.parent = {}
+        self.size = {}
+
+    def __len__(self):
+        return len(self.parent)
+
+    def __contains__(self, item):
+        return item in self.parent
+
+    def add(self, item: t.Hashable):
+        if item not in self.parent:
+            self.parent[item] = item
+            self.size[item] = 1
+
+    def find(self, item: t.Hashable) -> t.Hashable:
+        root = item
+        while self.parent[root] != root:
+            root = self.parent[root]
+        # Path compression
+        while self.parent[item] != root:
+            self.parent[item], item = root, self.parent[item]
+        return root
+
+    def union(self, first: t.Hashable, second: t.Hashable) -> bool:
+        """Merge components of both items, returns False if they were already merged."""
+        first_root = self.find(first)
+        second_root = self.find(second)
+        if first_root == second_root:
+            return False
+        if self.size[first_root] < self.size[second_root]:
+            first_root, second_root = second_root, first_root
+        self.parent[second_root] = first_root
+        self.size[first_root] += self.size[second_root]
+        del self.size[second_root]
+        return True
+
+    def connected(self, first: t.Hashable, second: t.Hashable) -> bool:
+        return self.find(first) == self.find(second)
+
+    def component_count(self) -> int:
+        return len(self.size)
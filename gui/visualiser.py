@@ -9,12 +9,14 @@ from PyQt5.QtGui import QPen, QColor
 from core.map import Map
 from core.node import TreeNode
 from core.logger import logger
+from core.algorithm import SOLVED, TIMEOUT
 
 from algorithms.algorithm_manager import AlgorithmManager
 from maps.maps_manager import MapsManager
 from benchmarks.benchmark_manager import BenchmarkManager
 
 SCALE = 6  # Scale factor for display
+EXECUTE_TIMEOUT = 60  # Seconds "Execute Till Solution" may run before giving up
 
 class Visualiser(QMainWindow):
     def __init__(self, maps_manager: MapsManager):
@@ -49,6 +51,7 @@ class Visualiser(QMainWindow):
         self.auto_iterate_button = QPushButton('Auto Iterate')
         self.stop_auto_iterate_button = QPushButton('Stop Auto Iterate')
         self.execute_till_solution_button = QPushButton('Execute Till Solution')
+        self.outcome_label = QLabel('') # Outcome of the last "Execute Till Solution"
 
         self.step_input = QSpinBox()
         self.step_input.setRange(1, 1000)
@@ -103,6 +106,7 @@ class Visualiser(QMainWindow):
         layout.addWidget(self.auto_iterate_button)
         layout.addWidget(self.stop_auto_iterate_button)
         layout.addWidget(self.execute_till_solution_button)
+        layout.addWidget(self.outcome_label)
 
         container = QWidget()
         container.setLayout(layout)
@@ -218,6 +222,21 @@ class Visualiser(QMainWindow):
         pen_path = QPen(QColor("green"), 3)
         radius = 2
 
+        # CSR roadmap keeps only coordinates, there are no GraphNodes to draw from
+        roadmap = getattr(self.algorithm, "roadmap", None)
+        if roadmap is not None:
+            for i, j, _ in roadmap.edges():
+                x1, y1 = self.map_to_display(*roadmap.position(i))
+                x2, y2 = self.map_to_display(*roadmap.position(j))
+                line = QGraphicsLineItem(QLineF(x1, y1, x2, y2))
+                line.setPen(pen_edge)
+                self.scene.addItem(line)
+            for x, y in roadmap.positions():
+                x, y = self.map_to_display(x, y)
+                ellipse = QGraphicsEllipseItem(x - radius, y - radius, radius * 2, radius * 2)
+                ellipse.setBrush(QColor("lightblue"))
+                self.scene.addItem(ellipse)
+
         # Draw graph edges
         for node in self.algorithm.get_nodes():
             x1, y1 = self.map_to_display(node.x, node.y)
@@ -260,12 +279,14 @@ class Visualiser(QMainWindow):
 
     def reset_simulation(self):
         self.stop_auto_iterate()
+        self.outcome_label.setText('')
         self.map.reset()
         # self.algorithm = None
         self.draw_map()
 
     def reset_path(self):
         self.stop_auto_iterate()
+        self.outcome_label.setText('')
         if self.algorithm:
             self.algorithm.clear_nodes()
         self.draw_map()
@@ -309,10 +330,17 @@ class Visualiser(QMainWindow):
             return
 
         logger.info("Executing solution...")
-        while not self.algorithm.is_complete():
-            self.algorithm.step()
-
-        logger.info("Goal reached!")
+        outcome = self.algorithm.run_until(max_time=EXECUTE_TIMEOUT)
+        if outcome.status == SOLVED:
+            logger.info(f"Goal reached! ({outcome})")
+            self.outcome_label.setText(f"Goal reached: {outcome}")
+        elif outcome.status == TIMEOUT:
+            # The planner keeps its state, running it again continues where it stopped
+            logger.warning(f"No solution within {EXECUTE_TIMEOUT}s: {outcome}")
+            self.outcome_label.setText(f"No solution within {EXECUTE_TIMEOUT}s ({outcome}), press again to continue")
+        else:
+            logger.warning(f"No solution: {outcome}")
+            self.outcome_label.setText(f"No solution: {outcome}")
         self.draw_map()  # Final update to show the last segment
 
     def select_algorithm(self):
@@ -329,6 +357,10 @@ class Visualiser(QMainWindow):
                 map_instance = self.map,
                 benchmark_manager = self.benchmark_manager
             )
+            tuned_parameters = self.algorithm_manager.get_tuned_parameters(selected_algorithm, self.map.name)
+            if "step_size" in tuned_parameters:
+                # Show the tuned default, the spin box changes the step size from here on as usual
+                self.step_size_input.setValue(tuned_parameters["step_size"])
             step_size = self.step_size_input.value()
             self.algorithm.step_size = step_size
 
@@ -340,7 +372,7 @@ class Visualiser(QMainWindow):
 
         map_config = self.maps_manager.get_map(selected_map)
         if map_config:
-            self.map = Map(map_config.width, map_config.height, map_config.default_start, map_config.default_goal)
+            self.map = Map(map_config.width, map_config.height, map_config.default_start, map_config.default_goal, name=selected_map)
             for obs in map_config.obstacles:
                 self.map.add_obstacle(*obs)
             self.map.set_start(map_config.default_start[0], map_config.default_start[1])
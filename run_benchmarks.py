@@ -0,0 +1,31 @@
+from core.logger import logger
+
+from test_runner.test_runner import TestRunner
+from test_runner.benchmark_harness import BenchmarkHarness
+
+import sys
+
+if __name__ == "__main__":
+    ### CONFIGURE BENCHMARK ###
+    test_runner = TestRunner(
+        algorithms= ["PRM", "RRT-Connect", "RRT*", "RRT"],
+        maps=["Rooms", "Dense Obstacles"],
+        runs_per_test = 1, # Not used, trials below set the number of runs
+        step_size = 5.0,
+        output_file="benchmark_results.csv",
+        num_samples_excluding_grid=500,
+        radius_as_step_size_multiplication=3,
+        seed=0
+    )
+    harness = BenchmarkHarness(test_runner, trials=20, warmup=2)
+
+    ### RUN AND COMPARE AGAINST THE BASELINE ###
+    # python run_benchmarks.py --update-baseline records the current performance as the new baseline
+    summary = harness.run()
+    if "--update-baseline" in sys.argv:
+        harness.save_baseline(summary)
+        sys.exit(0)
+
+    exit_code = harness.gate(summary)
+    logger.info("No performance regressions" if exit_code == 0 else "Performance regressions found")
+    sys.exit(exit_code)
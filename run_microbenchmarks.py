@@ -0,0 +1,21 @@
+from core.logger import logger
+
+from benchmarks.microbenchmarks import run_microbenchmarks, save_results
+
+import sys
+
+if __name__ == "__main__":
+    ### CONFIGURE MICROBENCHMARKS ###
+    # python run_microbenchmarks.py [output.json]
+    output_file = sys.argv[1] if len(sys.argv) > 1 else "microbenchmarks.json"
+
+    ### RUN ###
+    logger.info("Running microbenchmarks...")
+    results = run_microbenchmarks(
+        benchmarks=None, # All of is_collision, is_edge_collision, get_nearest_node, get_near_nodes, connect_neighbors, a_star
+        maps=None, # All bundled maps, synthetic maps are added for every obstacle count
+        node_counts=(100, 1000, 5000),
+        obstacle_counts=(10, 100, 1000),
+        repeat=5
+    )
+    save_results(results, output_file)
@@ -0,0 +1,26 @@
+from core.logger import logger
+
+from test_runner.parameter_sweep import ParameterSweep
+
+import os
+
+if __name__ == "__main__":
+    ### CONFIGURE SWEEP ###
+    # Every combination of the values below is run, parameters left out keep the TestRunner default
+    sweep = ParameterSweep(
+        grids={
+            "PRM": {"step_size": [3.0, 5.0], "num_samples_excluding_grid": [250, 500, 1000], "radius_as_step_size_multiplication": [2, 3]},
+            "RRT*": {"step_size": [2.0, 3.0, 5.0]},
+            "RRT-Connect": {"step_size": [2.0, 3.0, 5.0]},
+        },
+        maps=["Dense Obstacles", "Rooms"],
+        runs_per_cell=20,
+        output_file="sweep_results.csv",
+        seed=0, # Keep it fixed, runs are only reused for the same seed
+        workers=os.cpu_count() or 1
+    )
+
+    ### RUN ###
+    # Runs of unchanged code, parameters, maps and seeds come from test_runner/cache/sweep_cache.jsonl
+    executed = sweep.run()
+    logger.info(f"Sweep done, {executed} runs executed, results in {sweep.output_file}")
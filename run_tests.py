@@ -5,8 +5,14 @@ from test_runner.test_analyse import TestAnalyser
 from test_runner.combine_heatmaps import HeatmapCombiner
 
 import os
+import sys
 
 if __name__ == "__main__":
+    # python run_tests.py --resume continues an interrupted campaign from its checkpoint,
+    # python run_tests.py --clear-results deletes everything in test_runner/results/ first
+    resume = "--resume" in sys.argv
+    clear_results = "--clear-results" in sys.argv
+
     ### CONFIGURE TEST RUNNER ###
     test_runner = TestRunner(
         algorithms= ["PRM","PRM-Hybrid", "RRT-Connect", "RRT*", "RRT* - Biased", "RRT", "RRT - Biased"],
@@ -15,7 +21,13 @@ if __name__ == "__main__":
         step_size = 5.0,
         output_file="benchmark_results.csv",
         num_samples_excluding_grid=500,
-        radius_as_step_size_multiplication=3
+        radius_as_step_size_multiplication=3,
+        workers=os.cpu_count() or 1,
+        clear_results=clear_results,
+        resume=resume,
+        profile=None, # "cprofile" or "sampling" profiles the first profile_runs runs of every pair again, into test_runner/results/profiles/
+        store_file="test_runner/store/results.sqlite", # Every campaign is also added here, across days and commits (None disables it)
+        ci_target=None # E.g. 0.05 with ci_metric="Path Length": stop adding runs to a pair once its CI is +-2.5 %, runs_per_test is the cap
     )
 
     ### RUN TESTS AND ANALYSIS ###
@@ -23,7 +35,7 @@ if __name__ == "__main__":
     test_runner.run_tests()
     logger.info("Running test analysis...")
 
-    analyser = TestAnalyser('benchmark_results.csv')
+    analyser = TestAnalyser('benchmark_results.csv') # Or e.g. TestAnalyser(test_runner.store_file, campaign_id="latest")
     analyser.generate_comparison_table()
     analyser.generate_heatmaps_v1()
     analyser.generate_heatmaps_v2()
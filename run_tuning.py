@@ -0,0 +1,21 @@
+from core.logger import logger
+
+from test_runner.tuning import tune_and_store
+
+import os
+
+if __name__ == "__main__":
+    ### CONFIGURE TUNING ###
+    # Winners are stored in algorithms/tuned_parameters.json and used by AlgorithmManager.get_algorithm as per-map defaults
+    tuned = tune_and_store(
+        algorithm_names=["PRM", "RRT-Connect", "RRT*", "RRT - Biased"],
+        map_names=["Dense Obstacles", "Rooms", "Maze Map"],
+        configurations=27, # Parameter combinations in the first rung (a random subset of the search space if it is larger)
+        min_runs=2, # Runs per configuration in the first rung, eta times more in each following rung
+        eta=3,
+        time_budget=5, # Seconds a run gets to solve the map
+        workers=os.cpu_count() or 1
+    )
+
+    for (algorithm_name, map_name), parameters in tuned.items():
+        logger.info(f"{algorithm_name} on {map_name}: {parameters}")
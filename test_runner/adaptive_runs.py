@@ -0,0 +1,86 @@
+import math
+
+from benchmarks.benchmark_manager import RunningStats
+from core.logger import logger
+from core.random_stream import derive_seed
+
+CI_Z = 1.96 # Normal quantile of a 95 % confidence interval
+
+class AdaptiveScheduler:
+    """
+    Hands out runs per algorithm-map pair until the mean of a metric is known well enough.
+
+    Every pair first gets min_runs runs. After that a pair keeps getting runs
+    until the relative width of the confidence interval of the metric
+    mean, 2 * CI_Z * std / sqrt(n) / mean, is at most target, or until
+    max_runs runs were scheduled. The width shrinks with sqrt(n), so the
+    next batch is sized to reach the target from the current estimate, at
+    most doubling the runs of a pair per round to not overshoot on a noisy
+    estimate.
+
+    Job keys and seeds are the ones of TestRunner.jobs(), so an adaptive
+    campaign runs a prefix of the runs a fixed one would.
+    """
+
+    def __init__(self, algorithms, maps, seed, target, min_runs, max_runs):
+        if target <= 0:
+            raise ValueError(f"Confidence interval target must be positive, got {target}")
+        self.seed = seed
+        self.target = target
+        self.min_runs = min(min_runs, max_runs)
+        self.max_runs = max_runs
+        self.pairs = [(algorithm_name, map_name) for map_name in maps for algorithm_name in algorithms]
+        self.scheduled = {pair: 0 for pair in self.pairs} # Next run index of every pair
+        self.stats = {pair: RunningStats() for pair in self.pairs} # Metric of the solved runs
+        self.finished = set() # Job keys with a result
+
+    def add(self, key, value):
+        """Record the result of a job, value is the metric or None if the run gave none (e.g. timed out)."""
+        self.finished.add(tuple(key))
+        if value is not None and math.isfinite(value):
+            self.stats[tuple(key[:2])].add(value)
+
+    def ci_width(self, pair):
+        """Relative width of the confidence interval of the metric mean, inf while it cannot be estimated."""
+        stats = self.stats[pair]
+        if stats.count < 2 or stats.mean == 0:
+            return math.inf
+        return 2 * CI_Z * stats.std / math.sqrt(stats.count) / abs(stats.mean)
+
+    def is_done(self, pair):
+        if self.scheduled[pair] >= self.max_runs:
+            return True
+        return self.scheduled[pair] >= self.min_runs and self.ci_width(pair) <= self.target
+
+    def runs_to_add(self, pair):
+        scheduled = self.scheduled[pair]
+        if scheduled < self.min_runs:
+            return self.min_runs - scheduled
+        width = self.ci_width(pair)
+        count = self.stats[pair].count
+        if math.isinf(width):
+            runs = scheduled # Nothing to extrapolate from, double
+        else:
+            runs = math.ceil(count * (width / self.target) ** 2) - count
+        return max(1, min(runs, scheduled, self.max_runs - scheduled))
+
+    def next_batch(self):
+        """Job keys (algorithm_name, map_name, run, seed) of the next round, empty once every pair is done."""
+        batch = []
+        for pair in self.pairs:
+            if self.is_done(pair):
+                continue
+            start = self.scheduled[pair]
+            self.scheduled[pair] += self.runs_to_add(pair)
+            for run in range(start, self.scheduled[pair]):
+                key = (*pair, run, derive_seed(self.seed, *pair, run))
+                if key not in self.finished: # Done in the campaign that is being resumed
+                    batch.append(key)
+        return batch
+
+    def log_summary(self, metric):
+        for pair in self.pairs:
+            width = self.ci_width(pair)
+            reached = "reached" if width <= self.target else "cap hit"
+            logger.info(f"{pair[0]} on {pair[1]}: {self.scheduled[pair]} runs, {metric} CI width {width:.1%} "
+                        f"(target {self.target:.1%}, {reached})")
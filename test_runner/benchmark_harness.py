@@ -0,0 +1,169 @@
+import json
+import math
+import os
+import tempfile
+import typing as t
+
+import numpy as np
+
+from core.logger import logger
+from core.random_stream import derive_seed
+from core.algorithm import SOLVED
+from test_runner.test_runner import RESULT_COLUMNS
+
+# Metric name in summaries and baselines -> column of a TestRunner result row
+BENCHMARK_METRICS = {
+    "time": "Execution Time",
+    "steps": "Steps",
+    "path_length": "Path Length",
+}
+
+# Only a slower planner fails the gate, steps and path length changes are reported
+GATED_METRICS = ("time",)
+
+DEFAULT_SEED = 0 # Fixed so that every benchmark run plans on the same seeds as the baseline
+
+def bootstrap_median_ci(values: t.Sequence[float],
+                        confidence: float = 0.95,
+                        resamples: int = 2000,
+                        rng: t.Optional[np.random.Generator] = None) -> t.Tuple[float, float, float]:
+    """Median of values with a percentile bootstrap confidence interval, as (median, low, high)."""
+    values = np.asarray(values, dtype=np.float64)
+    if len(values) == 0:
+        return (math.nan, math.nan, math.nan)
+    rng = rng if rng is not None else np.random.default_rng(DEFAULT_SEED)
+    # All resamples in one (resamples, n) draw
+    medians = np.median(rng.choice(values, size=(resamples, len(values)), replace=True), axis=1)
+    alpha = (1 - confidence) / 2
+    low, high = np.quantile(medians, [alpha, 1 - alpha])
+    return (float(np.median(values)), float(low), float(high))
+
+class BenchmarkHarness:
+    """
+    Repeatable performance measurement of the algorithm-map pairs of a TestRunner.
+
+    Every pair first gets warmup runs (discarded), then trials runs on seeds
+    derived from a fixed base seed, so two benchmark runs plan the same
+    problems. Runs are executed serially in this process - no worker start
+    up in the measurement and no runs competing for cores. For time, steps
+    and path length the median and its bootstrap confidence interval are
+    reported per pair.
+
+    compare() checks a summary against a baseline file: a pair regresses
+    when the lower bound of its time interval is above the upper bound of
+    the baseline interval and the median is more than tolerance slower.
+    """
+
+    def __init__(self, test_runner, trials=20, warmup=2, baseline_file="test_runner/baselines/benchmark_baseline.json",
+                 confidence=0.95, resamples=2000, tolerance=0.05):
+        if trials < 2:
+            raise ValueError(f"Need at least 2 trials for a confidence interval, got {trials}")
+        self.test_runner = test_runner
+        if self.test_runner.seed is None:
+            self.test_runner.seed = DEFAULT_SEED
+        self.trials = trials
+        self.warmup = warmup
+        self.baseline_file = baseline_file
+        self.confidence = confidence
+        self.resamples = resamples
+        self.tolerance = tolerance # Relative slowdown of the median that is tolerated even when significant
+
+    def run(self):
+        """Run warmup and trials of every pair, returns the summary (see summarize)."""
+        rows = []
+        with tempfile.TemporaryDirectory(prefix="compiled_maps_") as directory:
+            compiled_maps = self.test_runner.compile_maps(directory)
+            for map_name in self.test_runner.maps:
+                for algorithm_name in self.test_runner.algorithms:
+                    compiled_map = compiled_maps.get(map_name)
+                    for run in range(self.warmup):
+                        self.test_runner.run_single_test(algorithm_name, map_name, derive_seed(self.test_runner.seed, "warmup", algorithm_name, map_name, run), compiled_map)
+                    logger.info(f"Benchmarking {algorithm_name} on {map_name}: {self.trials} trials")
+                    for run in range(self.trials):
+                        seed = derive_seed(self.test_runner.seed, algorithm_name, map_name, run)
+                        row = self.test_runner.run_single_test(algorithm_name, map_name, seed, compiled_map)
+                        if row:
+                            rows.append((algorithm_name, map_name, row))
+        return self.summarize(rows)
+
+    def summarize(self, rows):
+        """
+        {"<algorithm>|<map>": {"runs", "solved", <metric>: {"median", "low", "high"}}} of (algorithm_name, map_name, row) tuples.
+
+        Metrics only cover solved runs.
+        """
+        status_column = RESULT_COLUMNS.index("Status")
+        grouped = {}
+        for algorithm_name, map_name, row in rows:
+            pair = grouped.setdefault(self.pair_key(algorithm_name, map_name), {"runs": 0, "values": {metric: [] for metric in BENCHMARK_METRICS}})
+            pair["runs"] += 1
+            if row[status_column] != SOLVED:
+                continue
+            for metric, column in BENCHMARK_METRICS.items():
+                pair["values"][metric].append(float(row[RESULT_COLUMNS.index(column)]))
+
+        summary = {}
+        rng = np.random.default_rng(DEFAULT_SEED)
+        for key, pair in grouped.items():
+            summary[key] = {"runs": pair["runs"], "solved": len(pair["values"]["time"])}
+            for metric, values in pair["values"].items():
+                median, low, high = bootstrap_median_ci(values, self.confidence, self.resamples, rng)
+                summary[key][metric] = {"median": median, "low": low, "high": high}
+        return summary
+
+    def compare(self, summary, baseline):
+        """Regressions of summary against baseline as a list of messages, empty when the gate passes."""
+        regressions = []
+        for key, current in summary.items():
+            if key not in baseline:
+                logger.info(f"{key}: not in the baseline")
+                continue
+            reference = baseline[key]
+            if current["solved"] < current["runs"] and reference["solved"] == reference["runs"]:
+                regressions.append(f"{key}: solved {current['solved']}/{current['runs']} runs, baseline solved all")
+
+            for metric in BENCHMARK_METRICS:
+                now, before = current[metric], reference[metric]
+                if any(math.isnan(value) for value in (now["median"], before["median"])):
+                    continue
+                change = now["median"] / before["median"] - 1 if before["median"] else 0.0
+                significant = now["low"] > before["high"] and change > self.tolerance
+                message = (f"{key}: {metric} median {before['median']:.4f} -> {now['median']:.4f} ({change:+.1%}), "
+                           f"CI [{now['low']:.4f}, {now['high']:.4f}] vs [{before['low']:.4f}, {before['high']:.4f}]")
+                if significant and metric in GATED_METRICS:
+                    regressions.append(message)
+                elif significant:
+                    logger.warning(message)
+                else:
+                    logger.info(message)
+        return regressions
+
+    def gate(self, summary):
+        """Exit code of a benchmark run: 0 when no pair is significantly slower than the baseline, 1 otherwise."""
+        baseline = self.load_baseline()
+        if baseline is None:
+            logger.warning(f"No baseline at {self.baseline_file}, nothing to compare against")
+            return 0
+        regressions = self.compare(summary, baseline["pairs"])
+        for regression in regressions:
+            logger.error(f"Regression - {regression}")
+        return 1 if regressions else 0
+
+    def load_baseline(self):
+        if not os.path.exists(self.baseline_file):
+            return None
+        with open(self.baseline_file) as file:
+            baseline = json.load(file)
+        if baseline["seed"] != self.test_runner.seed:
+            raise ValueError(f"Baseline {self.baseline_file} was recorded with seed {baseline['seed']}, not {self.test_runner.seed}")
+        return baseline
+
+    def save_baseline(self, summary):
+        os.makedirs(os.path.dirname(self.baseline_file) or ".", exist_ok=True)
+        with open(self.baseline_file, "w") as file:
+            json.dump({"seed": self.test_runner.seed, "trials": self.trials, "confidence": self.confidence, "pairs": summary}, file, indent=2)
+        logger.info(f"Baseline saved to {self.baseline_file}")
+
+    @staticmethod
+    def pair_key(algorithm_name, map_name):
+        return f"{algorithm_name}|{map_name}"
@@ -0,0 +1,118 @@
+import csv
+import json
+import math
+import typing as t
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+# Typed scalar columns of a columnar results file, paths are stored separately as
+# path_offsets (runs + 1) and path_coordinates (points, 2): the path of run i is
+# path_coordinates[path_offsets[i]:path_offsets[i + 1]]
+SCALAR_COLUMNS = {
+    "algorithm": str,
+    "map": str,
+    "status": str,
+    "execution_time": np.float64, # NaN when not solved
+    "path_length": np.float64, # NaN when not solved
+    "steps": np.int64, # -1 when not solved
+    "start_x": np.float64,
+    "start_y": np.float64,
+    "goal_x": np.float64,
+    "goal_y": np.float64,
+    "step_size": np.float64,
+    "seed": np.int64,
+    "total_time": np.float64, # NaN when not solved, same for the other times
+    "cpu_time": np.float64,
+    "sampling_time": np.float64,
+    "connection_time": np.float64,
+    "search_time": np.float64,
+    "reconstruction_time": np.float64,
+    "peak_memory": np.int64, # -1 when not solved or not tracked
+}
+
+def columnar_extension() -> str:
+    """.parquet when pyarrow is installed, .npz otherwise."""
+    return ".parquet" if pa is not None else ".npz"
+
+def read_csv_columns(csv_file: str) -> t.Dict[str, np.ndarray]:
+    """Parse a TestRunner results CSV into typed columns."""
+    values = {name: [] for name in SCALAR_COLUMNS}
+    offsets = [0]
+    coordinates = []
+    with open(csv_file, newline='') as file:
+        for row in csv.DictReader(file):
+            values["algorithm"].append(row["Algorithm"])
+            values["map"].append(row["Map"])
+            values["status"].append(row.get("Status", "solved"))
+            values["execution_time"].append(float(row["Execution Time"]) if row["Execution Time"] else math.nan)
+            values["path_length"].append(float(row["Path Length"]) if row["Path Length"] else math.nan)
+            values["steps"].append(int(row["Steps"]) if row["Steps"] else -1)
+            start = parse_point(row["start_node"])
+            goal = parse_point(row["goal_node"])
+            values["start_x"].append(start[0])
+            values["start_y"].append(start[1])
+            values["goal_x"].append(goal[0])
+            values["goal_y"].append(goal[1])
+            values["step_size"].append(float(row["step_size"]))
+            values["seed"].append(int(row["seed"]) if row.get("seed") else -1)
+            for column in ("Total Time", "CPU Time", "Sampling Time", "Connection Time", "Search Time", "Reconstruction Time"):
+                value = row.get(column)
+                values[column.lower().replace(" ", "_")].append(float(value) if value else math.nan)
+            values["peak_memory"].append(int(row["Peak Memory"]) if row.get("Peak Memory") else -1)
+
+            path = json.loads(row["Path"]) if row["Path"] else []
+            coordinates.extend(path)
+            offsets.append(offsets[-1] + len(path))
+
+    columns = {name: np.array(values[name], dtype=dtype) for name, dtype in SCALAR_COLUMNS.items()}
+    columns["path_offsets"] = np.array(offsets, dtype=np.int64)
+    columns["path_coordinates"] = np.array(coordinates, dtype=np.float64).reshape(-1, 2)
+    return columns
+
+def parse_point(value: str) -> t.Tuple[float, float]:
+    """'(x, y)' as written by the CSV writer, NaNs when empty."""
+    if not value:
+        return (math.nan, math.nan)
+    x, y = value.strip('()').split(',')
+    return (float(x), float(y))
+
+def write_columnar(columns: t.Dict[str, np.ndarray], base_path: str) -> str:
+    """Write columns to base_path + columnar_extension(), returns the file name."""
+    output_file = base_path + columnar_extension()
+    if pa is not None:
+        coordinates = pa.FixedSizeListArray.from_arrays(pa.array(columns["path_coordinates"].ravel()), 2)
+        table = pa.table({
+            **{name: pa.array(columns[name]) for name in SCALAR_COLUMNS},
+            "path": pa.LargeListArray.from_arrays(pa.array(columns["path_offsets"]), coordinates),
+        })
+        pq.write_table(table, output_file)
+    else:
+        np.savez(output_file, **columns)
+    return output_file
+
+def read_columnar(input_file: str) -> t.Dict[str, np.ndarray]:
+    """Columns written by write_columnar, in the same layout as read_csv_columns."""
+    if input_file.endswith(".parquet"):
+        if pa is None:
+            raise ValueError(f"Reading {input_file} needs pyarrow")
+        table = pq.read_table(input_file)
+        columns = {name: table.column(name).to_numpy() for name in SCALAR_COLUMNS}
+        path = table.column("path").combine_chunks()
+        columns["path_offsets"] = path.offsets.to_numpy()
+        columns["path_coordinates"] = path.values.flatten().to_numpy().reshape(-1, 2)
+        return columns
+
+    with np.load(input_file, allow_pickle=False) as data:
+        return {name: data[name] for name in data.files}
+
+def split_paths(columns: t.Dict[str, np.ndarray]) -> t.List[np.ndarray]:
+    """Path of every run as a (points, 2) view into path_coordinates."""
+    offsets = columns["path_offsets"]
+    coordinates = columns["path_coordinates"]
+    return [coordinates[offsets[i]:offsets[i + 1]] for i in range(len(offsets) - 1)]
@@ -0,0 +1,196 @@
+import csv
+import hashlib
+import itertools
+import json
+import os
+import tempfile
+
+from core.logger import logger
+from core.algorithm import TIMEOUT
+from maps.maps_manager import MapsManager
+from test_runner.test_runner import TestRunner, RESULT_COLUMNS, RUN_PARAMETERS, ERROR, execute_runner_jobs
+
+# TestRunner arguments a sweep can vary, in the order they appear in cell names and output columns
+SWEEP_PARAMETERS = RUN_PARAMETERS
+
+# step_size is already in RESULT_COLUMNS
+SWEEP_COLUMNS = [*RESULT_COLUMNS, *(parameter for parameter in SWEEP_PARAMETERS if parameter != "step_size")]
+
+# Source the result of a run depends on, hashed into the code version
+CODE_PATHS = ("core", "algorithms", "benchmarks", os.path.join("test_runner", "test_runner.py"))
+
+# Rows that depend on the machine load or the timeout rather than on the key, never cached
+UNCACHED_STATUSES = (TIMEOUT, ERROR)
+
+def code_version(root=None):
+    """Hash of the planner source (CODE_PATHS under root), changes with any edit - committed or not."""
+    root = root or os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    files = []
+    for path in CODE_PATHS:
+        full_path = os.path.join(root, path)
+        if os.path.isfile(full_path):
+            files.append(full_path)
+        for directory, _, names in os.walk(full_path):
+            files.extend(os.path.join(directory, name) for name in names if name.endswith(".py"))
+
+    digest = hashlib.sha256()
+    for file in sorted(files):
+        digest.update(os.path.relpath(file, root).encode())
+        with open(file, "rb") as source:
+            digest.update(source.read())
+    return digest.hexdigest()[:16]
+
+def map_hash(map_config):
+    """Hash of everything of a MapConfig a run depends on."""
+    geometry = [map_config.width, map_config.height, list(map_config.default_start), list(map_config.default_goal),
+                [list(obstacle) for obstacle in map_config.obstacles]]
+    return hashlib.sha256(json.dumps(geometry).encode()).hexdigest()[:16]
+
+def execute_cell_jobs(pending, workers=1):
+    """
+    Run jobs of several TestRunners (cells) together.
+
+    pending holds (runner, job key, tag) with job keys as given by
+    runner.jobs(). Yields (runner, tag, row) in completion order, with
+    workers > 1 up to workers jobs run at a time.
+    """
+    if not pending:
+        return
+    with tempfile.TemporaryDirectory(prefix="compiled_maps_") as directory:
+        # Map geometry does not depend on the cell parameters, compile it once for all cells
+        compiled_maps = pending[0][0].compile_maps(directory)
+        for runner, _, tag, row in execute_runner_jobs(pending, compiled_maps, workers):
+            yield runner, tag, row
+
+class ResultCache:
+    """
+    Result rows of finished runs by cache key, persisted as JSON lines.
+
+    Entries are appended and flushed one by one, so an interrupted sweep
+    keeps everything it finished.
+    """
+
+    def __init__(self, cache_file):
+        self.cache_file = cache_file
+        self.rows = {}
+        if os.path.exists(cache_file):
+            with open(cache_file) as file:
+                for line in file:
+                    try:
+                        entry = json.loads(line)
+                        self.rows[entry["key"]] = entry["row"]
+                    except (ValueError, KeyError):
+                        logger.warning(f"Skipping damaged cache line '{line.strip()}'")
+        os.makedirs(os.path.dirname(cache_file) or ".", exist_ok=True)
+        self._file = open(cache_file, "a")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __contains__(self, key):
+        return key in self.rows
+
+    def get(self, key):
+        """Cached row of key, None if there is none."""
+        row = self.rows.get(key)
+        if row is None:
+            return None
+        # JSON turned the start / goal tuples into lists
+        return [tuple(value) if isinstance(value, list) else value for value in row]
+
+    def put(self, key, row):
+        self.rows[key] = row
+        self._file.write(json.dumps({"key": key, "row": row}) + "\n")
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+class ParameterSweep:
+    """
+    Run every combination of a parameter grid per algorithm on every map.
+
+    grids maps an algorithm name to {parameter: [values]} over
+    SWEEP_PARAMETERS, parameters left out keep the TestRunner default.
+    Every combination (a cell) is a TestRunner, the runs of all cells are
+    scheduled on one pool of workers.
+
+    A run is cached under (code version, algorithm, parameters, map hash,
+    seed). Seeds are derived from the base seed, algorithm, map and run
+    only, so cells share seeds and re-running a sweep with the same seed
+    only executes cells (or runs) that are new, or whose code changed.
+    """
+
+    def __init__(self, grids, maps, runs_per_cell, output_file, seed=0, workers=1, timeout=10, cache_file="test_runner/cache/sweep_cache.jsonl"):
+        for algorithm_name, grid in grids.items():
+            unknown = set(grid) - set(SWEEP_PARAMETERS)
+            if unknown:
+                raise ValueError(f"Cannot sweep {sorted(unknown)} of {algorithm_name}, use some of {SWEEP_PARAMETERS}")
+        if seed is None:
+            raise ValueError("A sweep needs a fixed seed, results of a random one can never be reused")
+        maps_manager = MapsManager()
+        unknown_maps = [map_name for map_name in maps if maps_manager.get_map(map_name) is None]
+        if unknown_maps:
+            raise ValueError(f"Unknown maps {unknown_maps}, use some of {maps_manager.get_map_names()}")
+        self.grids = grids
+        self.maps = maps
+        self.runs_per_cell = runs_per_cell
+        self.output_file = os.path.join('test_runner/results/', output_file)
+        self.seed = seed
+        self.workers = workers
+        self.timeout = timeout
+        self.cache_file = cache_file
+
+    def cells(self):
+        """Every (algorithm_name, parameters) combination of the grids."""
+        for algorithm_name, grid in self.grids.items():
+            names = list(grid)
+            for values in itertools.product(*(grid[name] for name in names)):
+                yield algorithm_name, dict(zip(names, values))
+
+    def cell_runner(self, algorithm_name, parameters):
+        return TestRunner([algorithm_name], self.maps, self.runs_per_cell, os.path.basename(self.output_file),
+                          seed=self.seed, timeout=self.timeout, **parameters)
+
+    def cache_key(self, code, runner, map_name, seed):
+        key = [code, runner.algorithms[0], runner.run_parameters(), map_hash(runner.get_map(map_name)), seed]
+        return hashlib.sha256(json.dumps(key, sort_keys=True).encode()).hexdigest()
+
+    def run(self):
+        """Run the sweep, writing the rows of all cells (cached or not) to output_file. Returns the number of runs executed."""
+        code = code_version()
+        runners = [self.cell_runner(algorithm_name, parameters) for algorithm_name, parameters in self.cells()]
+
+        executed = 0
+        with ResultCache(self.cache_file) as cache, open(self.output_file, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(SWEEP_COLUMNS)
+
+            pending = [] # (runner, job key, cache key)
+            for runner in runners:
+                for job in runner.jobs():
+                    key = self.cache_key(code, runner, job[1], job[3])
+                    if key in cache:
+                        writer.writerow(self.sweep_row(runner, cache.get(key)))
+                    else:
+                        pending.append((runner, job, key))
+            logger.info(f"Sweep of {len(runners)} cells: {len(pending)} runs to execute, "
+                        f"{sum(len(runner.maps) * runner.runs_per_test for runner in runners) - len(pending)} cached")
+
+            for runner, key, row in execute_cell_jobs(pending, self.workers):
+                if row is None:
+                    continue
+                executed += 1
+                if row[RESULT_COLUMNS.index("Status")] not in UNCACHED_STATUSES:
+                    cache.put(key, row)
+                writer.writerow(self.sweep_row(runner, row))
+                file.flush()
+        return executed
+
+    def sweep_row(self, runner, row):
+        """Result row with the parameter columns of its cell appended."""
+        return [*row, *(getattr(runner, parameter) if getattr(runner, parameter) is not None else ""
+                        for parameter in SWEEP_PARAMETERS if parameter != "step_size")]
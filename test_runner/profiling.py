@@ -0,0 +1,143 @@
+import cProfile
+import os
+import pstats
+import re
+import sys
+import threading
+import time
+import typing as t
+from collections import Counter
+
+# cprofile - deterministic, every call is recorded; the collapsed stacks only know the direct caller of a function
+# sampling - the stack of the profiled thread is read periodically, full stacks but statistical
+PROFILERS = ("cprofile", "sampling")
+
+SAMPLING_INTERVAL = 0.001 # Seconds, in practice limited by the GIL switch interval (5 ms by default)
+
+class SamplingProfiler:
+    """
+    Statistical profiler of the thread that calls enable().
+
+    A background thread takes the stack of the profiled thread every
+    interval and counts it, weighted by the time since the previous
+    sample, so stalls of the sampler do not distort the shares. Stacks
+    start at the function that called enable().
+    """
+
+    def __init__(self, interval: float = SAMPLING_INTERVAL):
+        self.interval = interval
+        self.stacks = Counter() # {"outer;...;inner": microseconds}
+        self._thread_id = None
+        self._base_frame = None # Caller of the function that called enable(), stacks stop below it
+        self._sampler = None
+        self._stop = threading.Event()
+
+    def enable(self):
+        self._thread_id = threading.get_ident()
+        self._base_frame = sys._getframe(1).f_back
+        self._stop.clear()
+        self._sampler = threading.Thread(target=self._sample, daemon=True)
+        self._sampler.start()
+
+    def disable(self):
+        self._stop.set()
+        self._sampler.join()
+
+    def _sample(self):
+        last = time.perf_counter()
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            now = time.perf_counter()
+            if frame is None:
+                return
+            stack = []
+            while frame is not None and frame is not self._base_frame:
+                stack.append(frame_name(frame.f_code.co_filename, frame.f_code.co_firstlineno, frame.f_code.co_name))
+                frame = frame.f_back
+            self.stacks[";".join(reversed(stack))] += round((now - last) * 1e6)
+            last = now
+
+def create_profiler(kind: str):
+    """New, not yet enabled profiler of one of PROFILERS."""
+    if kind == "cprofile":
+        return cProfile.Profile()
+    if kind == "sampling":
+        return SamplingProfiler()
+    raise ValueError(f"Unknown profiler '{kind}', use one of {PROFILERS}")
+
+def frame_name(filename: str, line: int, function: str) -> str:
+    """Frame label in collapsed stacks, 'function (file.py:line)'."""
+    if filename == "~": # cProfile built-ins
+        return function
+    return f"{function} ({os.path.basename(filename)}:{line})"
+
+def collapsed_stacks(profiler) -> Counter:
+    """{"outer;...;inner": microseconds} of a finished profiler."""
+    if isinstance(profiler, SamplingProfiler):
+        return Counter(profiler.stacks)
+
+    # cProfile keeps caller -> callee times only, so stacks are two frames deep
+    stacks = Counter()
+    for function, (_, _, own_time, _, callers) in pstats.Stats(profiler).stats.items():
+        name = frame_name(*function)
+        if not callers:
+            stacks[name] += round(own_time * 1e6)
+        for caller, (_, _, caller_own_time, _) in callers.items():
+            stacks[f"{frame_name(*caller)};{name}"] += round(caller_own_time * 1e6)
+    return +stacks # Drop empty stacks
+
+def save_run_profile(profiler, base_path: str):
+    """Write <base_path>.collapsed (and <base_path>.prof for cProfile)."""
+    if isinstance(profiler, cProfile.Profile):
+        profiler.dump_stats(base_path + ".prof")
+    write_collapsed(collapsed_stacks(profiler), base_path + ".collapsed")
+
+def write_collapsed(stacks: Counter, output_file: str):
+    """Collapsed stack format of flamegraph.pl / speedscope / inferno: one 'frame;frame;frame weight' per line."""
+    with open(output_file, "w") as file:
+        for stack, weight in sorted(stacks.items()):
+            file.write(f"{stack} {weight}\n")
+
+def read_collapsed(input_file: str) -> Counter:
+    stacks = Counter()
+    with open(input_file) as file:
+        for line in file:
+            stack, _, weight = line.rstrip("\n").rpartition(" ")
+            stacks[stack] += int(weight)
+    return stacks
+
+def merge_profiles(run_paths: t.List[str], output_path: str) -> Counter:
+    """
+    Merge the run profiles of run_paths (base paths as given to save_run_profile) into output_path.
+
+    The run files are removed, the merged collapsed stacks are returned.
+    """
+    stacks = Counter()
+    prof_files = []
+    for run_path in run_paths:
+        if os.path.exists(run_path + ".collapsed"):
+            stacks.update(read_collapsed(run_path + ".collapsed"))
+            os.remove(run_path + ".collapsed")
+        if os.path.exists(run_path + ".prof"):
+            prof_files.append(run_path + ".prof")
+
+    write_collapsed(stacks, output_path + ".collapsed")
+    if prof_files:
+        pstats.Stats(*prof_files).dump_stats(output_path + ".prof")
+        for prof_file in prof_files:
+            os.remove(prof_file)
+    elif os.path.exists(output_path + ".prof"):
+        os.remove(output_path + ".prof") # Left from an earlier cProfile campaign
+    return stacks
+
+def hotspots(stacks: Counter, top: int = 10) -> t.List[t.Tuple[str, float, float]]:
+    """The top functions by own time (innermost frame of a stack) as (frame, seconds, share of the total)."""
+    own_time = Counter()
+    for stack, weight in stacks.items():
+        own_time[stack.rpartition(";")[2]] += weight
+    total = sum(own_time.values()) or 1
+    return [(frame, weight / 1e6, weight / total) for frame, weight in own_time.most_common(top)]
+
+def profile_name(*parts) -> str:
+    """File name safe join of parts, e.g. ('RRT*', 'Rooms') -> 'RRT___Rooms'."""
+    return "__".join(re.sub(r"[^A-Za-z0-9_.-]+", "_", str(part)) for part in parts)
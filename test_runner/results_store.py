@@ -0,0 +1,249 @@
+import datetime
+import hashlib
+import json
+import os
+import sqlite3
+import subprocess
+import typing as t
+
+import numpy as np
+
+from core.algorithm import PHASES
+
+STORE_EXTENSIONS = (".sqlite", ".db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS campaigns (
+    id INTEGER PRIMARY KEY,
+    started_at TEXT NOT NULL,
+    output_file TEXT,
+    seed INTEGER,
+    code_version TEXT,
+    git_commit TEXT,
+    description TEXT
+);
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    campaign_id INTEGER NOT NULL REFERENCES campaigns(id),
+    algorithm TEXT NOT NULL,
+    map TEXT NOT NULL,
+    run INTEGER NOT NULL,
+    seed INTEGER,
+    params_hash TEXT NOT NULL,
+    parameters TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    job_id INTEGER PRIMARY KEY REFERENCES jobs(id),
+    algorithm_class TEXT,
+    status TEXT NOT NULL,
+    execution_time REAL,
+    path_length REAL,
+    steps INTEGER,
+    start_x REAL,
+    start_y REAL,
+    goal_x REAL,
+    goal_y REAL,
+    step_size REAL,
+    total_time REAL,
+    cpu_time REAL,
+    sampling_time REAL,
+    connection_time REAL,
+    search_time REAL,
+    reconstruction_time REAL,
+    peak_memory INTEGER,
+    path BLOB
+);
+CREATE INDEX IF NOT EXISTS jobs_algorithm_map_params ON jobs (algorithm, map, params_hash);
+CREATE INDEX IF NOT EXISTS jobs_campaign ON jobs (campaign_id);
+"""
+
+# Results columns filled from the CSV columns of the same name (see test_runner.RESULT_COLUMNS)
+METRIC_COLUMNS = {
+    "execution_time": "Execution Time",
+    "path_length": "Path Length",
+    "total_time": "Total Time",
+    "cpu_time": "CPU Time",
+    **{f"{phase}_time": f"{phase.capitalize()} Time" for phase in PHASES},
+}
+
+def params_hash(parameters: t.Dict[str, t.Any]) -> str:
+    """Stable hash of a {parameter: value} dict, the same parameters give the same hash in every campaign."""
+    return hashlib.sha256(json.dumps(parameters, sort_keys=True).encode()).hexdigest()[:16]
+
+def git_commit() -> t.Optional[str]:
+    """Commit of the checkout this code runs from, None outside a git checkout."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=root, capture_output=True, text=True, check=True, timeout=5).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+def path_to_blob(path) -> t.Optional[bytes]:
+    """(points, 2) float64 bytes of a path given as array, list of points or the JSON of the CSV."""
+    if isinstance(path, str):
+        if not path:
+            return None
+        path = json.loads(path)
+    points = np.asarray(path, dtype=np.float64).reshape(-1, 2)
+    return points.tobytes() if len(points) else None
+
+def blob_to_path(blob: t.Optional[bytes]) -> np.ndarray:
+    if blob is None:
+        return np.empty((0, 2))
+    return np.frombuffer(blob, dtype=np.float64).reshape(-1, 2)
+
+def parse_number(value, kind=float):
+    """Number of a result row cell, None when empty."""
+    if value is None or value == "":
+        return None
+    return kind(value)
+
+def parse_point(value) -> t.Tuple[t.Optional[float], t.Optional[float]]:
+    if value is None or value == "":
+        return (None, None)
+    if isinstance(value, str):
+        value = value.strip("()").split(",")
+    return (float(value[0]), float(value[1]))
+
+class ResultsStore:
+    """
+    Results of many campaigns in one SQLite database.
+
+    campaigns - one row per TestRunner campaign (seed, code version, git commit)
+    jobs      - one row per run: algorithm (registry name), map, run, seed and its parameters with their hash
+    results   - metrics of the run, the path as a (points, 2) float64 blob
+
+    Jobs are indexed on (algorithm, map, params_hash), so a pair with
+    given parameters can be compared across campaigns cheaply. Results
+    are added in bulk, one transaction per add_results call.
+    """
+
+    def __init__(self, database_file: str):
+        self.database_file = database_file
+        os.makedirs(os.path.dirname(database_file) or ".", exist_ok=True)
+        self.connection = sqlite3.connect(database_file)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.connection.close()
+
+    def add_campaign(self, seed: int, output_file: str = None, code_version: str = None, description: str = "") -> int:
+        """New campaign, returns its id."""
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO campaigns (started_at, output_file, seed, code_version, git_commit, description) VALUES (?, ?, ?, ?, ?, ?)",
+                (datetime.datetime.now().isoformat(timespec="seconds"), output_file, seed, code_version, git_commit(), description))
+        return cursor.lastrowid
+
+    def find_campaign(self, output_file: str, seed: int) -> t.Optional[int]:
+        """Latest campaign written to output_file with seed (the one a resumed campaign continues), None if there is none."""
+        row = self.connection.execute("SELECT id FROM campaigns WHERE output_file = ? AND seed = ? ORDER BY id DESC LIMIT 1",
+                                      (output_file, seed)).fetchone()
+        return row["id"] if row else None
+
+    def add_results(self, campaign_id: int, results: t.Iterable[t.Tuple[tuple, t.Dict[str, t.Any], t.Dict[str, t.Any]]]) -> int:
+        """
+        Insert finished runs in one transaction, returns how many.
+
+        results holds (job key, parameters, row) with the job key
+        (algorithm_name, map_name, run, seed), the {parameter: value} of the
+        run and the result row as a {CSV column: value} dict.
+        """
+        count = 0
+        with self.connection:
+            for (algorithm_name, map_name, run, seed), parameters, row in results:
+                cursor = self.connection.execute(
+                    "INSERT INTO jobs (campaign_id, algorithm, map, run, seed, params_hash, parameters) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (campaign_id, algorithm_name, map_name, run, seed, params_hash(parameters), json.dumps(parameters, sort_keys=True)))
+                start_x, start_y = parse_point(row.get("start_node"))
+                goal_x, goal_y = parse_point(row.get("goal_node"))
+                self.connection.execute(
+                    f"INSERT INTO results (job_id, algorithm_class, status, steps, start_x, start_y, goal_x, goal_y, step_size, peak_memory, path, "
+                    f"{', '.join(METRIC_COLUMNS)}) VALUES ({', '.join('?' * (11 + len(METRIC_COLUMNS)))})",
+                    (cursor.lastrowid, row.get("Algorithm"), row.get("Status"), parse_number(row.get("Steps"), int),
+                     start_x, start_y, goal_x, goal_y, parse_number(row.get("step_size")), parse_number(row.get("Peak Memory"), int),
+                     path_to_blob(row.get("Path", "")), *(parse_number(row.get(column)) for column in METRIC_COLUMNS.values())))
+                count += 1
+        return count
+
+    def job_keys(self, campaign_id: int) -> t.Set[tuple]:
+        """Job keys (algorithm_name, map_name, run, seed) stored for a campaign."""
+        rows = self.connection.execute("SELECT algorithm, map, run, seed FROM jobs WHERE campaign_id = ?", (campaign_id,))
+        return {tuple(row) for row in rows}
+
+    def campaigns(self) -> t.List[t.Dict[str, t.Any]]:
+        return [dict(row) for row in self.connection.execute("SELECT * FROM campaigns ORDER BY id")]
+
+    def latest_campaign_id(self) -> t.Optional[int]:
+        row = self.connection.execute("SELECT MAX(id) AS id FROM campaigns").fetchone()
+        return row["id"]
+
+    def query(self,
+              algorithms: t.Optional[t.Sequence[str]] = None,
+              maps: t.Optional[t.Sequence[str]] = None,
+              campaign_id: t.Optional[t.Union[int, str]] = None,
+              params_hash: t.Optional[str] = None,
+              git_commit: t.Optional[str] = None,
+              status: t.Optional[str] = None) -> t.List[t.Dict[str, t.Any]]:
+        """
+        Runs matching every given filter, as dicts with the CSV column names (see test_runner.RESULT_COLUMNS).
+
+        algorithms are registry names (as given to TestRunner), campaign_id
+        may be "latest". Rows also hold Campaign, Run, Git Commit and Params
+        Hash, Path is a (points, 2) array and start_node / goal_node are tuples.
+        """
+        conditions, values = [], []
+        if algorithms is not None:
+            conditions.append(f"jobs.algorithm IN ({', '.join('?' * len(algorithms))})")
+            values.extend(algorithms)
+        if maps is not None:
+            conditions.append(f"jobs.map IN ({', '.join('?' * len(maps))})")
+            values.extend(maps)
+        if campaign_id is not None:
+            conditions.append("jobs.campaign_id = ?")
+            values.append(self.latest_campaign_id() if campaign_id == "latest" else campaign_id)
+        if params_hash is not None:
+            conditions.append("jobs.params_hash = ?")
+            values.append(params_hash)
+        if git_commit is not None:
+            conditions.append("campaigns.git_commit = ?")
+            values.append(git_commit)
+        if status is not None:
+            conditions.append("results.status = ?")
+            values.append(status)
+
+        sql = ("SELECT jobs.*, results.*, campaigns.git_commit FROM results "
+               "JOIN jobs ON jobs.id = results.job_id JOIN campaigns ON campaigns.id = jobs.campaign_id")
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY jobs.id"
+        return [self.result_row(row) for row in self.connection.execute(sql, values)]
+
+    def result_row(self, row: sqlite3.Row) -> t.Dict[str, t.Any]:
+        return {
+            "Algorithm": row["algorithm_class"],
+            "Map": row["map"],
+            "Status": row["status"],
+            "Execution Time": row["execution_time"],
+            "Path Length": row["path_length"],
+            "Steps": row["steps"],
+            "start_node": (row["start_x"], row["start_y"]),
+            "goal_node": (row["goal_x"], row["goal_y"]),
+            "step_size": row["step_size"],
+            "seed": row["seed"],
+            **{column: row[name] for name, column in METRIC_COLUMNS.items() if column not in ("Execution Time", "Path Length")},
+            "Peak Memory": row["peak_memory"],
+            "Path": blob_to_path(row["path"]),
+            "Campaign": row["campaign_id"],
+            "Run": row["run"],
+            "Git Commit": row["git_commit"],
+            "Params Hash": row["params_hash"],
+        }
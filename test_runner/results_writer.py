@@ -0,0 +1,95 @@
+import csv
+import json
+import os
+
+from core.logger import logger
+from core.random_stream import new_base_seed
+
+class ResultsWriter:
+    """Results CSV written row by row, with a checkpoint of finished jobs next to it.
+
+    Every row is flushed as soon as it is written and its job key
+    (algorithm_name, map_name, run, seed) is appended to
+    <output_file>.checkpoint, so a crashed campaign keeps all finished runs.
+    With resume the checkpoint is read back: completed holds the finished
+    keys and the campaign base seed is taken over from the checkpoint.
+    Otherwise seed None picks a fresh base seed.
+    """
+
+    def __init__(self, output_file, columns, seed, resume=False):
+        self.output_file = output_file
+        self.checkpoint_file = output_file + ".checkpoint"
+        self.columns = columns
+        self.seed = seed
+        self.completed = set()
+
+        resuming = resume and os.path.exists(self.checkpoint_file) and os.path.exists(self.output_file)
+        if resuming:
+            self.read_checkpoint()
+            self.keep_completed_rows()
+            logger.info(f"Resuming {self.output_file}: {len(self.completed)} runs already done")
+        elif self.seed is None:
+            self.seed = new_base_seed()
+
+        self._file = open(self.output_file, "a" if resuming else "w", newline="")
+        self._writer = csv.writer(self._file)
+        self._checkpoint = open(self.checkpoint_file, "a" if resuming else "w")
+        if not resuming:
+            self._writer.writerow(columns)
+            self._checkpoint.write(json.dumps({"seed": self.seed}) + "\n")
+            self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def write(self, key, row):
+        """Write the row of a finished job and mark the job as done."""
+        self._writer.writerow(row)
+        self._file.flush()
+        # Row first - a crash in between re-runs the job, it never loses it
+        self._checkpoint.write(json.dumps(list(key)) + "\n")
+        self._checkpoint.flush()
+        self.completed.add(tuple(key))
+
+    def flush(self):
+        self._file.flush()
+        self._checkpoint.flush()
+
+    def close(self):
+        self._file.close()
+        self._checkpoint.close()
+
+    def read_checkpoint(self):
+        with open(self.checkpoint_file) as file:
+            lines = file.read().splitlines()
+        header = json.loads(lines[0])
+        if self.seed is not None and self.seed != header["seed"]:
+            raise ValueError(f"Cannot resume {self.output_file}: it was run with seed {header['seed']}, not {self.seed}")
+        self.seed = header["seed"]
+
+        for line in lines[1:]:
+            try:
+                self.completed.add(tuple(json.loads(line)))
+            except ValueError:
+                logger.warning(f"Skipping damaged checkpoint line '{line}'")
+
+    def keep_completed_rows(self):
+        """Rewrite the results without rows of jobs that are not in the checkpoint (or were cut off)."""
+        done = {(map_name, seed) for _, map_name, _, seed in self.completed}
+        map_column = self.columns.index("Map")
+        seed_column = self.columns.index("seed")
+
+        with open(self.output_file, newline="") as file:
+            rows = list(csv.reader(file))[1:]
+        kept = [row for row in rows
+                if len(row) == len(self.columns) and (row[map_column], int(row[seed_column] or -1)) in done]
+
+        temporary_file = self.output_file + ".tmp"
+        with open(temporary_file, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(self.columns)
+            writer.writerows(kept)
+        os.replace(temporary_file, self.output_file)
@@ -1,4 +1,5 @@
 import os
+import json
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
@@ -6,24 +7,76 @@ from maps.maps_manager import MapsManager
 from matplotlib.patches import Rectangle
 import numpy as np
 from core.logger import logger
+from test_runner.columnar_results import read_columnar, split_paths
+from test_runner.results_store import ResultsStore, STORE_EXTENSIONS
 
 RESULTS_DIR = 'test_runner/results/'
 
 class TestAnalyser:
-    def __init__(self, filename):
-        self.filepath = os.path.join(RESULTS_DIR, filename)
-        self.data = pd.read_csv(self.filepath)
+    def __init__(self, filename, **query):
+        """
+        filename is in RESULTS_DIR, except a results store (.sqlite / .db) which is a path of its own as it outlives
+        the results directory. query filters the runs of the store, see ResultsStore.query - e.g. campaign_id="latest".
+        """
+        self.filepath = filename if filename.endswith(STORE_EXTENSIONS) else os.path.join(RESULTS_DIR, filename)
+        if filename.endswith(".csv"):
+            data = pd.read_csv(self.filepath)
+        elif filename.endswith(STORE_EXTENSIONS):
+            with ResultsStore(self.filepath) as store:
+                data = pd.DataFrame(store.query(**query))
+        else:
+            data = self.read_columnar_frame(self.filepath)
+        if 'Status' in data.columns:
+            # Timed out / failed runs have no time, length or path to analyse
+            unsolved = data[data['Status'] != 'solved']
+            if len(unsolved):
+                logger.warning(f"{len(unsolved)} of {len(data)} runs were not solved, leaving them out of the analysis")
+            data = data[data['Status'] == 'solved']
+        self.data = data
         self.maps_manager = MapsManager()
 
+    def read_columnar_frame(self, filepath):
+        """Columnar results (.parquet / .npz) as a frame with the same columns as the CSV, paths are (points, 2) arrays."""
+        columns = read_columnar(filepath)
+        return pd.DataFrame({
+            'Algorithm': columns['algorithm'],
+            'Map': columns['map'],
+            'Status': columns['status'],
+            'Execution Time': columns['execution_time'],
+            'Path Length': columns['path_length'],
+            'Steps': columns['steps'],
+            'start_node': list(zip(columns['start_x'], columns['start_y'])),
+            'goal_node': list(zip(columns['goal_x'], columns['goal_y'])),
+            'step_size': columns['step_size'],
+            'seed': columns['seed'],
+            'Total Time': columns['total_time'],
+            'CPU Time': columns['cpu_time'],
+            'Sampling Time': columns['sampling_time'],
+            'Connection Time': columns['connection_time'],
+            'Search Time': columns['search_time'],
+            'Reconstruction Time': columns['reconstruction_time'],
+            'Peak Memory': np.where(columns['peak_memory'] >= 0, columns['peak_memory'], np.nan),
+            'Path': split_paths(columns),
+        })
+
+    def path_points(self, path):
+        """Points of a Path cell - a JSON string from the CSV or an array from columnar results."""
+        return json.loads(path) if isinstance(path, str) else path
+
     def generate_comparison_table(self):
-        summary = self.data.groupby(['Algorithm', 'Map']).agg(
+        aggregations = dict(
             mean_time=('Execution Time', 'mean'),
             var_time=('Execution Time', 'var'),
             mean_length=('Path Length', 'mean'),
             var_length=('Path Length', 'var'),
             mean_steps=('Steps', 'mean'),
             var_steps=('Steps', 'var')
-        ).reset_index()
+        )
+        # End-to-end cost (e.g. PRM roadmap construction), only in results with phase timing
+        for column in ('Total Time', 'Sampling Time', 'Connection Time', 'Search Time', 'Reconstruction Time'):
+            if column in self.data.columns:
+                aggregations['mean_' + column.lower().replace(' ', '_')] = (column, 'mean')
+        summary = self.data.groupby(['Algorithm', 'Map']).agg(**aggregations).reset_index()
 
         print("\n=== Comparison Table ===")
         print(summary)
@@ -60,7 +113,7 @@ class TestAnalyser:
                     logger.warning(f"Problem with map {map_name} or start/goal/step_size data")
 
                 for path in subset['Path']:
-                    points = eval(path)
+                    points = self.path_points(path)
                     xs, ys = zip(*points)
                     all_x.extend(xs)
                     all_y.extend(ys)
@@ -93,7 +146,7 @@ class TestAnalyser:
 
                 # Step 1: Build density grid
                 for path in subset['Path']:
-                    points = eval(path)
+                    points = self.path_points(path)
                     for x, y in points:
                         x_idx = int(x)
                         y_idx = int(y)
@@ -117,7 +170,7 @@ class TestAnalyser:
                 alpha = np.clip(1 / len(subset), 0.1, 0.6)  # Ensure alpha range is valid
 
                 for path in subset['Path']:
-                    points = eval(path)
+                    points = self.path_points(path)
                     xs, ys = zip(*points)
                     plt.plot(xs, ys, color='blue', alpha=alpha, linewidth=1.2)
 
@@ -1,32 +1,176 @@
 import csv
+import math
+import multiprocessing
 import os
+import tempfile
 import time
+import tracemalloc
+from multiprocessing.connection import wait
+try:
+    import resource # CPU time limits, POSIX only
+except ImportError:
+    resource = None
 from core.logger import logger
 from core.map import Map
+from core.compiled_map import CompiledMap
 from core.node import TreeNode
 import json
 from algorithms.algorithm_manager import AlgorithmManager
 from benchmarks.benchmark_manager import BenchmarkManager
+from core.random_stream import derive_seed
+from core.algorithm import SOLVED, TIMEOUT, PHASES
+from core.sampling import SAMPLING_MODES
+from algorithms.algorithms_implementations.prm import CONNECTION_STRATEGIES
+from test_runner.results_writer import ResultsWriter
+from test_runner.columnar_results import read_csv_columns, write_columnar
+from test_runner.adaptive_runs import AdaptiveScheduler
+from test_runner.profiling import PROFILERS, create_profiler, save_run_profile, merge_profiles, hotspots, profile_name
+from test_runner.results_store import ResultsStore
 
+ERROR = "error" # Run crashed, see the log of the worker
+
+PHASE_COLUMNS = [f"{phase.capitalize()} Time" for phase in PHASES]
+
+RESULT_COLUMNS = ["Algorithm", "Map", "Status", "Execution Time", "Path Length", "Steps", "start_node", "goal_node", "step_size", "seed",
+                  "Total Time", "CPU Time", *PHASE_COLUMNS, "Peak Memory", "Path"]
+
+# Planner parameters of a run, hashed into the params hash of the results store (and varied by parameter sweeps)
+RUN_PARAMETERS = ("step_size", "num_samples_excluding_grid", "radius_as_step_size_multiplication", "connection_strategy", "sampling_mode", "goal_bias")
+
+STORE_BATCH_SIZE = 100 # Rows inserted into the results store per transaction
+
+TIMEOUT_GRACE = 2 # Seconds the supervisor waits past the timeout before killing a worker
+
+# Columns the number of runs can be adapted to, see ci_target
+ADAPTIVE_METRICS = ("Execution Time", "Total Time", "CPU Time", "Path Length", "Steps")
+
+def execute_runner_jobs(pending, compiled_maps, workers=1, profiled=False):
+    """
+    Run jobs of one or more TestRunners serially or up to workers at a time.
+
+    pending holds (runner, job key, tag) with job keys as given by
+    runner.jobs(), compiled_maps (see TestRunner.compile_maps) are shared by
+    all of them. Yields (runner, job key, tag, row) in completion order. With
+    profiled the jobs save a profile to runner.profile_path(job key).
+
+    Every job gets its own worker process started from this one (see
+    TestRunner.start_worker), so the CPU time limit and the wall time kill
+    apply to the process that runs the planner.
+    """
+    def profile_path(runner, key):
+        return runner.profile_path(key) if profiled else None
+
+    if workers <= 1:
+        for runner, key, tag in pending:
+            algorithm_name, map_name, run, seed = key
+            logger.info(f"Running {algorithm_name} on {map_name} (Run {run + 1}/{runner.runs_per_test})")
+            yield runner, key, tag, runner.run_supervised(algorithm_name, map_name, seed, compiled_maps.get(map_name), profile_path(runner, key))
+        return
+
+    logger.info(f"Running jobs on {workers} workers")
+    pending = iter(pending)
+    running = {} # receiver -> (runner, job key, tag, worker, deadline)
+    while True:
+        while len(running) < workers:
+            job = next(pending, None)
+            if job is None:
+                break
+            runner, key, tag = job
+            algorithm_name, map_name, _, seed = key
+            try:
+                worker, receiver = runner.start_worker(algorithm_name, map_name, seed, compiled_maps.get(map_name), profile_path(runner, key))
+            except Exception as e:
+                logger.error(f"Job {algorithm_name} on {map_name} failed: {e}")
+                yield runner, key, tag, runner.failed_row(algorithm_name, map_name, ERROR, seed)
+                continue
+            running[receiver] = (runner, key, tag, worker, time.monotonic() + runner.timeout + TIMEOUT_GRACE)
+        if not running:
+            return
+
+        # A receiver is ready once its worker sent its row or died, workers past their deadline are killed
+        ready = wait(list(running), timeout=max(0, min(job[4] for job in running.values()) - time.monotonic()))
+        now = time.monotonic()
+        for receiver in [receiver for receiver, job in running.items() if receiver in ready or job[4] <= now]:
+            runner, key, tag, worker, _ = running.pop(receiver)
+            algorithm_name, map_name, _, seed = key
+            yield runner, key, tag, runner.collect_worker(worker, receiver, algorithm_name, map_name, seed)
 
 class TestRunner:
-    def __init__(self, algorithms, maps, runs_per_test, output_file, step_size=5, num_samples_excluding_grid=100, radius_as_step_size_multiplication=2):
+    def __init__(self, algorithms, maps, runs_per_test, output_file, step_size=5, num_samples_excluding_grid=100, radius_as_step_size_multiplication=2, connection_strategy=None, sampling_mode=None, goal_bias=None, seed=None, timeout=10, workers=1, resume=False, clear_results=False, output_format="csv", track_memory=False, profile=None, profile_runs=1, profile_top=10, ci_target=None, ci_metric="Execution Time", min_runs=10, store_file=None):
         self.algorithms = algorithms
         self.maps = maps
         self.runs_per_test = runs_per_test
         self.output_file = os.path.join('test_runner/results/', output_file)
         self.step_size = step_size
         self.algorithm_manager = AlgorithmManager()
-        self.benchmark_manager = BenchmarkManager()
 
         # Parameters for PRM
         self.num_samples_excluding_grid = num_samples_excluding_grid
         self.radius_as_step_size_multiplication = radius_as_step_size_multiplication
+        # Both are set on the algorithm after it is built, so they are checked here
+        if connection_strategy is not None and connection_strategy not in CONNECTION_STRATEGIES:
+            raise ValueError(f"Unknown connection strategy '{connection_strategy}', use one of {CONNECTION_STRATEGIES}")
+        if sampling_mode is not None and sampling_mode not in SAMPLING_MODES:
+            raise ValueError(f"Unknown sampling mode '{sampling_mode}', use one of {SAMPLING_MODES}")
+        self.connection_strategy = connection_strategy # None keeps the algorithm default
+        self.sampling_mode = sampling_mode # None keeps the algorithm default, see core.sampling.SAMPLING_MODES
+        self.goal_bias = goal_bias # Probability of sampling the goal, None keeps the algorithm default (algorithms without one ignore it)
+
+        # Every (algorithm, map, run) gets its own seed derived from this one, so any run can be repeated.
+        # None picks a fresh one in run_tests (or takes the one of the resumed campaign)
+        self.seed = seed
+
+        # Every run gets its own worker process, killed once it is over this many seconds of wall or CPU time
+        self.timeout = timeout
+
+        # Number of runs executed at the same time, each in its own process
+        self.workers = workers
+
+        # "csv" or "columnar" - the CSV is also converted to Parquet / .npz when the campaign is done
+        if output_format not in ("csv", "columnar"):
+            raise ValueError(f"Unknown output format '{output_format}', use 'csv' or 'columnar'")
+        self.output_format = output_format
+
+        # Record peak memory of every run with tracemalloc (slows the runs down noticeably)
+        self.track_memory = track_memory
+
+        # Profile the first profile_runs runs of every algorithm-map pair with "cprofile" or "sampling" (None disables it).
+        # They are run again once the campaign is done and their rows are dropped, so profiler overhead never gets
+        # into the results. Profiles are merged per pair into results/profiles/<algorithm>__<map>.prof / .collapsed,
+        # the profile_top hotspots of every pair are logged at the end of the campaign
+        if profile is not None and profile not in PROFILERS:
+            raise ValueError(f"Unknown profiler '{profile}', use one of {PROFILERS}")
+        self.profile = profile
+        self.profile_runs = profile_runs
+        self.profile_top = profile_top
+        self.profile_dir = os.path.join(os.path.dirname(self.output_file), "profiles")
+
+        # Adaptive number of runs: with ci_target every algorithm-map pair gets min_runs runs and then more until the
+        # 95 % confidence interval of the ci_metric mean is narrower than ci_target times the mean (0.1 is +-5 %).
+        # runs_per_test is the cap. None runs exactly runs_per_test, see adaptive_runs.AdaptiveScheduler
+        if ci_metric not in ADAPTIVE_METRICS:
+            raise ValueError(f"Cannot adapt runs to '{ci_metric}', use one of {ADAPTIVE_METRICS}")
+        self.ci_target = ci_target
+        self.ci_metric = ci_metric
+        self.min_runs = min_runs
+
+        # SQLite database the results are also added to as a new campaign, kept across campaigns (None disables it).
+        # See results_store.ResultsStore, TestAnalyser reads it directly
+        self.store_file = store_file
+
+        # Continue the campaign in output_file, skipping runs its checkpoint lists as done
+        if resume and clear_results:
+            raise ValueError("Cannot resume a campaign and clear its results, use one of resume and clear_results")
+        self.resume = resume
 
         # Ensure results directory exists
         os.makedirs(os.path.dirname(self.output_file), exist_ok=True)
-        
-        # Clear results directory (all files)
+
+        if clear_results:
+            self.clear_results()
+
+    def clear_results(self):
+        """Delete every file in the results directory."""
         for file in os.listdir(os.path.dirname(self.output_file)):
             file_path = os.path.join(os.path.dirname(self.output_file), file)
             try:
@@ -36,87 +180,345 @@ class TestRunner:
                 logger.error(f"Error deleting file {file_path}: {e}")
 
     def run_tests(self):
-        logger.info(f"Starting tests: {self.runs_per_test} runs per algorithm-map pair")
-        with open(self.output_file, mode='w', newline='') as file:
-            writer = csv.writer(file)
-            writer.writerow(["Algorithm", "Map", "Execution Time", "Path Length", "Steps", "start_node", "goal_node", "step_size", "Path"])
-
-            for map_name in self.maps:
-                for algorithm_name in self.algorithms:
-                    for run in range(self.runs_per_test):
-                        logger.info(f"Running {algorithm_name} on {map_name} (Run {run + 1}/{self.runs_per_test})")
-                        result = self.run_single_test(algorithm_name, map_name)
-                        if result:
-                            try:
-                                writer.writerow([
-                                    result.algorithm_name,
-                                    map_name,
-                                    f"{result.execution_time:.4f}",
-                                    f"{result.path_length:.2f}",
-                                    result.steps,
-                                    (result.start_point.x, result.start_point.y),
-                                    (result.goal_point.x, result.goal_point.y),
-                                    result.step_size,
-                                    self.serialize_path(result.path)
-                                ])
-                            except Exception as e:
-                                logger.error(f"Error writing to file: {e}, for {algorithm_name} on {map_name}")
-
-                        self.reset_environment()
-
-    def run_single_test(self, algorithm_name, map_name):
-        map_config = self.get_map(map_name)
-        if not map_config:
-            logger.warning(f"Map '{map_name}' not found.")
-            return None
-        
-        map_instance = Map(map_config.width, map_config.height)
+        with ResultsWriter(self.output_file, RESULT_COLUMNS, self.seed, self.resume) as results:
+            # Fresh seed, or the one a resumed campaign was started with
+            self.seed = results.seed
+            if self.ci_target is None:
+                logger.info(f"Starting tests: {self.runs_per_test} runs per algorithm-map pair, base seed {self.seed}")
+                finished_jobs = self.run_jobs(skip=results.completed)
+            else:
+                logger.info(f"Starting tests: {self.min_runs} to {self.runs_per_test} runs per algorithm-map pair "
+                            f"(target {self.ci_metric} CI width {self.ci_target:.1%}), base seed {self.seed}")
+                finished_jobs = self.run_adaptive_jobs(results.completed)
+
+            store, campaign_id = self.open_store(results.completed)
+            stored = []
+
+            # This process is the only writer, workers just return rows
+            try:
+                for key, row in finished_jobs:
+                    if row:
+                        try:
+                            results.write(key, row)
+                        except Exception as e:
+                            logger.error(f"Error writing to file: {e}, for {key[0]} on {key[1]}")
+                        if store is not None:
+                            stored.append((key, self.run_parameters(), dict(zip(RESULT_COLUMNS, row))))
+                            if len(stored) >= STORE_BATCH_SIZE:
+                                store.add_results(campaign_id, stored)
+                                stored = []
+            finally:
+                # Also when interrupted, rows that made it into the checkpoint must make it into the store
+                if store is not None:
+                    store.add_results(campaign_id, stored)
+                    store.close()
+                    logger.info(f"Results stored as campaign {campaign_id} in {self.store_file}")
+
+        if self.output_format == "columnar":
+            columnar_file = write_columnar(read_csv_columns(self.output_file), os.path.splitext(self.output_file)[0])
+            logger.info(f"Columnar results saved to {columnar_file}")
+
+        if self.profile is not None:
+            self.run_profiled_jobs()
+            self.summarize_profiles()
+
+    def open_store(self, completed=()):
+        """
+        (ResultsStore, campaign id) the rows of this campaign go to, (None, None) without a store_file.
+
+        Completed jobs (a resumed campaign) missing from the store, e.g. after
+        a crash before their batch was stored, are added from output_file.
+        """
+        if self.store_file is None:
+            return None, None
+        from test_runner.parameter_sweep import code_version # parameter_sweep imports this module
+
+        store = ResultsStore(self.store_file)
+        campaign_id = store.find_campaign(self.output_file, self.seed) if self.resume else None
+        if campaign_id is None:
+            campaign_id = store.add_campaign(self.seed, self.output_file, code_version())
+
+        stored_keys = store.job_keys(campaign_id)
+        missing = [(key, self.run_parameters(), dict(zip(RESULT_COLUMNS, row)))
+                   for key, row in self.completed_rows([key for key in completed if key not in stored_keys])]
+        if missing:
+            store.add_results(campaign_id, missing)
+            logger.info(f"Added {len(missing)} completed runs missing from campaign {campaign_id} to {self.store_file}")
+        return store, campaign_id
+
+    def run_parameters(self):
+        """{parameter: value} of RUN_PARAMETERS, None where the algorithm default is kept."""
+        return {parameter: getattr(self, parameter) for parameter in RUN_PARAMETERS}
+
+    def jobs(self, skip=()):
+        """All runs of the campaign as (algorithm_name, map_name, run, seed), except the keys in skip."""
+        for map_name in self.maps:
+            for algorithm_name in self.algorithms:
+                for run in range(self.runs_per_test):
+                    key = (algorithm_name, map_name, run, derive_seed(self.seed, algorithm_name, map_name, run))
+                    if key not in skip:
+                        yield key
+
+    def run_jobs(self, skip=()):
+        """
+        Run all jobs not in skip, yielding (job key, row) in completion order.
+
+        Maps are compiled once up front (see compile_maps). With workers > 1
+        the jobs are spread over a process pool. Seeds depend only on the
+        job, so results do not depend on the number of workers.
+        """
+        with tempfile.TemporaryDirectory(prefix="compiled_maps_") as directory:
+            compiled_maps = self.compile_maps(directory)
+            yield from self.execute_jobs(self.jobs(skip), compiled_maps)
+
+    def run_adaptive_jobs(self, completed=()):
+        """
+        Like run_jobs, but the jobs come in rounds from an AdaptiveScheduler fed with the results.
+
+        Results of completed jobs (a resumed campaign) are read back from
+        output_file, so they count towards the confidence intervals.
+        """
+        scheduler = AdaptiveScheduler(self.algorithms, self.maps, self.seed, self.ci_target, self.min_runs, self.runs_per_test)
+        for key, row in self.completed_rows(completed):
+            scheduler.add(key, self.metric_value(row))
+
+        with tempfile.TemporaryDirectory(prefix="compiled_maps_") as directory:
+            compiled_maps = self.compile_maps(directory)
+            batch = scheduler.next_batch()
+            while batch:
+                for key, row in self.execute_jobs(batch, compiled_maps):
+                    scheduler.add(key, self.metric_value(row) if row else None)
+                    yield key, row
+                batch = scheduler.next_batch()
+        scheduler.log_summary(self.ci_metric)
+
+    def completed_rows(self, completed):
+        """(job key, row) of the completed jobs that have a row in output_file."""
+        if not completed or not os.path.exists(self.output_file):
+            return []
+        with open(self.output_file, newline="") as file:
+            rows = {(row["Map"], int(row["seed"] or -1)): [row[column] for column in RESULT_COLUMNS] for row in csv.DictReader(file)}
+        return [(key, rows[(key[1], key[3])]) for key in completed if (key[1], key[3]) in rows]
+
+    def metric_value(self, row):
+        """ci_metric of a result row, None if the run has none (not solved)."""
+        value = row[RESULT_COLUMNS.index(self.ci_metric)]
+        return float(value) if value not in ("", None) else None
+
+    def run_profiled_jobs(self):
+        """Run the profiled jobs (see profile_path) again with the profiler on, their rows are dropped."""
+        jobs = [key for key in self.jobs() if self.profile_path(key) is not None]
+        logger.info(f"Profiling {len(jobs)} runs with {self.profile}")
+        with tempfile.TemporaryDirectory(prefix="compiled_maps_") as directory:
+            compiled_maps = self.compile_maps(directory)
+            for _ in self.execute_jobs(jobs, compiled_maps, profiled=True):
+                pass
+
+    def execute_jobs(self, jobs, compiled_maps, profiled=False):
+        """
+        Run jobs (keys as given by jobs()) serially or on the pool, yielding (job key, row) in completion order.
+
+        With profiled the jobs save a profile to their profile_path.
+        """
+        for _, key, _, row in execute_runner_jobs(((self, key, None) for key in jobs), compiled_maps, self.workers, profiled):
+            yield key, row
+
+    def compile_maps(self, directory):
+        """Publish every map of the campaign once, jobs only memory-map the result."""
+        compiled_maps = {}
+        for map_name in self.maps:
+            map_config = self.get_map(map_name)
+            if map_config:
+                compiled_maps[map_name] = CompiledMap.publish(self.build_map(map_config, map_name), os.path.join(directory, map_name))
+        return compiled_maps
+
+    def build_map(self, map_config, map_name=None):
+        map_instance = Map(map_config.width, map_config.height, name=map_name)
         for obs in map_config.obstacles:
             map_instance.add_obstacle(*obs)
 
         map_instance.set_start(*map_config.default_start)
         map_instance.set_goal(*map_config.default_goal)
+        return map_instance
+
+    def profile_path(self, key):
+        """Base path the run profile of a job is saved to, None if the job is not profiled."""
+        algorithm_name, map_name, run, _ = key
+        if self.profile is None or run >= self.profile_runs:
+            return None
+        os.makedirs(self.profile_dir, exist_ok=True)
+        return os.path.join(self.profile_dir, profile_name(algorithm_name, map_name, f"run{run}"))
+
+    def summarize_profiles(self):
+        """Merge the run profiles of every algorithm-map pair and log its hotspots."""
+        for map_name in self.maps:
+            for algorithm_name in self.algorithms:
+                run_paths = [self.profile_path((algorithm_name, map_name, run, None)) for run in range(min(self.profile_runs, self.runs_per_test))]
+                if not any(os.path.exists(run_path + ".collapsed") for run_path in run_paths):
+                    continue # All profiled runs were killed
+                output_path = os.path.join(self.profile_dir, profile_name(algorithm_name, map_name))
+                stacks = merge_profiles(run_paths, output_path)
+                logger.info(f"Hotspots of {algorithm_name} on {map_name} ({self.profile}, profile in {output_path}.*):")
+                for rank, (frame, seconds, share) in enumerate(hotspots(stacks, self.profile_top), 1):
+                    logger.info(f"  {rank:2}. {share:6.1%} {seconds:8.4f}s  {frame}")
 
+    def run_supervised(self, algorithm_name, map_name, seed=None, compiled_map=None, profile_path=None):
+        """
+        Run a single test in a separate worker process and return its result row.
+
+        The worker gets a CPU time limit and the supervisor kills it once the
+        wall time is over, so a single long step() (e.g. PRM roadmap
+        construction) cannot stall the campaign. Killed runs are recorded as
+        TIMEOUT rows.
+        """
+        worker, receiver = self.start_worker(algorithm_name, map_name, seed, compiled_map, profile_path)
+        receiver.poll(self.timeout + TIMEOUT_GRACE)
+        return self.collect_worker(worker, receiver, algorithm_name, map_name, seed)
+
+    def start_worker(self, algorithm_name, map_name, seed=None, compiled_map=None, profile_path=None):
+        """Start the worker process of a single test, returns it with the receiving end of its result pipe."""
+        receiver, sender = multiprocessing.Pipe(duplex=False)
+        worker = multiprocessing.Process(target=self._run_in_worker, args=(algorithm_name, map_name, seed, compiled_map, profile_path, sender))
+        worker.start()
+        sender.close()
+        return worker, receiver
+
+    def collect_worker(self, worker, receiver, algorithm_name, map_name, seed=None):
+        """Result row of a worker started by start_worker, killing it if it is still running (a TIMEOUT row then)."""
+        row = None
+        if receiver.poll():
+            try:
+                row = receiver.recv()
+            except EOFError:
+                pass # Worker died without a result, e.g. killed by the CPU time limit
+        if worker.is_alive():
+            worker.kill()
+        worker.join()
+        receiver.close()
+
+        if row is None:
+            logger.warning(f"Worker for {algorithm_name} on {map_name} killed after {self.timeout}s (exit code {worker.exitcode})")
+            row = self.failed_row(algorithm_name, map_name, TIMEOUT, seed)
+        return row
+
+    def _run_in_worker(self, algorithm_name, map_name, seed, compiled_map, profile_path, sender):
+        if resource is not None:
+            _, hard_limit = resource.getrlimit(resource.RLIMIT_CPU)
+            cpu_limit = math.ceil(self.timeout) + 1
+            if hard_limit != resource.RLIM_INFINITY:
+                cpu_limit = min(cpu_limit, hard_limit)
+            resource.setrlimit(resource.RLIMIT_CPU, (cpu_limit, hard_limit))
+        try:
+            row = self.run_single_test(algorithm_name, map_name, seed, compiled_map, profile_path)
+        except Exception as e:
+            logger.error(f"{algorithm_name} on {map_name} crashed: {e}")
+            row = self.failed_row(algorithm_name, map_name, ERROR, seed)
+        if row is None: # Unknown algorithm or map, a config error and not a timeout
+            row = self.failed_row(algorithm_name, map_name, ERROR, seed)
+        sender.send(row)
+        sender.close()
+
+    def run_single_test(self, algorithm_name, map_name, seed=None, compiled_map=None, profile_path=None):
+        """
+        Run a single test in this process, returns its result row or None if the map or algorithm is unknown.
+
+        With compiled_map (see compile_maps) the map is attached to instead of being built from its config.
+        With profile_path the run is profiled with self.profile and the profile saved there (see profiling.save_run_profile).
+        """
+        if compiled_map is not None:
+            map_instance = compiled_map.load()
+        else:
+            map_config = self.get_map(map_name)
+            if not map_config:
+                logger.warning(f"Map '{map_name}' not found.")
+                return None
+            map_instance = self.build_map(map_config, map_name)
+
+        # Fresh manager for every run, get_last_result can only see this run
+        benchmark_manager = BenchmarkManager()
+        # Campaigns set their parameters explicitly, tuned per-map defaults would make results depend on the tuning file
         algorithm = self.algorithm_manager.get_algorithm(
             algorithm_name,
             map_instance,
-            self.benchmark_manager
+            benchmark_manager,
+            use_tuned_parameters=False
         )
-        algorithm.step_size = self.step_size
-        
-        if hasattr(algorithm, 'num_samples'):
-            algorithm.num_samples = self.num_samples_excluding_grid
-        if hasattr(algorithm, 'neighbour_radius'):
-            algorithm.neighbour_radius = self.step_size * self.radius_as_step_size_multiplication
-
         if algorithm is None:
             logger.error(f"Algorithm '{algorithm_name}' not found.")
             return None
 
-        start_time = time.time()
-        timeout = 10  # 10 seconds timeout
+        algorithm.set_seed(seed)
+        parameters = {
+            "step_size": self.step_size,
+            "num_samples_excluding_grid": self.num_samples_excluding_grid,
+            "radius_as_step_size_multiplication": self.radius_as_step_size_multiplication,
+        }
+        if self.goal_bias is not None:
+            parameters["goal_bias"] = self.goal_bias
+        self.algorithm_manager.apply_parameters(algorithm, parameters)
+        if hasattr(algorithm, 'connection_strategy') and self.connection_strategy is not None:
+            algorithm.connection_strategy = self.connection_strategy
+        if self.sampling_mode is not None:
+            algorithm.sampling_mode = self.sampling_mode
 
-        while not algorithm.is_complete():
-            algorithm.step()
-            if time.time() - start_time > timeout:
-                logger.warning(f"Timeout reached for {algorithm_name} on {map_name}")
-                return None
-        
-        result = self.benchmark_manager.get_last_result()
-        if result:
-            logger.info(f"{algorithm_name} completed on {map_name} in {result.execution_time:.4f}s")
-        return result
+        profiler = create_profiler(self.profile) if profile_path is not None else None
+        if self.track_memory:
+            tracemalloc.start()
+        if profiler is not None:
+            profiler.enable()
+        try:
+            outcome = algorithm.run_until(max_time=self.timeout)
+        finally:
+            if profiler is not None:
+                profiler.disable()
+                save_run_profile(profiler, profile_path)
+            if self.track_memory:
+                tracemalloc.stop()
+        result = benchmark_manager.get_last_result()
+        if not outcome.solved or result is None:
+            logger.warning(f"{algorithm_name} on {map_name} not solved: {outcome}")
+            return self.failed_row(algorithm_name, map_name, outcome.status, seed)
+
+        logger.info(f"{algorithm_name} completed on {map_name} in {result.execution_time:.4f}s")
+        return [
+            result.algorithm_name,
+            map_name,
+            SOLVED,
+            f"{result.execution_time:.4f}",
+            f"{result.path_length:.2f}",
+            result.steps,
+            result.start_point,
+            result.goal_point,
+            result.step_size,
+            seed,
+            f"{result.total_time:.4f}",
+            f"{result.cpu_time:.4f}",
+            *(f"{result.phase_times.get(phase, 0.0):.4f}" for phase in PHASES),
+            result.peak_memory if result.peak_memory is not None else "",
+            self.serialize_path(result.path)
+        ]
+
+    def failed_row(self, algorithm_name, map_name, status, seed):
+        """Result row of a run without a path, times and lengths are left empty."""
+        map_config = self.get_map(map_name)
+        start = tuple(map_config.default_start) if map_config else ""
+        goal = tuple(map_config.default_goal) if map_config else ""
+        return [self.result_name(algorithm_name), map_name, status, "", "", "", start, goal, self.step_size, seed,
+                "", "", *("" for _ in PHASES), "", ""]
+
+    def result_name(self, algorithm_name):
+        """Algorithm column of a result row, solved runs report the class name (BenchmarkResult.algorithm_name)."""
+        for algorithm in self.algorithm_manager.algorithms:
+            if algorithm["name"] == algorithm_name:
+                return algorithm["algorithm"].__name__
+        return algorithm_name
 
     def serialize_path(self, path):
-        if not path:
+        if len(path) == 0:
             return ""
-        return json.dumps([(node.x, node.y) for node in path])
+        return json.dumps(path.tolist())
 
     def get_map(self, map_name):
         from maps.maps_manager import MapsManager
         maps_manager = MapsManager()
         return maps_manager.get_map(map_name)
-
-    def reset_environment(self):
-        logger.info("Resetting environment...")
-        self.benchmark_manager.clear_results()
@@ -0,0 +1,134 @@
+import itertools
+import math
+
+import numpy as np
+
+from core.logger import logger
+from core.map import Map
+from core.algorithm import SOLVED
+from algorithms.algorithm_manager import AlgorithmManager, TUNED_PARAMETERS_FILE
+from test_runner.test_runner import TestRunner, RESULT_COLUMNS
+from test_runner.parameter_sweep import execute_cell_jobs
+
+# Parameters the tuner can set, named as the TestRunner arguments, with the algorithm attribute that must exist for it
+TUNABLE_PARAMETERS = {
+    "step_size": "step_size",
+    "radius_as_step_size_multiplication": "neighbour_radius",
+    "num_samples_excluding_grid": "num_samples",
+    "goal_bias": "goal_bias",
+}
+
+DEFAULT_SEARCH_SPACE = {
+    "step_size": [1.0, 2.0, 3.0, 5.0, 8.0],
+    "radius_as_step_size_multiplication": [2, 3, 5],
+    "num_samples_excluding_grid": [100, 250, 500, 1000],
+    "goal_bias": [0.05, 0.1, 0.2, 0.3, 0.5],
+}
+
+FAILURE_PENALTY = 10 # Unsolved runs score FAILURE_PENALTY * time_budget (PAR10)
+
+class SuccessiveHalvingTuner:
+    """
+    Find the fastest parameters of an algorithm on a map with successive halving.
+
+    Up to configurations parameter combinations from the search space
+    start with min_runs runs each. After every rung only the best 1/eta of
+    them go on, with eta times as many runs, until one is left. A run gets
+    time_budget seconds to solve the map, the score of a configuration is
+    its mean end-to-end solve time (Total Time) with unsolved runs counted
+    as FAILURE_PENALTY * time_budget.
+
+    All configurations run on the same seeds (run i of every configuration
+    has the same seed), so they are compared on the same random problems,
+    and runs of earlier rungs are reused.
+    """
+
+    def __init__(self, algorithm_name, map_name, search_space=None, configurations=27, min_runs=1, eta=3, time_budget=5, seed=0, workers=1):
+        search_space = search_space if search_space is not None else DEFAULT_SEARCH_SPACE
+        unknown = set(search_space) - set(TUNABLE_PARAMETERS)
+        if unknown:
+            raise ValueError(f"Cannot tune {sorted(unknown)}, use some of {list(TUNABLE_PARAMETERS)}")
+        if eta < 2:
+            raise ValueError(f"eta must be at least 2, got {eta}")
+        self.algorithm_name = algorithm_name
+        self.map_name = map_name
+        self.search_space = self.applicable_space(search_space)
+        self.configurations = configurations
+        self.min_runs = min_runs
+        self.eta = eta
+        self.time_budget = time_budget
+        self.seed = seed
+        self.workers = workers
+        self.scores = {} # {configuration: {run: score}}, configuration is a sorted tuple of (parameter, value)
+
+    def applicable_space(self, search_space):
+        """search_space without the parameters the algorithm does not have (e.g. goal_bias of plain RRT)."""
+        algorithm = AlgorithmManager().get_algorithm(self.algorithm_name, Map(10, 10), None, use_tuned_parameters=False)
+        if algorithm is None:
+            raise ValueError(f"Unknown algorithm '{self.algorithm_name}'")
+        return {parameter: values for parameter, values in search_space.items() if hasattr(algorithm, TUNABLE_PARAMETERS[parameter])}
+
+    def candidates(self):
+        """Configurations of the first rung, a seeded random subset when the space holds more than configurations."""
+        names = sorted(self.search_space)
+        grid = [tuple(zip(names, values)) for values in itertools.product(*(self.search_space[name] for name in names))]
+        if len(grid) <= self.configurations:
+            return grid
+        rng = np.random.default_rng(self.seed)
+        return [grid[i] for i in sorted(rng.choice(len(grid), self.configurations, replace=False))]
+
+    def tune(self):
+        """Run successive halving, returns the best configuration as {parameter: value}."""
+        survivors = self.candidates()
+        runs = self.min_runs
+        rung = 0
+        while True:
+            self.evaluate(survivors, runs)
+            survivors.sort(key=lambda configuration: self.score(configuration, runs))
+            best = survivors[0]
+            logger.info(f"Tuning {self.algorithm_name} on {self.map_name}, rung {rung}: {len(survivors)} configurations x {runs} runs, "
+                        f"best {dict(best)} scores {self.score(best, runs):.4f}s")
+            if len(survivors) == 1:
+                return dict(best)
+            survivors = survivors[:max(1, len(survivors) // self.eta)]
+            runs *= self.eta
+            rung += 1
+
+    def evaluate(self, configurations, runs):
+        """Make sure every configuration has scores of runs 0 .. runs - 1."""
+        pending = []
+        for configuration in configurations:
+            scores = self.scores.setdefault(configuration, {})
+            runner = self.configuration_runner(configuration, runs)
+            pending.extend((runner, job, (configuration, job[2])) for job in runner.jobs() if job[2] not in scores)
+
+        for _, (configuration, run), row in execute_cell_jobs(pending, self.workers):
+            if row is not None:
+                self.scores[configuration][run] = self.run_score(row)
+
+    def configuration_runner(self, configuration, runs):
+        return TestRunner([self.algorithm_name], [self.map_name], runs, "tuning_results.csv",
+                          seed=self.seed, timeout=self.time_budget, **dict(configuration))
+
+    def run_score(self, row):
+        if row[RESULT_COLUMNS.index("Status")] != SOLVED:
+            return FAILURE_PENALTY * self.time_budget
+        return float(row[RESULT_COLUMNS.index("Total Time")])
+
+    def score(self, configuration, runs):
+        scores = self.scores.get(configuration, {})
+        values = [scores[run] for run in range(runs) if run in scores]
+        return sum(values) / len(values) if values else math.inf
+
+def tune_and_store(algorithm_names, map_names, tuned_parameters_file=TUNED_PARAMETERS_FILE, **tuner_arguments):
+    """Tune every algorithm on every map and save the winners as AlgorithmManager per-map defaults."""
+    algorithm_manager = AlgorithmManager(tuned_parameters_file)
+    tuned = {}
+    for map_name in map_names:
+        for algorithm_name in algorithm_names:
+            tuner = SuccessiveHalvingTuner(algorithm_name, map_name, **tuner_arguments)
+            best = tuner.tune()
+            algorithm_manager.save_tuned_parameters(algorithm_name, map_name, best)
+            logger.info(f"Tuned {algorithm_name} on {map_name}: {best}")
+            tuned[(algorithm_name, map_name)] = best
+    return tuned
@@ -0,0 +1,65 @@
+import csv
+import unittest
+import numpy as np
+from test_runner.adaptive_runs import AdaptiveScheduler
+from test_runner.test_runner import TestRunner
+from tests.working_directory import TemporaryWorkingDirectoryTestCase
+
+class TestAdaptiveScheduler(unittest.TestCase):
+    def run_scheduler(self, scheduler, spread):
+        """Feed every batch with values of mean 1 and the spread of its pair, returns the rounds."""
+        rng = np.random.default_rng(0)
+        rounds = 0
+        batch = scheduler.next_batch()
+        while batch:
+            rounds += 1
+            for key in batch:
+                scheduler.add(key, 1 + spread[key[0]] * rng.standard_normal())
+            batch = scheduler.next_batch()
+        return rounds
+
+    def test_runs_follow_variance(self):
+        scheduler = AdaptiveScheduler(["steady", "noisy", "wild"], ["Maze Map"], 1, target=0.1, min_runs=10, max_runs=500)
+        self.run_scheduler(scheduler, {"steady": 0.01, "noisy": 0.2, "wild": 5.0})
+        runs = {pair[0]: count for pair, count in scheduler.scheduled.items()}
+        self.assertEqual(runs["steady"], 10)
+        self.assertGreater(runs["noisy"], 10)
+        self.assertLess(runs["noisy"], 500)
+        self.assertLessEqual(scheduler.ci_width(("noisy", "Maze Map")), 0.1)
+        self.assertEqual(runs["wild"], 500) # Cap
+
+    def test_unsolved_pair_runs_to_cap(self):
+        scheduler = AdaptiveScheduler(["RRT"], ["Maze Map"], 1, target=0.1, min_runs=5, max_runs=40)
+        batch = scheduler.next_batch()
+        while batch:
+            for key in batch:
+                scheduler.add(key, None)
+            batch = scheduler.next_batch()
+        self.assertEqual(scheduler.scheduled[("RRT", "Maze Map")], 40)
+
+    def test_finished_jobs_are_not_scheduled_again(self):
+        first = AdaptiveScheduler(["RRT"], ["Rooms"], 1, target=0.1, min_runs=5, max_runs=40)
+        done = first.next_batch()[:3]
+        scheduler = AdaptiveScheduler(["RRT"], ["Rooms"], 1, target=0.1, min_runs=5, max_runs=40)
+        for key in done:
+            scheduler.add(key, 1.0)
+        self.assertEqual([key[2] for key in scheduler.next_batch()], [3, 4])
+
+class TestAdaptiveTestRunner(TemporaryWorkingDirectoryTestCase):
+    def test_adaptive_campaign(self):
+        runner = TestRunner(["RRT", "RRT-Connect"], ["Rooms"], 12, "results.csv", seed=2, ci_target=0.5, ci_metric="Path Length", min_runs=4)
+        runner.run_tests()
+        with open(runner.output_file, newline='') as file:
+            rows = list(csv.DictReader(file))
+        counts = {}
+        for row in rows:
+            counts[row["Algorithm"]] = counts.get(row["Algorithm"], 0) + 1
+        self.assertEqual(set(counts), {"RRTAlgorithm", "RRTConnectAlgorithm"})
+        self.assertTrue(all(4 <= count <= 12 for count in counts.values()))
+
+    def test_unknown_metric(self):
+        with self.assertRaises(ValueError):
+            TestRunner(["RRT"], ["Rooms"], 1, "results.csv", ci_target=0.1, ci_metric="Path")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -60,6 +60,52 @@ class TestAlgorithm(unittest.TestCase):
         self.assertTrue(self.algorithm.is_collision(-10, -10))
         self.assertFalse(self.algorithm.is_collision(0, 0))
 
+    def test_vectorised_collision_matches_scalar(self):
+        self.map.add_obstacle(20, 20, 5, 5)
+        self.map.add_obstacle(60, 10, 10, 40)
+        points = [(22, 22), (20, 20), (25, 25), (30, 30), (-10, -10), (0, 0), (100, 100),
+                  (100.5, 50), (65, 49), (65, 51), (59.9, 30)]
+        xs = [x for x, _ in points]
+        ys = [y for _, y in points]
+        expected = [self.algorithm.is_collision(x, y) for x, y in points]
+        self.assertEqual(self.algorithm.are_in_collision(xs, ys).tolist(), expected)
+
+    def test_vectorised_collision_without_obstacles(self):
+        self.assertEqual(self.algorithm.are_in_collision([50, 150], [50, 50]).tolist(), [False, True])
+
+    def test_free_space_sampling(self):
+        self.map.add_obstacle(0, 0, 50, 100)
+        self.algorithm.sampling_mode = "free_space"
+        for _ in range(200):
+            x, y = self.algorithm.sample_point()
+            self.assertFalse(self.algorithm.is_collision(x, y))
+        xs, ys = self.algorithm.sample_points(200)
+        self.assertFalse(self.algorithm.are_in_collision(xs, ys).any())
+
+    def test_free_space_sampler_follows_map_changes(self):
+        self.algorithm.sampling_mode = "free_space"
+        self.algorithm.sample_point()
+        self.map.add_obstacle(0, 0, 100, 90)
+        for _ in range(100):
+            self.assertGreater(self.algorithm.sample_point()[1], 90)
+
+    def test_low_discrepancy_sampling(self):
+        for mode in ("halton", "sobol"):
+            self.algorithm.sampling_mode = mode
+            self.algorithm.set_seed(3)
+            points = [self.algorithm.sample_point() for _ in range(50)]
+            self.assertTrue(all(0 <= x <= 100 and 0 <= y <= 100 for x, y in points))
+            self.assertEqual(len(set(points)), 50)
+
+            self.algorithm.set_seed(3)
+            xs, ys = self.algorithm.sample_points(50)
+            self.assertEqual(list(zip(xs.tolist(), ys.tolist())), points)
+
+    def test_unknown_sampling_mode(self):
+        self.algorithm.sampling_mode = "psychic"
+        with self.assertRaises(ValueError):
+            self.algorithm.sample_point()
+
     def test_edge_collision(self):
         self.map.add_obstacle(20, 20, 5, 5)
         # Edge touches corner of obstacle
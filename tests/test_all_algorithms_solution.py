@@ -58,10 +58,10 @@ class TestAlgorithmSolution(unittest.TestCase):
         self.assertGreater(result.path_length, 0, f"{algorithm_name} produced a path with zero length on '{map_name}'")
 
         # First node should be at the start node location
-        self.assertEqual(result.path[0].get_position(), (map_instance.start.x, map_instance.start.y))
+        self.assertEqual(tuple(result.path[0]), (map_instance.start.x, map_instance.start.y))
         
         # Last node should be at the goal node location
-        self.assertEqual(result.path[-1].get_position(), (map_instance.goal.x, map_instance.goal.y))
+        self.assertEqual(tuple(result.path[-1]), (map_instance.goal.x, map_instance.goal.y))
 
     def test_all_algorithms(self):
         """Test all algorithms on all maps. Define some custom rules for specific cases."""
@@ -0,0 +1,48 @@
+import unittest
+import numpy as np
+from test_runner.test_runner import TestRunner
+from test_runner.benchmark_harness import BenchmarkHarness, bootstrap_median_ci
+from tests.working_directory import TemporaryWorkingDirectoryTestCase
+
+def summary_of(median, low, high, solved=10):
+    metric = {"median": median, "low": low, "high": high}
+    return {"RRT|Rooms": {"runs": 10, "solved": solved, "time": metric, "steps": metric, "path_length": metric}}
+
+class TestBenchmarkHarness(TemporaryWorkingDirectoryTestCase):
+    def setUp(self):
+        super().setUp()
+        self.runner = TestRunner(["RRT"], ["Rooms"], 1, "results.csv")
+        self.harness = BenchmarkHarness(self.runner, trials=5, warmup=1, baseline_file="baseline.json")
+
+    def test_bootstrap_interval_contains_median(self):
+        values = np.random.default_rng(1).exponential(1.0, size=50)
+        median, low, high = bootstrap_median_ci(values)
+        self.assertEqual(median, np.median(values))
+        self.assertLess(low, median)
+        self.assertGreater(high, median)
+        self.assertEqual((low, high), bootstrap_median_ci(values)[1:]) # Fixed default generator
+
+    def test_run_is_repeatable(self):
+        summary = self.harness.run()
+        self.assertEqual(summary["RRT|Rooms"]["runs"], 5)
+        # Same seeds, so the same trees - only the times differ
+        again = self.harness.run()
+        self.assertEqual(summary["RRT|Rooms"]["steps"], again["RRT|Rooms"]["steps"])
+        self.assertEqual(summary["RRT|Rooms"]["path_length"], again["RRT|Rooms"]["path_length"])
+
+    def test_gate(self):
+        self.assertEqual(self.harness.gate(summary_of(1.0, 0.9, 1.1)), 0) # No baseline yet
+        self.harness.save_baseline(summary_of(1.0, 0.9, 1.1))
+        self.assertEqual(self.harness.gate(summary_of(1.05, 0.95, 1.15)), 0) # Overlapping intervals
+        self.assertEqual(self.harness.gate(summary_of(0.5, 0.4, 0.6)), 0) # Faster
+        self.assertEqual(self.harness.gate(summary_of(1.5, 1.3, 1.7)), 1)
+        self.assertEqual(self.harness.gate(summary_of(1.0, 0.9, 1.1, solved=8)), 1)
+
+    def test_baseline_of_other_seed_is_rejected(self):
+        self.harness.save_baseline(summary_of(1.0, 0.9, 1.1))
+        self.runner.seed = 1
+        with self.assertRaises(ValueError):
+            self.harness.gate(summary_of(1.0, 0.9, 1.1))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import gc
+import math
+import unittest
+import weakref
+import numpy as np
+from core.map import Map
+from benchmarks.benchmark_manager import BenchmarkManager, RunningStats
+from benchmarks.benchmark_result import BenchmarkResult
+from algorithms.algorithms_implementations.rrt import RRTAlgorithm
+
+def make_result(algorithm_name, map_name, execution_time, path_length=10.0):
+    return BenchmarkResult(algorithm_name, 5, execution_time, (0, 0), (1, 1), 1.0, path_length,
+                           [(0, 0), (1, 1)], map_name=map_name)
+
+class TestRunningStats(unittest.TestCase):
+    def test_matches_numpy(self):
+        values = np.random.default_rng(3).normal(5, 2, size=500)
+        stats = RunningStats()
+        for value in values:
+            stats.add(value)
+        self.assertEqual(stats.count, 500)
+        self.assertAlmostEqual(stats.mean, values.mean())
+        self.assertAlmostEqual(stats.variance, values.var(ddof=1))
+        self.assertEqual((stats.min, stats.max), (values.min(), values.max()))
+
+    def test_variance_of_single_value_is_nan(self):
+        stats = RunningStats()
+        stats.add(1.0)
+        self.assertTrue(math.isnan(stats.variance))
+
+class TestBenchmarkManager(unittest.TestCase):
+    def test_stats_per_algorithm_and_map(self):
+        manager = BenchmarkManager()
+        manager.add_result(make_result("RRT", "Rooms", 1.0))
+        manager.add_result(make_result("RRT", "Rooms", 3.0))
+        manager.add_result(make_result("RRT", "Maze Map", 10.0))
+        manager.add_result(make_result("PRM", "Rooms", 7.0, path_length=math.inf))
+
+        self.assertEqual(manager.get_stats("RRT", "Rooms")["execution_time"].mean, 2.0)
+        self.assertEqual(manager.get_stats("RRT", "Maze Map")["execution_time"].count, 1)
+        self.assertEqual(manager.get_stats("PRM", "Rooms")["path_length"].count, 0) # Non-finite values are skipped
+        self.assertIsNone(manager.get_stats("RRT", "Dense Obstacles"))
+
+    def test_max_results_keeps_stats_of_all_results(self):
+        manager = BenchmarkManager(max_results=2)
+        for execution_time in (1.0, 2.0, 3.0, 4.0):
+            manager.add_result(make_result("RRT", "Rooms", execution_time))
+        self.assertEqual([result.execution_time for result in manager.results], [3.0, 4.0])
+        self.assertEqual(manager.get_stats("RRT", "Rooms")["execution_time"].count, 4)
+
+        manager.clear_results()
+        self.assertEqual(len(manager.results), 0)
+        self.assertIsNone(manager.get_stats("RRT", "Rooms"))
+
+    def test_result_does_not_keep_the_tree(self):
+        manager = BenchmarkManager()
+        map_instance = Map(100, 100, name="Empty")
+        map_instance.set_start(5, 5)
+        map_instance.set_goal(95, 95)
+        rrt = RRTAlgorithm(map_instance, benchmark_manager=manager)
+        rrt.run_until(max_time=10)
+        tree_root = weakref.ref(rrt.nodes[0])
+
+        result = manager.get_last_result()
+        self.assertEqual(result.map_name, "Empty")
+        self.assertIsInstance(result.path, np.ndarray)
+        self.assertEqual(result.path.shape[1], 2)
+        self.assertEqual(tuple(result.path[0]), (5.0, 5.0))
+        self.assertEqual(result.start_point, (5.0, 5.0))
+        self.assertFalse(hasattr(result, "__dict__"))
+
+        del rrt
+        gc.collect()
+        self.assertIsNone(tree_root())
+
+if __name__ == "__main__":
+    unittest.main()
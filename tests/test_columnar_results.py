@@ -0,0 +1,57 @@
+import csv
+import math
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+from test_runner.test_runner import RESULT_COLUMNS
+from test_runner.columnar_results import read_csv_columns, write_columnar, read_columnar, split_paths, columnar_extension
+
+class TestColumnarResults(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.csv_file = os.path.join(self.directory, "results.csv")
+        with open(self.csv_file, "w", newline="") as file:
+            writer = csv.DictWriter(file, RESULT_COLUMNS, restval="")
+            writer.writeheader()
+            writer.writerow({"Algorithm": "RRTAlgorithm", "Map": "Rooms", "Status": "solved", "Execution Time": "0.0123",
+                             "Path Length": "12.50", "Steps": 7, "start_node": (5.0, 32.0), "goal_node": (95.0, 32.0),
+                             "step_size": 5, "seed": 11, "Total Time": "0.0130", "Search Time": "0.0120",
+                             "Path": "[[5.0, 32.0], [10.0, 32.0], [95.0, 32.0]]"})
+            writer.writerow({"Algorithm": "PRMAlgorithm", "Map": "Rooms", "Status": "timeout", "start_node": (5.0, 32.0),
+                             "goal_node": (95.0, 32.0), "step_size": 5, "seed": 12})
+            writer.writerow({"Algorithm": "RRTAlgorithm", "Map": "Maze Map", "Status": "solved", "Execution Time": "0.5",
+                             "Path Length": "3.00", "Steps": 2, "start_node": (1.0, 2.0), "goal_node": (3.0, 4.0),
+                             "step_size": 5, "seed": 13, "Peak Memory": 2048, "Path": "[[1.0, 2.0], [3.0, 4.0]]"})
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_csv_to_typed_columns(self):
+        columns = read_csv_columns(self.csv_file)
+        self.assertEqual(columns["algorithm"].tolist(), ["RRTAlgorithm", "PRMAlgorithm", "RRTAlgorithm"])
+        self.assertEqual(columns["status"].tolist(), ["solved", "timeout", "solved"])
+        self.assertEqual(columns["steps"].tolist(), [7, -1, 2])
+        self.assertTrue(math.isnan(columns["execution_time"][1]))
+        self.assertEqual(columns["seed"].dtype, np.int64)
+        self.assertEqual(columns["total_time"][0], 0.013)
+        self.assertTrue(math.isnan(columns["sampling_time"][0]))
+        self.assertEqual(columns["peak_memory"].tolist(), [-1, -1, 2048])
+        self.assertEqual(columns["path_offsets"].tolist(), [0, 3, 3, 5])
+        paths = split_paths(columns)
+        self.assertEqual(paths[0].tolist(), [[5.0, 32.0], [10.0, 32.0], [95.0, 32.0]])
+        self.assertEqual(paths[1].shape, (0, 2))
+        self.assertEqual(paths[2].tolist(), [[1.0, 2.0], [3.0, 4.0]])
+
+    def test_round_trip(self):
+        columns = read_csv_columns(self.csv_file)
+        output_file = write_columnar(columns, os.path.join(self.directory, "results"))
+        self.assertTrue(output_file.endswith(columnar_extension()))
+        loaded = read_columnar(output_file)
+        self.assertEqual(set(loaded), set(columns))
+        for name, column in columns.items():
+            np.testing.assert_array_equal(loaded[name], column)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import shutil
+import tempfile
+import unittest
+import numpy as np
+from core.map import Map
+from core.compiled_map import CompiledMap
+from maps.maps_manager import MapsManager
+
+class TestCompiledMap(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        map_config = MapsManager().get_map("Rooms")
+        self.map = Map(map_config.width, map_config.height)
+        for obs in map_config.obstacles:
+            self.map.add_obstacle(*obs)
+        self.map.set_start(*map_config.default_start)
+        self.map.set_goal(*map_config.default_goal)
+        self.compiled = CompiledMap.publish(self.map, self.directory)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_loaded_map_matches_original(self):
+        loaded = self.compiled.load()
+        self.assertEqual((loaded.width, loaded.height), (self.map.width, self.map.height))
+        np.testing.assert_array_equal(loaded.get_obstacles(), self.map.get_obstacles())
+        np.testing.assert_array_equal(loaded.free_cells(), self.map.free_cells())
+        self.assertEqual(loaded.free_area(), self.map.free_area())
+        self.assertEqual((loaded.start.x, loaded.start.y), (self.map.start.x, self.map.start.y))
+        self.assertEqual((loaded.goal.x, loaded.goal.y), (self.map.goal.x, self.map.goal.y))
+
+    def test_arrays_are_shared_read_only(self):
+        loaded = self.compiled.load()
+        for array in (loaded.obstacles, loaded.get_obstacle_array(), loaded.free_cells()):
+            self.assertIsInstance(array, np.memmap)
+            self.assertFalse(array.flags.writeable)
+
+    def test_obstacles_are_tuples_for_scalar_loops(self):
+        loaded = self.compiled.load()
+        self.assertEqual(loaded.get_obstacles(), self.map.get_obstacles())
+        self.assertIs(type(loaded.get_obstacles()[0][0]), float)
+
+    def test_changing_loaded_map_drops_shared_caches(self):
+        loaded = self.compiled.load()
+        loaded.add_obstacle(0, 0, 1, 1)
+        self.assertEqual(len(loaded.get_obstacle_array()), len(self.map.get_obstacles()) + 1)
+        self.assertNotIsInstance(loaded.free_cells(), np.memmap)
+
+    def test_unknown_array(self):
+        with self.assertRaises(ValueError):
+            self.compiled.array("heightmap")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,26 @@
+import unittest
+from core.map import Map
+
+class TestMap(unittest.TestCase):
+    def test_free_area_empty_map(self):
+        self.assertEqual(Map(100, 50).free_area(), 5000)
+
+    def test_free_area_counts_overlap_once(self):
+        map_instance = Map(100, 100)
+        map_instance.add_obstacle(10, 10, 20, 20)
+        map_instance.add_obstacle(20, 20, 20, 20)
+        self.assertAlmostEqual(map_instance.free_area(), 10000 - 400 - 400 + 100)
+
+    def test_free_area_clips_to_map(self):
+        map_instance = Map(100, 100)
+        map_instance.add_obstacle(90, 90, 50, 50)
+        self.assertAlmostEqual(map_instance.free_area(), 10000 - 100)
+
+    def test_free_area_is_updated_with_obstacles(self):
+        map_instance = Map(100, 100)
+        self.assertEqual(map_instance.free_area(), 10000)
+        map_instance.add_obstacle(0, 0, 10, 10)
+        self.assertEqual(map_instance.free_area(), 9900)
+
+if __name__ == "__main__":
+    unittest.main()
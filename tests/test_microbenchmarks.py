@@ -0,0 +1,38 @@
+import json
+import os
+import tempfile
+import unittest
+from benchmarks.microbenchmarks import MICROBENCHMARKS, NODE_SCALED, run_microbenchmarks, save_results, synthetic_map, time_operation
+
+class TestMicrobenchmarks(unittest.TestCase):
+    def test_synthetic_map(self):
+        map_instance = synthetic_map(50)
+        self.assertEqual(len(map_instance.get_obstacles()), 50)
+        self.assertEqual(map_instance.get_obstacles(), synthetic_map(50).get_obstacles())
+
+    def test_time_operation(self):
+        timing = time_operation(lambda: sum(range(100)), repeat=3, min_time=0.001)
+        self.assertEqual(timing["repeat"], 3)
+        self.assertGreater(timing["median"], 0)
+        self.assertLessEqual(timing["min"], timing["median"])
+
+    def test_every_benchmark_runs_and_saves_as_json(self):
+        results = run_microbenchmarks(maps=["Rooms"], node_counts=(20, 40), obstacle_counts=(5,), repeat=1, min_time=0.001)
+        cases = {(result["benchmark"], result["map"], result["nodes"]) for result in results["results"]}
+        expected = sum(2 if name in NODE_SCALED else 1 for name in MICROBENCHMARKS) * 2
+        self.assertEqual(len(cases), expected)
+        self.assertIn(("is_collision", "Synthetic 5 obstacles", None), cases)
+        self.assertIn(("a_star", "Rooms", 40), cases)
+
+        with tempfile.TemporaryDirectory() as directory:
+            output_file = os.path.join(directory, "micro.json")
+            save_results(results, output_file)
+            with open(output_file) as file:
+                self.assertEqual(json.load(file), results)
+
+    def test_unknown_benchmark(self):
+        with self.assertRaises(ValueError):
+            run_microbenchmarks(benchmarks=["sort"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import csv
+import unittest
+from test_runner.parameter_sweep import ParameterSweep, ResultCache, code_version, map_hash
+from maps.maps_manager import MapsManager
+from tests.working_directory import TemporaryWorkingDirectoryTestCase
+
+class TestParameterSweep(TemporaryWorkingDirectoryTestCase):
+    def read_rows(self, sweep):
+        with open(sweep.output_file, newline='') as file:
+            return list(csv.DictReader(file))
+
+    def test_cells_cover_the_grid(self):
+        sweep = ParameterSweep({"PRM": {"step_size": [2, 5], "num_samples_excluding_grid": [50, 100, 200]}, "RRT": {}}, ["Rooms"], 1, "sweep.csv")
+        cells = list(sweep.cells())
+        self.assertEqual(len(cells), 7)
+        self.assertIn(("PRM", {"step_size": 5, "num_samples_excluding_grid": 200}), cells)
+        self.assertIn(("RRT", {}), cells)
+
+    def test_unknown_parameter(self):
+        with self.assertRaises(ValueError):
+            ParameterSweep({"RRT": {"temperature": [0.1]}}, ["Rooms"], 1, "sweep.csv")
+
+    def test_unknown_map(self):
+        with self.assertRaises(ValueError):
+            ParameterSweep({"RRT": {}}, ["Atlantis"], 1, "sweep.csv")
+
+    def test_rerun_only_executes_new_cells(self):
+        sweep = ParameterSweep({"RRT": {"step_size": [3, 5]}}, ["Rooms"], 2, "sweep.csv", workers=2)
+        self.assertEqual(sweep.run(), 4)
+        first_rows = self.read_rows(sweep)
+        self.assertEqual(sorted(float(row["step_size"]) for row in first_rows), [3, 3, 5, 5])
+
+        self.assertEqual(sweep.run(), 0)
+        # Cached rows are written as they were
+        self.assertEqual(sorted(map(tuple, (row.values() for row in self.read_rows(sweep)))),
+                         sorted(map(tuple, (row.values() for row in first_rows))))
+
+        sweep = ParameterSweep({"RRT": {"step_size": [3, 5, 8]}}, ["Rooms"], 2, "sweep.csv")
+        self.assertEqual(sweep.run(), 2)
+        self.assertEqual(len(self.read_rows(sweep)), 6)
+
+    def test_cache_survives_damaged_lines(self):
+        with ResultCache("cache/cache.jsonl") as cache:
+            cache.put("a", ["RRTAlgorithm", (1.0, 2.0)])
+        with open("cache/cache.jsonl", "a") as file:
+            file.write('{"key": "b", "ro')
+        with ResultCache("cache/cache.jsonl") as cache:
+            self.assertEqual(cache.get("a"), ["RRTAlgorithm", (1.0, 2.0)])
+            self.assertNotIn("b", cache)
+
+    def test_cache_is_closed_on_error(self):
+        with self.assertRaises(RuntimeError):
+            with ResultCache("cache/cache.jsonl") as cache:
+                cache.put("a", ["RRTAlgorithm"])
+                raise RuntimeError("interrupted")
+        self.assertTrue(cache._file.closed)
+        with ResultCache("cache/cache.jsonl") as cache:
+            self.assertIn("a", cache)
+
+    def test_hashes(self):
+        maps_manager = MapsManager()
+        self.assertNotEqual(map_hash(maps_manager.get_map("Rooms")), map_hash(maps_manager.get_map("Maze Map")))
+        self.assertEqual(code_version(), code_version())
+
+if __name__ == "__main__":
+    unittest.main()
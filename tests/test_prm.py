@@ -58,5 +58,194 @@ class TestPRMAlgorithm(unittest.TestCase):
         self.assertEqual(self.prm.steps, 2)
         self.assertEqual(len(self.prm.start_node.edges) > 0, True)
 
+    def test_reinitialise_does_not_leak_edges(self):
+        self.prm.step()
+        self.prm.step()
+        old_start = self.prm.start_node
+        edges_before = sum(len(node.edges) for node in self.prm.samples)
+        for _ in range(3):
+            self.prm.reinintialise_start_and_goal(self.map.start, self.map.goal)
+        edges_after = sum(len(node.edges) for node in self.prm.samples)
+        self.assertEqual(edges_before, edges_after)
+        self.assertFalse(any(old_start in node.edges for node in self.prm.samples))
+        self.assertIn(self.prm.start_node, self.prm.nodes)
+
+    def test_query_leaves_roadmap_untouched(self):
+        self.prm.step()
+        self.prm.step()
+        edges_before = sum(len(node.edges) for node in self.prm.samples)
+        path, cost = self.prm.query((5, 5), (95, 95))
+        self.assertEqual(path[0], (5, 5))
+        self.assertEqual(path[-1], (95, 95))
+        self.assertLess(cost, float("inf"))
+        self.assertEqual(edges_before, sum(len(node.edges) for node in self.prm.samples))
+
+    def test_query_unreachable_goal(self):
+        self.map.add_obstacle(80, 80, 20, 20)
+        self.prm.step()
+        self.prm.step()
+        path, cost = self.prm.query((5, 5), (200, 200))
+        self.assertEqual(path, [])
+        self.assertEqual(cost, float("inf"))
+
+    def test_batch_query_matches_single_queries(self):
+        self.prm.step()
+        self.prm.step()
+        pairs = [((5, 5), (95, 95)), ((50, 10), (10, 50)), ((90, 10), (10, 90))]
+        expected = [self.prm.query(start, goal) for start, goal in pairs]
+        self.assertEqual(self.prm.batch_query(pairs), expected)
+
+        parallel = self.prm.batch_query(pairs, workers=2)
+        for (path, cost), (expected_path, expected_cost) in zip(parallel, expected):
+            self.assertAlmostEqual(cost, expected_cost, places=6)
+            self.assertEqual(path[0], expected_path[0])
+            self.assertEqual(path[-1], expected_path[-1])
+
+    def test_parallel_batch_query_keeps_connection_strategy(self):
+        # Off the grid, so no roadmap node sits on a query point
+        pairs = [((6.1, 5.3), (94.2, 93.7)), ((51.4, 11.2), (9.3, 48.6)), ((88.7, 11.9), (12.2, 88.1))]
+        for strategy in ("k_nearest", "radius_star"):
+            prm = PRMAlgorithm(map=self.map, num_samples_excluding_grid=100, connection_strategy=strategy)
+            prm.set_seed(4)
+            prm.step()
+            prm.step()
+            # A plain radius connection this small cannot reach the roadmap from the query points
+            prm.neighbour_radius = 0.1
+            serial = prm.batch_query(pairs)
+            self.assertTrue(all(cost < float("inf") for _, cost in serial))
+            parallel = prm.batch_query(pairs, workers=2)
+            for (_, cost), (_, expected_cost) in zip(parallel, serial):
+                self.assertAlmostEqual(cost, expected_cost, places=6)
+
+    def test_csr_roadmap_finds_same_cost(self):
+        self.prm.step()
+        self.prm.step()
+        self.prm.step()
+        csr_prm = PRMAlgorithm(map=self.map, num_samples_excluding_grid=0, use_csr=True)
+        csr_prm.step()
+        csr_prm.step()
+        csr_prm.step()
+        self.assertIsNotNone(csr_prm.roadmap)
+        self.assertEqual(csr_prm.samples, [])
+        self.assertTrue(csr_prm.is_complete())
+        self.assertEqual(csr_prm.shortest_path[0], csr_prm.start_node)
+        self.assertEqual(csr_prm.shortest_path[-1], csr_prm.goal_node)
+        self.assertAlmostEqual(csr_prm.calculate_shortest_path_cost(), self.prm.calculate_shortest_path_cost(), places=6)
+
+    def test_csr_roadmap_query(self):
+        csr_prm = PRMAlgorithm(map=self.map, num_samples_excluding_grid=0, use_csr=True)
+        csr_prm.step()
+        csr_prm.step()
+        self.prm.step()
+        self.prm.step()
+        pairs = [((5, 5), (95, 95)), ((50, 10), (10, 50))]
+        for (_, cost), (_, expected_cost) in zip(csr_prm.batch_query(pairs), self.prm.batch_query(pairs)):
+            self.assertAlmostEqual(cost, expected_cost, places=6)
+
+    def test_incremental_mode_connects_start_and_goal(self):
+        self.map.add_obstacle(30, 0, 10, 80)
+        prm = PRMAlgorithm(map=self.map, incremental=True, batch_size=20)
+        for _ in range(100):
+            prm.step()
+            if prm.is_complete():
+                break
+        self.assertTrue(prm.is_complete())
+        self.assertTrue(prm.components.connected(prm.start_node, prm.goal_node))
+        self.assertEqual(prm.nodes_in_the_grid, 0)
+        self.assertEqual(prm.shortest_path[0], prm.start_node)
+        self.assertEqual(prm.shortest_path[-1], prm.goal_node)
+        self.assertLessEqual(len(prm.samples), 20 * prm.steps)
+
+    def test_incremental_mode_respects_sample_limit(self):
+        # Goal is walled off, roadmap must stop growing at max_samples
+        self.map.add_obstacle(80, 80, 20, 5)
+        self.map.add_obstacle(80, 80, 5, 20)
+        prm = PRMAlgorithm(map=self.map, incremental=True, batch_size=50, max_samples=120)
+        with self.assertLogs("motion_planner", "WARNING") as logs:
+            for _ in range(10):
+                prm.step()
+        self.assertFalse(prm.is_complete())
+        self.assertLessEqual(len(prm.samples), 120)
+        # Warned once, not on every step past the limit
+        self.assertEqual(sum("Sample limit" in line for line in logs.output), 1)
+
+    def test_incremental_radius_connections_match_linear_scan(self):
+        self.map.add_obstacle(30, 0, 10, 80)
+        prm = PRMAlgorithm(map=self.map, incremental=True, batch_size=20)
+        prm.set_seed(2)
+        for _ in range(5):
+            prm.step()
+        index = {node: i for i, node in enumerate(prm.nodes)}
+        edges = {tuple(sorted((index[node], index[neighbour]))) for node in prm.nodes for neighbour in node.edges}
+        expected = set()
+        for i, a in enumerate(prm.nodes):
+            for j in range(i + 1, len(prm.nodes)):
+                b = prm.nodes[j]
+                if prm.distance(a.get_position(), b.get_position()) <= prm.neighbour_radius and not prm.is_edge_collision(a.x, a.y, b.x, b.y):
+                    expected.add((i, j))
+        self.assertEqual(edges, expected)
+
+    def test_incremental_mode_rejects_csr(self):
+        with self.assertRaises(ValueError):
+            PRMAlgorithm(map=self.map, incremental=True, use_csr=True)
+
+    def test_run_until_solves(self):
+        outcome = self.prm.run_until(max_time=10)
+        self.assertTrue(outcome.solved)
+        self.assertEqual(outcome.iterations, 3)
+        self.assertTrue(self.prm.is_complete())
+
+    def test_benchmark_records_every_phase(self):
+        self.prm.run_until(max_time=10)
+        result = self.benchmark_manager.get_last_result()
+        self.assertEqual(set(result.phase_times), {"sampling", "connection", "search", "reconstruction"})
+        self.assertGreater(result.phase_times["connection"], 0)
+        self.assertGreaterEqual(result.total_time, sum(result.phase_times.values()))
+        self.assertGreater(result.total_time, result.execution_time)
+        self.assertIsNone(result.peak_memory)
+
+    def test_run_until_reports_exhausted_roadmap(self):
+        self.map.add_obstacle(80, 80, 20, 5)
+        self.map.add_obstacle(80, 80, 5, 20)
+        for prm in (PRMAlgorithm(map=self.map, num_samples_excluding_grid=50),
+                    PRMAlgorithm(map=self.map, incremental=True, batch_size=50, max_samples=120)):
+            outcome = prm.run_until(max_time=10)
+            self.assertEqual(outcome.status, "exhausted")
+            self.assertFalse(prm.is_complete())
+
+    def test_k_nearest_strategy_bounds_degree(self):
+        prm = PRMAlgorithm(map=self.map, num_samples_excluding_grid=300, connection_strategy="k_nearest")
+        prm.step()
+        prm.step()
+        k = prm.connection_k(len(prm.nodes))
+        degrees = [len(node.edges) for node in prm.nodes]
+        # Every node picks k neighbours, edges are symmetric
+        self.assertLessEqual(sum(degrees) / len(degrees), 2 * k)
+        prm.step()
+        self.assertTrue(prm.is_complete())
+
+    def test_radius_star_strategy_shrinks_with_nodes(self):
+        prm = PRMAlgorithm(map=self.map, connection_strategy="radius_star")
+        self.assertGreater(prm.connection_radius(100), prm.connection_radius(10000))
+        prm.step()
+        prm.step()
+        prm.step()
+        self.assertTrue(prm.is_complete())
+
+    def test_radius_strategy_matches_linear_scan(self):
+        self.prm.step()
+        positions = [node.get_position() for node in self.prm.samples]
+        edges = {(i, j) for i, j, _ in self.prm.roadmap_edges(positions)}
+        expected = set()
+        for i in range(len(positions)):
+            for j in range(i + 1, len(positions)):
+                if self.prm.distance(positions[i], positions[j]) <= self.prm.neighbour_radius:
+                    expected.add((i, j))
+        self.assertEqual(edges, expected)
+
+    def test_unknown_connection_strategy(self):
+        with self.assertRaises(ValueError):
+            PRMAlgorithm(map=self.map, connection_strategy="everything")
+
 if __name__ == "__main__":
     unittest.main()
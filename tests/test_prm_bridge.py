@@ -0,0 +1,60 @@
+import unittest
+from core.map import Map
+from benchmarks.benchmark_manager import BenchmarkManager
+from algorithms.algorithms_implementations.prm_bridge import BridgePRMAlgorithm
+from maps.maps_manager import MapsManager
+
+class TestBridgePRMAlgorithm(unittest.TestCase):
+    def setUp(self):
+        map_config = MapsManager().get_map("Narrow Passage")
+        self.map = Map(map_config.width, map_config.height)
+        for obs in map_config.obstacles:
+            self.map.add_obstacle(*obs)
+        self.map.set_start(*map_config.default_start)
+        self.map.set_goal(*map_config.default_goal)
+        self.benchmark_manager = BenchmarkManager()
+        self.prm = BridgePRMAlgorithm(
+            map=self.map,
+            benchmark_manager=self.benchmark_manager,
+            num_samples_excluding_grid=100
+        )
+        self.prm.set_seed(0)
+        self.prm.step_size = 5
+        self.prm.neighbour_radius = 15
+
+    def test_bridge_samples_are_free(self):
+        self.prm.generate_points_on_the_map()
+        self.assertEqual(len(self.prm.samples), 100)
+        # Bridges are rare, uniform samples fill whatever the bridge test did not find
+        self.assertGreater(self.prm.sampling_stats["bridge_accepted"], 0)
+        self.assertEqual(self.prm.sampling_stats["bridge_accepted"] + self.prm.sampling_stats["uniform_accepted"], 100)
+        for node in self.prm.samples:
+            self.assertFalse(self.prm.is_collision(node.x, node.y))
+
+    def test_bridge_samples_are_in_the_passage(self):
+        self.prm.bridge_ratio = 1.0
+        self.prm.generate_points_on_the_map()
+        bridges = self.prm.samples[:self.prm.sampling_stats["bridge_accepted"]]
+        # Passage is 0.05% of the map, bridges land there or right next to the walls
+        in_passage = [node for node in bridges if 45 <= node.x <= 50 and 49.5 <= node.y <= 50.5]
+        self.assertGreater(len(in_passage), len(bridges) / 2)
+
+    def test_map_border_is_not_a_bridge_wall(self):
+        self.prm.bridge_ratio = 1.0
+        self.prm.generate_points_on_the_map()
+        bridges = self.prm.samples[:self.prm.sampling_stats["bridge_accepted"]]
+        self.assertGreater(len(bridges), 0)
+        # Points beyond the border are no obstacle, so the corners where the walls meet the border are no gap
+        along_border = [node for node in bridges if min(node.x, node.y, 100 - node.x, 100 - node.y) < 2 * self.prm.bridge_spread]
+        self.assertEqual(along_border, [])
+
+    def test_small_roadmap_connects_narrow_passage(self):
+        self.prm.step()
+        self.prm.step()
+        self.prm.step()
+        self.assertTrue(self.prm.is_complete())
+        self.assertEqual(self.prm.shortest_path[0], self.prm.start_node)
+        self.assertEqual(self.prm.shortest_path[-1], self.prm.goal_node)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,6 +2,7 @@ import unittest
 from core.map import Map
 from benchmarks.benchmark_manager import BenchmarkManager
 from algorithms.algorithms_implementations.prm_hybrid import HybridPRMAlgorithm
+from algorithms.algorithms_implementations.prm import MAX_DRAWS_PER_SAMPLE
 
 import math
 
@@ -58,5 +59,35 @@ class TestHybridPRMAlgorithm(unittest.TestCase):
         self.assertEqual(self.prm.steps, 2)
         self.assertEqual(len(self.prm.start_node.edges) > 0, True)
 
+    def test_k_nearest_strategy(self):
+        prm = HybridPRMAlgorithm(map=self.map, num_samples_excluding_grid=200, connection_strategy="k_nearest")
+        prm.step()
+        prm.step()
+        prm.step()
+        self.assertTrue(prm.is_complete())
+
+    def test_gaussian_sampling_accounting(self):
+        self.map.add_obstacle(30, 30, 40, 40)
+        prm = HybridPRMAlgorithm(map=self.map, num_samples_excluding_grid=200)
+        prm.generate_points_on_the_map()
+        self.assertEqual(len(prm.samples), 200)
+        self.assertEqual(prm.sampling_stats["gaussian_accepted"], 150)
+        self.assertEqual(prm.sampling_stats["uniform_accepted"], 50)
+        self.assertGreater(prm.sampling_stats["gaussian_rejected"], 0)
+        self.assertFalse(prm.sampling_stats["draw_limit_reached"])
+        for node in prm.samples:
+            self.assertFalse(prm.is_collision(node.x, node.y))
+
+    def test_draw_limit_on_a_blocked_map(self):
+        self.map.add_obstacle(0, 0, 100, 100)
+        prm = HybridPRMAlgorithm(map=self.map, num_samples_excluding_grid=4)
+        with self.assertLogs("motion_planner", "WARNING"):
+            prm.generate_points_on_the_map()
+        self.assertEqual(prm.samples, [])
+        self.assertTrue(prm.sampling_stats["draw_limit_reached"])
+        # Every pair and every uniform point is one draw, each sampler stops exactly at its limit
+        self.assertEqual(prm.sampling_stats["gaussian_rejected"], 4 * MAX_DRAWS_PER_SAMPLE)
+        self.assertEqual(prm.sampling_stats["uniform_rejected"], 4 * MAX_DRAWS_PER_SAMPLE)
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,61 @@
+import os
+import unittest
+from collections import Counter
+from test_runner.test_runner import TestRunner
+from test_runner.profiling import SamplingProfiler, collapsed_stacks, create_profiler, hotspots, read_collapsed, write_collapsed
+from tests.working_directory import TemporaryWorkingDirectoryTestCase
+
+def busy_loop(seconds):
+    import time
+    end = time.perf_counter() + seconds
+    total = 0
+    while time.perf_counter() < end:
+        total += 1
+    return total
+
+class TestProfiling(TemporaryWorkingDirectoryTestCase):
+    def test_hotspots_use_own_time(self):
+        stacks = Counter({"main;plan;collide": 600000, "main;plan": 300000, "main;draw;collide": 100000})
+        top = hotspots(stacks, 2)
+        self.assertEqual([frame for frame, _, _ in top], ["collide", "plan"])
+        self.assertAlmostEqual(top[0][1], 0.7)
+        self.assertAlmostEqual(top[0][2], 0.7)
+
+    def test_collapsed_round_trip(self):
+        stacks = Counter({"a (x.py:1);b (y.py:2)": 5, "a (x.py:1)": 3})
+        write_collapsed(stacks, "stacks.collapsed")
+        self.assertEqual(read_collapsed("stacks.collapsed"), stacks)
+
+    def test_profilers_see_the_busy_function(self):
+        for kind in ("cprofile", "sampling"):
+            profiler = create_profiler(kind)
+            profiler.enable()
+            busy_loop(0.1)
+            profiler.disable()
+            stacks = collapsed_stacks(profiler)
+            self.assertTrue(any("busy_loop" in stack for stack in stacks), kind)
+        # Sampled stacks start where the profiler was enabled
+        self.assertTrue(all(stack.startswith("test_profilers_see_the_busy_function") for stack in profiler.stacks))
+
+    def test_unknown_profiler(self):
+        with self.assertRaises(ValueError):
+            TestRunner(["RRT"], ["Rooms"], 1, "results.csv", profile="perf")
+
+    def test_runner_writes_profile_per_pair(self):
+        runner = TestRunner(["RRT", "RRT*"], ["Rooms"], 2, "results.csv", seed=3, profile="cprofile", profile_runs=1)
+        profile_paths = []
+        original_run_supervised = runner.run_supervised
+        runner.run_supervised = lambda *args: profile_paths.append(args[4]) or original_run_supervised(*args)
+        runner.run_tests()
+        # Profiled runs come on top of the recorded ones, which all ran without a profiler
+        with open(runner.output_file) as file:
+            self.assertEqual(len(file.readlines()), 1 + 4)
+        self.assertEqual(profile_paths[:4], [None] * 4)
+        self.assertEqual(len(profile_paths), 6)
+        self.assertTrue(all(profile_paths[4:]))
+        self.assertEqual(sorted(os.listdir(runner.profile_dir)),
+                         ["RRT__Rooms.collapsed", "RRT__Rooms.prof", "RRT___Rooms.collapsed", "RRT___Rooms.prof"])
+        self.assertTrue(read_collapsed(os.path.join(runner.profile_dir, "RRT__Rooms.collapsed")))
+
+if __name__ == "__main__":
+    unittest.main()
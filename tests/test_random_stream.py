@@ -0,0 +1,34 @@
+import unittest
+from core.random_stream import RandomStream, derive_seed
+
+class TestRandomStream(unittest.TestCase):
+    def test_same_seed_same_sequence(self):
+        first = RandomStream(seed=42, block_size=16)
+        second = RandomStream(seed=42, block_size=16)
+        # Crosses several block boundaries
+        self.assertEqual([first.random() for _ in range(100)], [second.random() for _ in range(100)])
+        self.assertEqual([first.normal() for _ in range(40)], [second.normal() for _ in range(40)])
+        self.assertEqual(first.uniform_array(0, 5, 10).tolist(), second.uniform_array(0, 5, 10).tolist())
+
+    def test_different_seeds_differ(self):
+        self.assertNotEqual(RandomStream(seed=1).random(), RandomStream(seed=2).random())
+
+    def test_ranges(self):
+        stream = RandomStream(seed=0)
+        for _ in range(1000):
+            self.assertTrue(0 <= stream.random() < 1)
+            self.assertTrue(-3 <= stream.uniform(-3, 7) < 7)
+        integers = stream.integers_array(5, 1000)
+        self.assertTrue(((integers >= 0) & (integers < 5)).all())
+
+    def test_derive_seed(self):
+        self.assertEqual(derive_seed(7, "RRT", "Maze Map", 3), derive_seed(7, "RRT", "Maze Map", 3))
+        seeds = {derive_seed(7, algorithm, map_name, run)
+                 for algorithm in ("RRT", "PRM")
+                 for map_name in ("Maze Map", "Rooms")
+                 for run in range(10)}
+        self.assertEqual(len(seeds), 40)
+        self.assertNotEqual(derive_seed(7, "RRT", "Maze Map", 0), derive_seed(8, "RRT", "Maze Map", 0))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import os
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+from core.algorithm import SOLVED
+from test_runner.test_runner import TestRunner, RESULT_COLUMNS
+from test_runner.results_store import ResultsStore, params_hash
+from tests.working_directory import TemporaryWorkingDirectoryTestCase
+
+def result_row(map_name="Rooms", status=SOLVED, path="[[0.0, 0.0], [3.0, 4.0]]"):
+    row = dict.fromkeys(RESULT_COLUMNS, "")
+    row.update({"Algorithm": "RRTAlgorithm", "Map": map_name, "Status": status, "start_node": (0.0, 0.0), "goal_node": (3.0, 4.0),
+                "step_size": 5, "seed": 7, "Path": path})
+    if status == SOLVED:
+        row.update({"Execution Time": "0.0100", "Path Length": "5.00", "Steps": 2, "Total Time": "0.0200"})
+    return row
+
+class TestResultsStore(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.store = ResultsStore(os.path.join(self.directory, "results.sqlite"))
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.directory)
+
+    def test_round_trip(self):
+        campaign_id = self.store.add_campaign(seed=1)
+        self.store.add_results(campaign_id, [(("RRT", "Rooms", 0, 7), {"step_size": 5}, result_row()),
+                                             (("RRT", "Rooms", 1, 8), {"step_size": 5}, result_row(status="timeout", path=""))])
+        solved, timed_out = self.store.query()
+        self.assertEqual(solved["Status"], SOLVED)
+        self.assertAlmostEqual(solved["Path Length"], 5.0)
+        self.assertEqual(solved["Steps"], 2)
+        self.assertEqual(solved["goal_node"], (3.0, 4.0))
+        np.testing.assert_array_equal(solved["Path"], [[0.0, 0.0], [3.0, 4.0]])
+        self.assertIsNone(timed_out["Execution Time"])
+        self.assertEqual(timed_out["Path"].shape, (0, 2))
+        self.assertEqual(timed_out["Run"], 1)
+
+    def test_query_filters(self):
+        first = self.store.add_campaign(seed=1)
+        second = self.store.add_campaign(seed=2)
+        self.store.add_results(first, [(("RRT", "Rooms", 0, 7), {"step_size": 5}, result_row()),
+                                       (("PRM", "Rooms", 0, 7), {"step_size": 5}, result_row())])
+        self.store.add_results(second, [(("RRT", "Maze", 0, 7), {"step_size": 3}, result_row("Maze")),
+                                        (("RRT", "Rooms", 0, 7), {"step_size": 3}, result_row(status="timeout"))])
+        self.assertEqual(len(self.store.query(algorithms=["RRT"])), 3)
+        self.assertEqual(len(self.store.query(algorithms=["RRT"], maps=["Rooms"])), 2)
+        self.assertEqual([row["Map"] for row in self.store.query(campaign_id="latest", status=SOLVED)], ["Maze"])
+        # The same parameters hash the same in every campaign, whatever the key order
+        self.assertEqual(params_hash({"a": 1, "b": None}), params_hash({"b": None, "a": 1}))
+        self.assertEqual(len(self.store.query(params_hash=params_hash({"step_size": 3}))), 2)
+
+class TestRunnerResultsStore(TemporaryWorkingDirectoryTestCase):
+    def test_runner_adds_campaigns(self):
+        for _ in range(2):
+            TestRunner(["RRT"], ["Rooms"], 2, "results.csv", seed=3, store_file="results.sqlite").run_tests()
+        with ResultsStore("results.sqlite") as store:
+            campaigns = store.campaigns()
+            first = store.query(campaign_id=campaigns[0]["id"])
+            second = store.query(campaign_id=campaigns[1]["id"])
+        self.assertEqual(len(campaigns), 2)
+        self.assertEqual(campaigns[0]["code_version"], campaigns[1]["code_version"])
+        self.assertEqual(len(first), 2)
+        # Same seed, same parameters - the runs of both campaigns line up
+        self.assertEqual([row["seed"] for row in first], [row["seed"] for row in second])
+        self.assertEqual({row["Params Hash"] for row in first + second}, {first[0]["Params Hash"]})
+
+    def test_interrupted_campaign_keeps_checkpointed_rows(self):
+        runner = TestRunner(["RRT"], ["Rooms"], 4, "results.csv", seed=3, store_file="results.sqlite")
+        calls = []
+        original_run_supervised = runner.run_supervised
+        def interrupt_third_run(*args):
+            calls.append(args)
+            if len(calls) == 3:
+                raise KeyboardInterrupt
+            return original_run_supervised(*args)
+        runner.run_supervised = interrupt_third_run
+        with self.assertRaises(KeyboardInterrupt):
+            runner.run_tests()
+        with ResultsStore("results.sqlite") as store:
+            self.assertEqual(len(store.query()), 2)
+
+    def test_resume_adds_completed_rows_missing_from_store(self):
+        # Runs checkpointed without ever reaching the store
+        TestRunner(["RRT"], ["Rooms"], 2, "results.csv", seed=3).run_tests()
+        TestRunner(["RRT"], ["Rooms"], 3, "results.csv", resume=True, store_file="results.sqlite").run_tests()
+        with ResultsStore("results.sqlite") as store:
+            self.assertEqual(sorted(row["Run"] for row in store.query()), [0, 1, 2])
+            self.assertEqual(len(store.campaigns()), 1)
+
+if __name__ == '__main__':
+    unittest.main()
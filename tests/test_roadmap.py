@@ -0,0 +1,55 @@
+import unittest
+from core.node import GraphNode
+from core.roadmap import CSRRoadmap
+
+class TestCSRRoadmap(unittest.TestCase):
+    def setUp(self):
+        # 0 - 1 - 2
+        # |       |
+        # 3 ----- 4
+        self.positions = [(0, 0), (10, 0), (20, 0), (0, 10), (20, 10)]
+        self.edges = [(0, 1, 10), (1, 2, 10), (0, 3, 10), (3, 4, 20), (2, 4, 10)]
+        self.roadmap = CSRRoadmap.from_edges(self.positions, self.edges)
+
+    def test_structure(self):
+        self.assertEqual(self.roadmap.num_nodes, 5)
+        self.assertEqual(self.roadmap.num_edges, 5)
+        self.assertEqual(self.roadmap.degree(0), 2)
+        neighbours, weights = self.roadmap.neighbours(4)
+        self.assertEqual(sorted(neighbours.tolist()), [2, 3])
+        self.assertEqual(sorted(weights.tolist()), [10, 20])
+        self.assertEqual(sorted(self.roadmap.edges()), sorted(self.edges))
+
+    def test_from_graph_nodes(self):
+        nodes = [GraphNode(x, y) for x, y in self.positions]
+        for i, j, cost in self.edges:
+            nodes[i].add_edge(nodes[j], cost)
+        roadmap = CSRRoadmap.from_graph_nodes(nodes)
+        self.assertEqual(sorted(roadmap.edges()), sorted(self.edges))
+
+    def test_a_star(self):
+        # Start next to node 0, goal next to node 4
+        path = self.roadmap.a_star((-1, 0), (21, 10), [(0, 1)], [(4, 1)])
+        start, goal = self.roadmap.num_nodes, self.roadmap.num_nodes + 1
+        self.assertIn(path, ([start, 0, 1, 2, 4, goal], [start, 0, 3, 4, goal]))
+
+    def test_a_star_prefers_cheaper_route(self):
+        path = self.roadmap.a_star((0, 5), (20, 15), [(0, 5), (3, 5)], [(4, 5)])
+        self.assertEqual(path[1:-1], [3, 4])
+
+    def test_a_star_direct_link(self):
+        goal = self.roadmap.num_nodes + 1
+        path = self.roadmap.a_star((0, 5), (1, 5), [(0, 5), (goal, 1)], [])
+        self.assertEqual(path, [self.roadmap.num_nodes, goal])
+
+    def test_a_star_unreachable(self):
+        self.assertEqual(self.roadmap.a_star((0, 5), (50, 50), [(0, 5)], []), [])
+
+    def test_a_star_does_not_modify_roadmap(self):
+        indices_before = self.roadmap.indices.copy()
+        self.roadmap.a_star((-1, 0), (21, 10), [(0, 1)], [(4, 1)])
+        self.assertEqual(self.roadmap.indices.tolist(), indices_before.tolist())
+        self.assertEqual(len(self.roadmap.indptr), self.roadmap.num_nodes + 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -53,6 +53,45 @@ class TestRRT(unittest.TestCase):
         self.assertAlmostEqual(new_node.x, expected_x, places=1)
         self.assertAlmostEqual(new_node.y, expected_y, places=1)
 
+    def test_run_until(self):
+        outcome = self.rrt.run_until(max_iters=20000)
+        self.assertTrue(outcome.solved)
+        self.assertTrue(self.rrt.is_complete())
+        self.assertEqual(self.rrt.shortest_path[-1], self.rrt.goal_node)
+
+    def test_run_until_budgets(self):
+        self.map.add_obstacle(80, 80, 20, 5)
+        self.map.add_obstacle(80, 80, 5, 20)
+        outcome = self.rrt.run_until(max_iters=50)
+        self.assertEqual((outcome.status, outcome.iterations), ("exhausted", 50))
+
+        outcome = self.rrt.run_until(max_nodes=len(self.rrt.nodes) + 10)
+        self.assertEqual((outcome.status, outcome.nodes), ("exhausted", len(self.rrt.nodes)))
+
+        outcome = self.rrt.run_until(max_time=0.05)
+        self.assertEqual(outcome.status, "timeout")
+        self.assertGreaterEqual(outcome.elapsed, 0.05)
+
+    def test_free_space_sampling_mode(self):
+        self.map.add_obstacle(40, 0, 20, 80)
+        self.rrt.sampling_mode = "free_space"
+        for _ in range(100):
+            sample = self.rrt.get_random_sample()
+            self.assertFalse(self.rrt.is_collision(*sample))
+
+    def test_seeded_runs_are_reproducible(self):
+        paths = []
+        for _ in range(2):
+            rrt = RRTAlgorithm(self.map, benchmark_manager=BenchmarkManager())
+            rrt.set_seed(123)
+            for _ in range(5000):
+                rrt.step()
+                if rrt.is_complete():
+                    break
+            paths.append([node.get_position() for node in rrt.shortest_path])
+        self.assertGreater(len(paths[0]), 0)
+        self.assertEqual(paths[0], paths[1])
+
     def test_path_creation(self):
         """Test if a valid path is created after reaching goal."""
         for _ in range(5000):
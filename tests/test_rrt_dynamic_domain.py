@@ -0,0 +1,60 @@
+import unittest
+import math
+from core.map import Map
+from core.node import TreeNode
+from benchmarks.benchmark_manager import BenchmarkManager
+from algorithms.algorithms_implementations.rrt_dynamic_domain import DynamicDomainRRTAlgorithm
+
+class TestDynamicDomainRRT(unittest.TestCase):
+    def setUp(self):
+        self.map = Map(100, 100)
+        self.map.set_start(5, 5)
+        self.map.set_goal(95, 95)
+        self.rrt = DynamicDomainRRTAlgorithm(self.map, benchmark_manager=BenchmarkManager())
+        self.rrt.set_seed(0)
+
+    def test_clearance(self):
+        self.map.add_obstacle(20, 20, 10, 10)
+        self.assertAlmostEqual(self.rrt.clearance(5, 50), 5)
+        self.assertAlmostEqual(self.rrt.clearance(17, 25), 3)
+        self.assertAlmostEqual(self.rrt.clearance(33, 34), 5)
+        self.assertEqual(self.rrt.clearance(25, 25), 0)
+
+    def test_step_follows_clearance(self):
+        self.map.add_obstacle(20, 0, 5, 100)
+        near_wall = TreeNode(18, 50)
+        open_space = TreeNode(60, 50)
+        self.assertAlmostEqual(self.rrt.distance(near_wall.get_position(), self.rrt.extend_toward(near_wall, (0, 50)).get_position()),
+                               self.rrt.step_size)
+        self.assertAlmostEqual(self.rrt.distance(open_space.get_position(), self.rrt.extend_toward(open_space, (60, 0)).get_position()),
+                               self.rrt.max_step * self.rrt.step_size)
+
+    def test_domain_radius_shrinks_on_failures(self):
+        node = self.rrt.start_node
+        self.rrt.update_radius(node, success=True)
+        self.assertNotIn(node, self.rrt.node_radius)
+        self.rrt.update_radius(node, success=False)
+        radius = self.rrt.node_radius[node]
+        self.assertEqual(radius, self.rrt.domain_radius * self.rrt.step_size)
+        for _ in range(100):
+            self.rrt.update_radius(node, success=False)
+        self.assertEqual(self.rrt.node_radius[node], self.rrt.step_size)
+        self.rrt.update_radius(node, success=True)
+        self.assertGreater(self.rrt.node_radius[node], self.rrt.step_size)
+
+    def test_finds_valid_path(self):
+        self.map.add_obstacle(40, 0, 20, 80)
+        for _ in range(20000):
+            self.rrt.step()
+            if self.rrt.is_complete():
+                break
+        self.assertTrue(self.rrt.is_complete())
+        self.assertGreater(self.rrt.sampling_stats["domain_rejected"], 0)
+        for node in self.rrt.shortest_path[1:]:
+            parent = node.parent
+            self.assertFalse(self.rrt.is_collision(node.x, node.y))
+            self.assertFalse(self.rrt.is_edge_collision(parent.x, parent.y, node.x, node.y))
+        self.assertTrue(math.isfinite(self.rrt.calculate_shortest_path_cost()))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import unittest
+from collections import Counter
+import numpy as np
+from core.map import Map
+from core.sampling import FreeSpaceSampler, LowDiscrepancySequence
+from core.random_stream import RandomStream
+from maps.maps_manager import MapsManager
+
+class TestFreeSpaceSampler(unittest.TestCase):
+    def setUp(self):
+        self.rng = RandomStream(seed=0)
+        map_config = MapsManager().get_map("Dense Obstacles")
+        self.map = Map(map_config.width, map_config.height)
+        for obs in map_config.obstacles:
+            self.map.add_obstacle(*obs)
+
+    def is_collision(self, x, y):
+        if x < 0 or x > self.map.width or y < 0 or y > self.map.height:
+            return True
+        return any(ox <= x <= ox + w and oy <= y <= oy + h for ox, oy, w, h in self.map.obstacles)
+
+    def test_alias_table_preserves_weights(self):
+        weights = [1, 2, 3, 4, 10]
+        probability, alias = FreeSpaceSampler.build_alias_table(weights)
+        # Probability of each column = own share + shares aliased to it
+        recovered = [0.0] * len(weights)
+        for i, (p, a) in enumerate(zip(probability, alias)):
+            recovered[i] += p / len(weights)
+            recovered[a] += (1 - p) / len(weights)
+        for got, weight in zip(recovered, weights):
+            self.assertAlmostEqual(got, weight / sum(weights))
+
+    def test_samples_are_collision_free(self):
+        sampler = FreeSpaceSampler(self.map.free_cells())
+        for _ in range(2000):
+            self.assertFalse(self.is_collision(*sampler.sample(self.rng)))
+        xs, ys = sampler.sample_batch(2000, self.rng)
+        for x, y in zip(xs.tolist(), ys.tolist()):
+            self.assertFalse(self.is_collision(x, y))
+
+    def test_samples_are_uniform_over_free_space(self):
+        # Two free halves of different size, split by a wall
+        map_instance = Map(100, 100)
+        map_instance.add_obstacle(20, 0, 10, 100)
+        sampler = FreeSpaceSampler(map_instance.free_cells())
+        xs, _ = sampler.sample_batch(20000, self.rng)
+        left_share = float(np.mean(xs < 20))
+        self.assertAlmostEqual(left_share, 20 / 90, delta=0.02)
+
+        counts = Counter(sampler.sample(self.rng)[0] < 20 for _ in range(20000))
+        self.assertAlmostEqual(counts[True] / 20000, 20 / 90, delta=0.02)
+
+    def test_no_free_space(self):
+        map_instance = Map(10, 10)
+        map_instance.add_obstacle(0, 0, 10, 10)
+        with self.assertRaises(ValueError):
+            FreeSpaceSampler(map_instance.free_cells())
+
+class TestLowDiscrepancySequence(unittest.TestCase):
+    def test_halton_points(self):
+        sequence = LowDiscrepancySequence("halton", shift=False)
+        us, vs = sequence.next_points(4)
+        np.testing.assert_allclose(us, [1 / 2, 1 / 4, 3 / 4, 1 / 8])
+        np.testing.assert_allclose(vs, [1 / 3, 2 / 3, 1 / 9, 4 / 9])
+
+    def test_sobol_points(self):
+        sequence = LowDiscrepancySequence("sobol", shift=False)
+        us, vs = sequence.next_points(8)
+        np.testing.assert_allclose(us, [0, 0.5, 0.75, 0.25, 0.375, 0.875, 0.625, 0.125])
+        np.testing.assert_allclose(vs, [0, 0.5, 0.25, 0.75, 0.375, 0.875, 0.125, 0.625])
+
+    def test_sobol_fills_every_cell_of_a_grid(self):
+        # The first 64 Sobol points put exactly one point in each cell of an 8x8 grid
+        us, vs = LowDiscrepancySequence("sobol", shift=False).next_points(64)
+        cells = Counter(zip((us * 8).astype(int).tolist(), (vs * 8).astype(int).tolist()))
+        self.assertEqual(len(cells), 64)
+
+    def test_scalar_and_batch_continue_the_same_sequence(self):
+        batch = LowDiscrepancySequence("halton", RandomStream(seed=1))
+        scalar = LowDiscrepancySequence("halton", RandomStream(seed=1))
+        us, vs = batch.next_points(300)
+        for u, v in zip(us.tolist(), vs.tolist()):
+            self.assertEqual(scalar.next_point(), (u, v))
+
+    def test_mixed_calls_are_a_prefix_of_the_sequence(self):
+        for kind in ("halton", "sobol"):
+            mixed = LowDiscrepancySequence(kind, RandomStream(seed=3))
+            points = [mixed.next_point() for _ in range(3)]
+            for count in (10, 300):
+                us, vs = mixed.next_points(count)
+                points.extend(zip(us.tolist(), vs.tolist()))
+            points.append(mixed.next_point())
+            us, vs = LowDiscrepancySequence(kind, RandomStream(seed=3)).next_points(len(points))
+            self.assertEqual(points, list(zip(us.tolist(), vs.tolist())))
+
+    def test_shift_stays_in_unit_square(self):
+        for kind in ("halton", "sobol"):
+            us, vs = LowDiscrepancySequence(kind, RandomStream(seed=2)).next_points(1000)
+            self.assertTrue(((us >= 0) & (us < 1) & (vs >= 0) & (vs < 1)).all())
+
+    def test_unknown_sequence(self):
+        with self.assertRaises(ValueError):
+            LowDiscrepancySequence("uniform")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+import math
+import random
+from core.spatial_index import GridIndex
+
+class TestGridIndex(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(0)
+        self.points = [(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(500)]
+        self.index = GridIndex(cell_size=7)
+        for i, (x, y) in enumerate(self.points):
+            self.index.insert(i, x, y)
+
+    def test_query_radius_matches_linear_scan(self):
+        for x, y, radius in [(50, 50, 10), (0, 0, 15), (99, 1, 3.5), (200, 200, 5)]:
+            found = {i for _, i in self.index.query_radius(x, y, radius)}
+            expected = {i for i, (px, py) in enumerate(self.points) if math.hypot(px - x, py - y) <= radius}
+            self.assertEqual(found, expected)
+
+    def test_k_nearest_matches_linear_scan(self):
+        for x, y, k in [(50, 50, 1), (10, 90, 12), (-30, 50, 5), (75, 25, 40)]:
+            found = self.index.k_nearest(x, y, k)
+            expected = sorted(math.hypot(px - x, py - y) for px, py in self.points)[:k]
+            self.assertEqual(len(found), k)
+            for (dist, _), expected_dist in zip(found, expected):
+                self.assertAlmostEqual(dist, expected_dist)
+
+    def test_k_larger_than_size(self):
+        index = GridIndex(cell_size=1)
+        index.insert("a", 0, 0)
+        index.insert("b", 5, 5)
+        self.assertEqual([item for _, item in index.k_nearest(1, 1, 10)], ["a", "b"])
+
+    def test_empty_index(self):
+        index = GridIndex(cell_size=1)
+        self.assertEqual(index.query_radius(0, 0, 10), [])
+        self.assertEqual(index.k_nearest(0, 0, 3), [])
+
+if __name__ == "__main__":
+    unittest.main()
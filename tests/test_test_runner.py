@@ -0,0 +1,125 @@
+import csv
+import os
+import unittest
+from test_runner.test_runner import TestRunner, RESULT_COLUMNS
+from test_runner.columnar_results import read_columnar, columnar_extension
+from tests.working_directory import TemporaryWorkingDirectoryTestCase
+
+class TestTestRunner(TemporaryWorkingDirectoryTestCase):
+    def read_rows(self, runner):
+        with open(runner.output_file, newline='') as file:
+            return list(csv.DictReader(file))
+
+    def test_supervised_run(self):
+        runner = TestRunner(["RRT"], ["Rooms"], 1, "results.csv", seed=1)
+        row = runner.run_supervised("RRT", "Rooms", 7)
+        self.assertEqual(len(row), len(RESULT_COLUMNS))
+        self.assertEqual(row[:3], ["RRTAlgorithm", "Rooms", "solved"])
+        self.assertEqual(row[RESULT_COLUMNS.index("seed")], 7)
+
+    def test_unknown_algorithm_is_an_error(self):
+        runner = TestRunner(["RRT"], ["Rooms"], 1, "results.csv", seed=1)
+        row = runner.run_supervised("NoSuchAlgo", "Rooms", 5)
+        self.assertEqual(row[1:3], ["Rooms", "error"])
+
+    def test_unknown_connection_strategy(self):
+        with self.assertRaises(ValueError):
+            TestRunner(["PRM"], ["Rooms"], 1, "results.csv", connection_strategy="k-nearest")
+        with self.assertRaises(ValueError):
+            TestRunner(["PRM"], ["Rooms"], 1, "results.csv", sampling_mode="random")
+
+    def test_long_step_is_killed_and_recorded(self):
+        # One PRM step with this many samples takes far longer than the timeout
+        runner = TestRunner(["PRM"], ["Rooms"], 1, "results.csv", num_samples_excluding_grid=10 ** 6, seed=1, timeout=0.5)
+        row = runner.run_supervised("PRM", "Rooms", 3)
+        self.assertEqual(row[:3], ["PRMAlgorithm", "Rooms", "timeout"])
+        self.assertEqual(row[RESULT_COLUMNS.index("Path")], "")
+
+    def test_parallel_long_steps_are_killed(self):
+        runner = TestRunner(["PRM"], ["Rooms"], 3, "results.csv", num_samples_excluding_grid=10 ** 6, seed=1, timeout=0.5, workers=2)
+        runner.run_tests()
+        self.assertEqual([row["Status"] for row in self.read_rows(runner)], ["timeout"] * 3)
+
+    def test_parallel_results_match_serial(self):
+        rows = {}
+        for workers in (1, 2):
+            runner = TestRunner(["RRT", "RRT-Connect"], ["Rooms", "Simple Map V1"], 2, "results.csv", seed=5, workers=workers)
+            runner.run_tests()
+            # Everything but the measured times comes from the seed
+            rows[workers] = sorted(tuple(value for key, value in row.items() if not key.endswith("Time"))
+                                   for row in self.read_rows(runner))
+        self.assertEqual(len(rows[1]), 8)
+        self.assertEqual(rows[1], rows[2])
+
+    def test_resume_skips_finished_runs(self):
+        runner = TestRunner(["RRT"], ["Rooms"], 2, "results.csv", seed=5)
+        runner.run_tests()
+        first_rows = self.read_rows(runner)
+
+        # Same campaign with more runs, the seed comes from the checkpoint
+        runner = TestRunner(["RRT"], ["Rooms"], 4, "results.csv", resume=True)
+        finished = []
+        original_run_supervised = runner.run_supervised
+        runner.run_supervised = lambda *args: finished.append(args[2]) or original_run_supervised(*args)
+        runner.run_tests()
+
+        self.assertEqual(runner.seed, 5)
+        self.assertEqual(len(finished), 2)
+        rows = self.read_rows(runner)
+        self.assertEqual(len(rows), 4)
+        self.assertEqual(rows[:2], first_rows)
+
+    def test_resume_drops_rows_missing_from_checkpoint(self):
+        runner = TestRunner(["RRT"], ["Rooms"], 2, "results.csv", seed=5)
+        runner.run_tests()
+        # Crash between writing a row and checkpointing it
+        with open(runner.output_file + ".checkpoint") as file:
+            lines = file.readlines()
+        with open(runner.output_file + ".checkpoint", "w") as file:
+            file.writelines(lines[:-1])
+
+        runner = TestRunner(["RRT"], ["Rooms"], 2, "results.csv", seed=5, resume=True)
+        runner.run_tests()
+        rows = self.read_rows(runner)
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(len({row["seed"] for row in rows}), 2)
+
+    def test_resume_with_other_seed(self):
+        TestRunner(["RRT"], ["Rooms"], 1, "results.csv", seed=5).run_tests()
+        with self.assertRaises(ValueError):
+            TestRunner(["RRT"], ["Rooms"], 1, "results.csv", seed=6, resume=True).run_tests()
+
+    def test_clearing_results_is_opt_in(self):
+        runner = TestRunner(["RRT"], ["Rooms"], 1, "results.csv", seed=5)
+        runner.run_tests()
+        TestRunner(["RRT"], ["Rooms"], 1, "other.csv")
+        self.assertTrue(os.path.exists(runner.output_file))
+        TestRunner(["RRT"], ["Rooms"], 1, "other.csv", clear_results=True)
+        self.assertFalse(os.path.exists(runner.output_file))
+
+    def test_resume_keeps_results(self):
+        TestRunner(["RRT"], ["Rooms"], 1, "results.csv", seed=5).run_tests()
+        with self.assertRaises(ValueError):
+            TestRunner(["RRT"], ["Rooms"], 1, "results.csv", resume=True, clear_results=True)
+        self.assertTrue(os.path.exists(os.path.join("test_runner/results", "results.csv")))
+
+    def test_phase_times_are_recorded(self):
+        runner = TestRunner(["PRM"], ["Rooms"], 1, "results.csv", seed=5, track_memory=True)
+        runner.run_tests()
+        row = self.read_rows(runner)[0]
+        self.assertEqual(row["Status"], "solved")
+        # PRM execution time only covers the query, the total includes roadmap construction
+        self.assertGreater(float(row["Total Time"]), float(row["Execution Time"]))
+        self.assertGreater(float(row["Connection Time"]), 0)
+        self.assertGreater(int(row["Peak Memory"]), 0)
+
+    def test_columnar_output(self):
+        runner = TestRunner(["RRT"], ["Rooms"], 2, "results.csv", seed=5, output_format="columnar")
+        runner.run_tests()
+        columns = read_columnar(os.path.splitext(runner.output_file)[0] + columnar_extension())
+        rows = self.read_rows(runner)
+        self.assertEqual(columns["seed"].tolist(), [int(row["seed"]) for row in rows])
+        self.assertEqual(len(columns["path_offsets"]), 3)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import os
+import unittest
+from core.map import Map
+from algorithms.algorithm_manager import AlgorithmManager
+from test_runner.tuning import SuccessiveHalvingTuner, tune_and_store
+from tests.working_directory import TemporaryWorkingDirectoryTestCase
+
+class TestTuning(TemporaryWorkingDirectoryTestCase):
+    def setUp(self):
+        super().setUp()
+        self.tuned_file = os.path.join(self.tmp_dir, "tuned.json")
+
+    def test_space_only_holds_parameters_of_the_algorithm(self):
+        self.assertEqual(set(SuccessiveHalvingTuner("RRT", "Rooms").search_space), {"step_size"})
+        self.assertEqual(set(SuccessiveHalvingTuner("RRT - Biased", "Rooms").search_space), {"step_size", "goal_bias"})
+        self.assertEqual(set(SuccessiveHalvingTuner("PRM", "Rooms").search_space),
+                         {"step_size", "radius_as_step_size_multiplication", "num_samples_excluding_grid"})
+        with self.assertRaises(ValueError):
+            SuccessiveHalvingTuner("RRT", "Rooms", search_space={"temperature": [1]})
+
+    def test_candidates_are_a_seeded_subset(self):
+        tuner = SuccessiveHalvingTuner("PRM", "Rooms", configurations=10)
+        self.assertEqual(len(tuner.candidates()), 10)
+        self.assertEqual(tuner.candidates(), SuccessiveHalvingTuner("PRM", "Rooms", configurations=10).candidates())
+
+    def test_halving_keeps_the_fastest(self):
+        # A tiny step makes RRT far slower on Rooms
+        tuner = SuccessiveHalvingTuner("RRT", "Rooms", search_space={"step_size": [0.2, 5.0]}, min_runs=2, eta=2, time_budget=2, workers=2)
+        self.assertEqual(tuner.tune(), {"step_size": 5.0})
+        self.assertEqual(len(tuner.scores[(("step_size", 5.0),)]), 4) # 2 runs in rung 0, 4 in rung 1
+        self.assertEqual(len(tuner.scores[(("step_size", 0.2),)]), 2)
+
+    def test_tuned_parameters_become_defaults(self):
+        tune_and_store(["RRT - Biased"], ["Rooms"], tuned_parameters_file=self.tuned_file,
+                       search_space={"step_size": [4.0], "goal_bias": [0.4]}, time_budget=2)
+        manager = AlgorithmManager(self.tuned_file)
+        map_instance = Map(100, 100, name="Rooms")
+        algorithm = manager.get_algorithm("RRT - Biased", map_instance, None)
+        self.assertEqual((algorithm.step_size, algorithm.goal_bias), (4.0, 0.4))
+
+        untuned = manager.get_algorithm("RRT - Biased", map_instance, None, use_tuned_parameters=False)
+        self.assertEqual(untuned.goal_bias, 0.3)
+        other_map = manager.get_algorithm("RRT - Biased", Map(100, 100, name="Maze Map"), None)
+        self.assertEqual(other_map.step_size, untuned.step_size)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import unittest
+from core.union_find import DisjointSet
+
+class TestDisjointSet(unittest.TestCase):
+    def test_add_and_find(self):
+        components = DisjointSet()
+        components.add("a")
+        components.add("a")
+        self.assertEqual(len(components), 1)
+        self.assertEqual(components.find("a"), "a")
+        self.assertIn("a", components)
+
+    def test_union(self):
+        components = DisjointSet()
+        for item in range(5):
+            components.add(item)
+        self.assertTrue(components.union(0, 1))
+        self.assertTrue(components.union(2, 3))
+        self.assertFalse(components.union(1, 0))
+        self.assertTrue(components.connected(0, 1))
+        self.assertFalse(components.connected(1, 2))
+        self.assertEqual(components.component_count(), 3)
+
+        components.union(1, 3)
+        self.assertTrue(components.connected(0, 2))
+        self.assertEqual(components.component_count(), 2)
+
+    def test_long_chain(self):
+        components = DisjointSet()
+        for item in range(1000):
+            components.add(item)
+        for item in range(999):
+            components.union(item, item + 1)
+        self.assertTrue(components.connected(0, 999))
+        self.assertEqual(components.component_count(), 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,18 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+class TemporaryWorkingDirectoryTestCase(unittest.TestCase):
+    """
+    Runs every test in a fresh temporary working directory.
+
+    TestRunner writes to test_runner/results/ relative to the working
+    directory, tests that run one must not write into the repository.
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(self.tmp_dir)